@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+HAPROXY_CSV_COLUMNS: tuple[str, ...] = (
+    "pxname", "svname", "qcur", "qmax", "scur", "smax", "slim", "stot", "bin", "bout",
+    "dreq", "dresp", "ereq", "econ", "eresp", "wretr", "wredis", "status", "weight",
+    "act", "bck", "chkfail", "chkdown", "lastchg", "downtime", "qlimit", "pid", "iid",
+    "sid", "throttle", "lbtot", "tracked", "type", "rate", "rate_lim", "rate_max",
+    "check_status", "check_code", "check_duration", "hrsp_1xx", "hrsp_2xx", "hrsp_3xx",
+    "hrsp_4xx", "hrsp_5xx", "hrsp_other", "hanafail", "req_rate", "req_rate_max",
+    "req_tot", "cli_abrt", "srv_abrt", "comp_in", "comp_out", "comp_byp", "comp_rsp",
+    "lastsess", "last_chk", "last_agt", "qtime", "ctime", "rtime", "ttime",
+    "agent_status", "agent_code", "agent_duration", "check_desc", "agent_desc",
+    "check_rise", "check_fall", "check_health", "agent_rise", "agent_fall",
+    "agent_health", "addr", "cookie", "mode", "algo", "conn_rate", "conn_rate_max",
+    "conn_tot", "intercepted", "dcon", "dses", "wrew", "connect", "reuse",
+    "cache_lookups", "cache_hits", "srv_icur", "src_ilim", "qtime_max", "ctime_max",
+    "rtime_max", "ttime_max", "eint", "idle_conn_cur", "safe_conn_cur",
+    "used_conn_cur", "need_conn_est", "uweight", "agg_server_status",
+    "agg_server_check_status", "agg_check_status",
+)
+
+TEXT_COLUMNS = frozenset(
+    {
+        "pxname", "svname", "status", "check_status", "check_desc", "agent_status",
+        "agent_desc", "addr", "cookie", "mode", "algo", "tracked",
+    }
+)
+
+OBJECT_TYPES = {"FRONTEND": ("F", 0), "BACKEND": ("B", 1)}
+
+
+@dataclass(frozen=True)
+class StatsShape:
+    frontends: int = 10
+    backends: int = 50
+    servers: int = 100
+    columns: int = len(HAPROXY_CSV_COLUMNS)
+    seed: int = 0
+
+    @property
+    def rows(self) -> int:
+        return self.frontends + self.backends + self.servers
+
+    def column_names(self) -> tuple[str, ...]:
+        if self.columns <= len(HAPROXY_CSV_COLUMNS):
+            return HAPROXY_CSV_COLUMNS[: max(self.columns, 18)]
+        extra = self.columns - len(HAPROXY_CSV_COLUMNS)
+        return HAPROXY_CSV_COLUMNS + tuple(f"extra_{index}" for index in range(extra))
+
+
+class StatsGenerator:
+    def __init__(self, shape: StatsShape) -> None:
+        self.shape = shape
+        self.columns = shape.column_names()
+        self._random = random.Random(shape.seed)
+        self._objects = list(self._build_objects())
+        self._counters = [
+            [self._random.randint(0, 10**6) for _ in self.columns] for _ in self._objects
+        ]
+
+    def _build_objects(self) -> Iterator[tuple[str, str, int, int]]:
+        shape = self.shape
+        for index in range(shape.frontends):
+            yield f"fe_{index}", "FRONTEND", index + 1, 0
+        backends = max(shape.backends, 1 if shape.servers else 0)
+        per_backend, remainder = divmod(shape.servers, backends) if backends else (0, 0)
+        for index in range(backends):
+            iid = shape.frontends + index + 1
+            pxname = f"be_{index}"
+            yield pxname, "BACKEND", iid, 0
+            for sid in range(per_backend + (1 if index < remainder else 0)):
+                yield pxname, f"srv_{index}_{sid}", iid, sid + 1
+
+    def advance(self, churn: float = 0.1) -> None:
+        rand = self._random
+        for counters in self._counters:
+            if rand.random() >= churn:
+                continue
+            for position in range(len(counters)):
+                counters[position] += rand.randint(0, 100)
+
+    def _value(self, row: int, column: str, position: int) -> str:
+        pxname, svname, iid, sid = self._objects[row]
+        if column == "pxname":
+            return pxname
+        if column == "svname":
+            return svname
+        if column == "status":
+            if svname == "FRONTEND":
+                return "OPEN"
+            return "DOWN" if self._counters[row][position] % 50 == 0 else "UP"
+        if column == "iid":
+            return str(iid)
+        if column == "sid":
+            return str(sid)
+        if column == "type":
+            return str(OBJECT_TYPES.get(svname, ("S", 2))[1])
+        if column in TEXT_COLUMNS:
+            return "L7OK" if column == "check_status" and sid else ""
+        return str(self._counters[row][position])
+
+    def rows(self) -> Iterator[list[str]]:
+        for row in range(len(self._objects)):
+            yield [
+                self._value(row, column, position)
+                for position, column in enumerate(self.columns)
+            ]
+
+    def csv(self) -> bytes:
+        lines = ["# " + ",".join(self.columns)]
+        lines.extend(",".join(fields) for fields in self.rows())
+        return ("\n".join(lines) + "\n").encode()
+
+    def typed(self) -> bytes:
+        lines: list[str] = []
+        for (_, svname, iid, sid), fields in zip(self._objects, self.rows()):
+            kind = OBJECT_TYPES.get(svname, ("S", 2))[0]
+            for position, (column, value) in enumerate(zip(self.columns, fields)):
+                field_type = "str" if column in TEXT_COLUMNS else "u64"
+                lines.append(
+                    f"{kind}.{iid}.{sid}.{position}.{column}.1:MGP:{field_type}:{value}"
+                )
+            lines.append("")
+        return "\n".join(lines).encode()
+
+
+def chunks(body: bytes, size: int) -> Iterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic HAProxy stats output")
+    parser.add_argument("--frontends", type=int, default=StatsShape.frontends)
+    parser.add_argument("--backends", type=int, default=StatsShape.backends)
+    parser.add_argument("--servers", type=int, default=StatsShape.servers)
+    parser.add_argument("--columns", type=int, default=StatsShape.columns)
+    parser.add_argument("--seed", type=int, default=StatsShape.seed)
+    parser.add_argument("--format", choices=("csv", "typed"), default="csv")
+    args = parser.parse_args(argv)
+
+    generator = StatsGenerator(
+        StatsShape(args.frontends, args.backends, args.servers, args.columns, args.seed)
+    )
+    body = generator.csv() if args.format == "csv" else generator.typed()
+    sys.stdout.buffer.write(body)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
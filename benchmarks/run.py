@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from homeassistant import config_entries  # noqa: E402
+from homeassistant.const import __version__ as HA_VERSION  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from benchmarks.generate import StatsGenerator, StatsShape, chunks  # noqa: E402
+from custom_components.haproxy_stats.binary_sensor import (  # noqa: E402
+    BINARY_SENSOR_DESCRIPTIONS,
+    HAProxyStatsBinarySensor,
+)
+from custom_components.haproxy_stats.const import (  # noqa: E402
+    CONF_PARSE_MODE,
+    CONF_PARSE_THRESHOLD,
+    CONF_URL,
+    DEFAULT_PARSE_MODE,
+    DEFAULT_PARSE_THRESHOLD,
+    DOMAIN,
+    PARSE_MODES,
+    STAT_COLUMNS,
+    STATS_CHUNK_SIZE,
+)
+from custom_components.haproxy_stats.coordinator import HAProxyStatsCoordinator  # noqa: E402
+from custom_components.haproxy_stats.parser import (  # noqa: E402
+    HAProxyCsvParser,
+    HAProxyTypedParser,
+)
+from custom_components.haproxy_stats.sensor import (  # noqa: E402
+    SENSOR_DESCRIPTIONS,
+    HAProxyStatsSensor,
+)
+from custom_components.haproxy_stats.snapshot import HAProxyStatsSnapshot  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+
+def _timings(samples: Sequence[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _measure(func: Callable[[], Any], rounds: int) -> dict[str, float]:
+    func()
+    samples = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {**_timings(samples), "peak_memory_bytes": peak}
+
+
+def _feed(parser: HAProxyCsvParser | HAProxyTypedParser, body: bytes) -> list[tuple[str, ...]]:
+    for chunk in chunks(body, STATS_CHUNK_SIZE):
+        parser.feed(chunk)
+    return parser.close()
+
+
+def bench_parse(generator: StatsGenerator, rounds: int) -> dict[str, Any]:
+    csv_body = generator.csv()
+    typed_body = generator.typed()
+    csv_parser = HAProxyCsvParser(STAT_COLUMNS)
+    typed_parser = HAProxyTypedParser(STAT_COLUMNS)
+    rows = _feed(csv_parser, csv_body)
+    previous = HAProxyStatsSnapshot.from_rows(STAT_COLUMNS, rows)
+
+    def build() -> None:
+        snapshot = HAProxyStatsSnapshot.from_rows(STAT_COLUMNS, rows, previous)
+        snapshot.derive_rates(previous)
+        snapshot.changes(previous)
+
+    return {
+        "csv": {"bytes": len(csv_body), **_measure(lambda: _feed(csv_parser, csv_body), rounds)},
+        "typed": {
+            "bytes": len(typed_body),
+            **_measure(lambda: _feed(typed_parser, typed_body), rounds),
+        },
+        "snapshot": _measure(build, rounds),
+    }
+
+
+class StubServer:
+    def __init__(self, bodies: list[bytes]) -> None:
+        self._bodies = bodies
+        self.requests = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        body = self._bodies[self.requests % len(self._bodies)]
+        self.requests += 1
+        return web.Response(body=body, content_type="text/csv")
+
+    async def __aenter__(self) -> StubServer:
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/stats;csv"
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def _config_entry(url: str, options: dict[str, Any] | None = None) -> config_entries.ConfigEntry:
+    return config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="HAProxy",
+        data={CONF_URL: url},
+        source=config_entries.SOURCE_USER,
+        options=options or {},
+    )
+
+
+class LoopLagProbe:
+    def __init__(self, interval: float = 0.001) -> None:
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self.max_lag = 0.0
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self._interval
+            await asyncio.sleep(self._interval)
+            self.max_lag = max(self.max_lag, time.perf_counter() - expected)
+
+    def __enter__(self) -> LoopLagProbe:
+        self.max_lag = 0.0
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+def _entity_state(entity: HAProxyStatsSensor | HAProxyStatsBinarySensor) -> tuple[Any, ...]:
+    if isinstance(entity, HAProxyStatsSensor):
+        return entity.available, entity.native_unit_of_measurement, entity.native_value
+    return entity.available, entity.extra_state_attributes, entity.is_on
+
+
+async def bench_coordinator(
+    generator: StatsGenerator,
+    rounds: int,
+    churn: float,
+    options: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    bodies = []
+    for _ in range(rounds + 2):
+        bodies.append(generator.csv())
+        generator.advance(churn)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            async with StubServer(bodies) as server:
+                entry = _config_entry(server.url, options)
+                coordinator = HAProxyStatsCoordinator(hass, entry, timedelta(hours=1))
+
+                start = time.perf_counter()
+                await coordinator.async_refresh()
+                first_refresh = time.perf_counter() - start
+                if not coordinator.last_update_success:
+                    raise RuntimeError(f"Stub refresh failed: {coordinator.last_exception}")
+
+                snapshot = coordinator.data
+                start = time.perf_counter()
+                entities: list[HAProxyStatsSensor | HAProxyStatsBinarySensor] = []
+                for row_index in snapshot.rows():
+                    svname = snapshot.svname[row_index].upper()
+                    for description in SENSOR_DESCRIPTIONS:
+                        entities.append(
+                            HAProxyStatsSensor(coordinator, entry, row_index, description)
+                        )
+                    for description in BINARY_SENSOR_DESCRIPTIONS:
+                        if description.only_svname and svname != description.only_svname:
+                            continue
+                        entities.append(
+                            HAProxyStatsBinarySensor(coordinator, entry, row_index, description)
+                        )
+                for entity in entities:
+                    _ = entity.device_info, _entity_state(entity)
+                entity_setup = time.perf_counter() - start
+
+                updates = 0
+
+                def make_listener(entity: Any) -> Callable[[], None]:
+                    def listener() -> None:
+                        nonlocal updates
+                        updates += 1
+                        _entity_state(entity)
+
+                    return listener
+
+                removers = [
+                    coordinator.async_add_listener(
+                        make_listener(entity), entity.coordinator_context
+                    )
+                    for entity in entities
+                ]
+
+                refreshes = []
+                lags = []
+                for _ in range(rounds):
+                    with LoopLagProbe() as probe:
+                        start = time.perf_counter()
+                        await coordinator.async_refresh()
+                        refreshes.append(time.perf_counter() - start)
+                        await asyncio.sleep(0.002)
+                    lags.append(probe.max_lag)
+                blocking = [timings["blocking"] for timings in coordinator.timings]
+
+                for remove in removers:
+                    remove()
+                await coordinator.async_shutdown()
+        finally:
+            await hass.async_stop(force=True)
+
+    return {
+        "rows": len(snapshot),
+        "entities": len(entities),
+        "first_refresh_ms": first_refresh * 1000,
+        "entity_setup_ms": entity_setup * 1000,
+        "refresh": {
+            **_timings(refreshes),
+            "state_updates_per_refresh": updates / max(rounds, 1),
+            "max_loop_lag_ms": max(lags) * 1000,
+            "median_loop_blocking_ms": statistics.median(blocking),
+        },
+        "requests": server.requests,
+    }
+
+
+def _compare(results: dict[str, Any], baseline: dict[str, Any]) -> dict[str, float]:
+    ratios: dict[str, float] = {}
+
+    def walk(new: Any, old: Any, path: str) -> None:
+        if isinstance(new, dict) and isinstance(old, dict):
+            for key, value in new.items():
+                if key in old:
+                    walk(value, old[key], f"{path}.{key}" if path else key)
+        elif (
+            isinstance(new, (int, float))
+            and isinstance(old, (int, float))
+            and old
+            and path.endswith(("_ms", "_bytes"))
+        ):
+            ratios[path] = new / old
+
+    walk(results, baseline.get("results", {}), "")
+    return ratios
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the HAProxy Stats integration")
+    parser.add_argument("--frontends", type=int, default=10)
+    parser.add_argument("--backends", type=int, default=250)
+    parser.add_argument("--servers", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=StatsShape.columns)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--churn", type=float, default=0.1)
+    parser.add_argument("--parse-mode", choices=PARSE_MODES, default=DEFAULT_PARSE_MODE)
+    parser.add_argument("--parse-threshold", type=int, default=DEFAULT_PARSE_THRESHOLD)
+    parser.add_argument("--skip-coordinator", action="store_true")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    shape = StatsShape(args.frontends, args.backends, args.servers, args.columns, args.seed)
+    results: dict[str, Any] = {"parse": bench_parse(StatsGenerator(shape), args.rounds)}
+    if not args.skip_coordinator:
+        results["coordinator"] = asyncio.run(
+            bench_coordinator(
+                StatsGenerator(shape),
+                args.rounds,
+                args.churn,
+                {
+                    CONF_PARSE_MODE: args.parse_mode,
+                    CONF_PARSE_THRESHOLD: args.parse_threshold,
+                },
+            )
+        )
+
+    report: dict[str, Any] = {
+        "schema": SCHEMA_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "homeassistant": HA_VERSION,
+        },
+        "shape": {
+            "frontends": shape.frontends,
+            "backends": shape.backends,
+            "servers": shape.servers,
+            "columns": len(shape.column_names()),
+            "rows": shape.rows,
+            "rounds": args.rounds,
+            "churn": args.churn,
+            "parse_mode": args.parse_mode,
+            "parse_threshold_kib": args.parse_threshold,
+        },
+        "results": results,
+    }
+    if args.baseline is not None:
+        report["baseline_ratio"] = _compare(
+            results, json.loads(args.baseline.read_text(encoding="utf-8"))
+        )
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is not None:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
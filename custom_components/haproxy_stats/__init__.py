@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import time
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
-
-from .const import DOMAIN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-from .coordinator import HAProxyStatsCoordinator
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    DOMAIN,
+    CONF_INFO_INTERVAL,
+    CONF_LAZY_SERVERS,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_LAZY_SERVERS,
+    DEFAULT_SCAN_INTERVAL,
+)
+from .coordinator import HAProxyInfoCoordinator, HAProxyStatsCoordinator, snapshot_store
+from .services import async_setup_services
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
     return True
 
 
@@ -31,16 +43,63 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=int(scan_interval)),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    started = time.perf_counter()
+    restored = await coordinator.async_restore()
+    if not restored:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await coordinator.async_shutdown()
+            raise
+
+    info_coordinator = HAProxyInfoCoordinator(
+        hass=hass,
+        entry=entry,
+        stats=coordinator,
+        update_interval=timedelta(
+            seconds=int(entry.options.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL))
+        ),
+    )
+    refreshed = time.perf_counter()
+    if not restored:
+        await info_coordinator.async_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "info_coordinator": info_coordinator,
         "entities_known": set(),
     }
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
-
+    if entry.options.get(CONF_LAZY_SERVERS, DEFAULT_LAZY_SERVERS):
+        entry.async_on_unload(
+            hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, coordinator.async_handle_registry_update
+            )
+        )
+
+    platforms_started = time.perf_counter()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    finished = time.perf_counter()
+    await coordinator.async_start_syslog()
+
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {entry.entry_id} refresh"
+        )
+        entry.async_create_background_task(
+            hass, info_coordinator.async_refresh(), f"{DOMAIN} {entry.entry_id} info refresh"
+        )
+
+    coordinator.startup.update(
+        {
+            "restored": restored,
+            "first_refresh_ms": (refreshed - started) * 1000,
+            "info_refresh_ms": (platforms_started - refreshed) * 1000,
+            "platforms_ms": (finished - platforms_started) * 1000,
+            "total_ms": (finished - started) * 1000,
+        }
+    )
     return True
 
 
@@ -48,8 +107,15 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await snapshot_store(hass, entry).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-    return unload_ok
+        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if data is not None:
+            await data["info_coordinator"].async_shutdown()
+            await data["coordinator"].async_shutdown()
+    return unload_ok
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+
+from .const import ANOMALY_ALPHA, ANOMALY_MIN_DEVIATION, ANOMALY_MIN_DROP_BASELINE, ANOMALY_WARMUP
+from .snapshot import MISSING, HAProxyStatsSnapshot
+
+
+def _column_values(
+    snapshot: HAProxyStatsSnapshot, column: str
+) -> tuple[Sequence[float] | None, float]:
+    values = snapshot.values.get(column)
+    if values is not None:
+        return values, MISSING
+    return snapshot.derived.get(column), math.nan
+
+
+class AnomalyDetector:
+    def __init__(
+        self,
+        spike_columns: Iterable[str],
+        drop_columns: Iterable[str],
+        threshold: float,
+        drop_percent: float,
+        alpha: float = ANOMALY_ALPHA,
+        warmup: int = ANOMALY_WARMUP,
+    ) -> None:
+        self.spike_columns = tuple(spike_columns)
+        self.drop_columns = tuple(drop_columns) if drop_percent > 0 else ()
+        self.threshold = float(threshold)
+        self.drop_ratio = 1 - float(drop_percent) / 100
+        self.alpha = float(alpha)
+        self.warmup = max(int(warmup), 1)
+        self.anomalies: dict[int, dict[str, dict[str, float]]] = {}
+        self.detected = 0
+        self._rows = 0
+        self._mean = {column: array("d") for column in self.spike_columns}
+        self._variance = {column: array("d") for column in self.spike_columns}
+        self._count = {column: array("l") for column in self.spike_columns}
+        self._last = {column: array("d") for column in self.drop_columns}
+
+    @property
+    def memory(self) -> int:
+        arrays = (
+            *self._mean.values(),
+            *self._variance.values(),
+            *self._count.values(),
+            *self._last.values(),
+        )
+        return sum(values.itemsize * len(values) for values in arrays)
+
+    def _grow(self, rows: int) -> None:
+        added = rows - self._rows
+        if added <= 0:
+            return
+        for column in self.spike_columns:
+            self._mean[column].extend(array("d", [0.0]) * added)
+            self._variance[column].extend(array("d", [0.0]) * added)
+            self._count[column].extend(array("l", [0]) * added)
+        for column in self.drop_columns:
+            self._last[column].extend(array("d", [math.nan]) * added)
+        self._rows = rows
+
+    def release(self, indices: Iterable[int]) -> None:
+        for index in indices:
+            if index >= self._rows:
+                continue
+            for column in self.spike_columns:
+                self._mean[column][index] = 0.0
+                self._variance[column][index] = 0.0
+                self._count[column][index] = 0
+            for column in self.drop_columns:
+                self._last[column][index] = math.nan
+
+    def update(self, snapshot: HAProxyStatsSnapshot) -> tuple[set[int], set[int]]:
+        rows = len(snapshot.keys)
+        self._grow(rows)
+        present = snapshot.present
+        alpha = self.alpha
+        threshold = self.threshold
+        warmup = self.warmup
+        found: dict[int, dict[str, dict[str, float]]] = {}
+
+        for column in self.spike_columns:
+            values, missing = _column_values(snapshot, column)
+            if values is None:
+                continue
+            mean = self._mean[column]
+            variance = self._variance[column]
+            count = self._count[column]
+            for index in range(rows):
+                value = values[index]
+                if not present[index] or value == missing or value != value:
+                    continue
+                samples = count[index]
+                if samples == 0:
+                    mean[index] = value
+                    count[index] = 1
+                    continue
+                baseline = mean[index]
+                difference = value - baseline
+                if samples >= warmup:
+                    deviation = max(math.sqrt(variance[index]), ANOMALY_MIN_DEVIATION)
+                    score = difference / deviation
+                    if score >= threshold:
+                        found.setdefault(index, {})[column] = {
+                            "value": value,
+                            "baseline": baseline,
+                            "deviation": deviation,
+                            "score": score,
+                        }
+                increment = alpha * difference
+                mean[index] = baseline + increment
+                variance[index] = (1 - alpha) * (variance[index] + difference * increment)
+                count[index] = samples + 1
+
+        ratio = self.drop_ratio
+        for column in self.drop_columns:
+            values, missing = _column_values(snapshot, column)
+            if values is None:
+                continue
+            last = self._last[column]
+            for index in range(rows):
+                value = values[index]
+                if not present[index] or value == missing or value != value:
+                    last[index] = math.nan
+                    continue
+                previous = last[index]
+                last[index] = value
+                if previous >= ANOMALY_MIN_DROP_BASELINE and value <= previous * ratio:
+                    found.setdefault(index, {})[column] = {
+                        "value": value,
+                        "baseline": previous,
+                        "change": (value - previous) * 100 / previous,
+                    }
+
+        previous_anomalies = self.anomalies
+        self.anomalies = found
+        started = found.keys() - previous_anomalies.keys()
+        self.detected += len(started)
+        return started, previous_anomalies.keys() - found.keys()
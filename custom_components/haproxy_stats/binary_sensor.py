@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from homeassistant.components.binary_sensor import (
@@ -8,12 +10,18 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import ANOMALY_DROP_COLUMNS, ANOMALY_SPIKE_COLUMNS, CONF_METRICS, DOMAIN
 from .coordinator import HAProxyStatsCoordinator
-from .entity import HAProxyStatsEntity
+from .entity import (
+    HAProxyStatsEntity,
+    async_add_entities_batched,
+    async_remove_row_entities,
+    row_unique_id,
+)
 
 UP_STATUSES = {
     "UP",
@@ -56,6 +64,13 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[HAProxyBinarySensorEntityDescription, ...] = (
     ),
 )
 
+ANOMALY_BINARY_SENSOR_DESCRIPTION = HAProxyBinarySensorEntityDescription(
+    key="anomaly",
+    translation_key="anomaly",
+    name="Anomaly",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -65,41 +80,85 @@ async def async_setup_entry(
     coordinator: HAProxyStatsCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     entities_known: set[str] = hass.data[DOMAIN][entry.entry_id]["entities_known"]
 
-    entities: list[HAProxyStatsBinarySensor] = []
-
-    for row_key in coordinator.data:
-        row = coordinator.data[row_key]
-        svname = (row.get("svname") or "").upper()
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            if description.only_svname and svname != description.only_svname:
-                continue
-            unique_id = f"{entry.entry_id}_{row_key}_{description.key}"
-            if unique_id in entities_known:
-                continue
-            entities.append(HAProxyStatsBinarySensor(coordinator, entry, row_key, description))
-            entities_known.add(unique_id)
-
-    async_add_entities(entities)
+    metrics = set(entry.options.get(CONF_METRICS, ()))
+    descriptions = [
+        description
+        for description in BINARY_SENSOR_DESCRIPTIONS
+        if not metrics or description.key in metrics
+    ]
+    if coordinator.anomaly_detector is not None and (
+        not metrics or ANOMALY_BINARY_SENSOR_DESCRIPTION.key in metrics
+    ):
+        descriptions.append(ANOMALY_BINARY_SENSOR_DESCRIPTION)
+
+    def row_entities(rows: Iterable[int]) -> list[BinarySensorEntity]:
+        entities: list[BinarySensorEntity] = []
+        for row_index in rows:
+            row_key = coordinator.data.keys[row_index]
+            svname = coordinator.data.svname[row_index].upper()
+            for description in descriptions:
+                if description.only_svname and svname != description.only_svname:
+                    continue
+                unique_id = row_unique_id(entry, row_key, description.key)
+                if unique_id in entities_known:
+                    continue
+                if description is ANOMALY_BINARY_SENSOR_DESCRIPTION:
+                    entity_class = HAProxyAnomalyBinarySensor
+                else:
+                    entity_class = HAProxyStatsBinarySensor
+                entities.append(entity_class(coordinator, entry, row_index, description))
+                entities_known.add(unique_id)
+        return entities
+
+    @callback
+    def async_rows_changed(added: set[int], removed: set[int]) -> None:
+        async_remove_row_entities(
+            hass,
+            Platform.BINARY_SENSOR,
+            entry,
+            (coordinator.data.keys[row_index] for row_index in removed),
+            (
+                description.key
+                for description in (
+                    *BINARY_SENSOR_DESCRIPTIONS,
+                    ANOMALY_BINARY_SENSOR_DESCRIPTION,
+                )
+            ),
+            entities_known,
+        )
+        entities = row_entities(sorted(added))
+        if entities:
+            async_add_entities(entities)
+
+    started = time.perf_counter()
+    entities = row_entities(coordinator.data.rows())
+    coordinator.startup[Platform.BINARY_SENSOR] = {
+        "entities": len(entities),
+        "build_ms": (time.perf_counter() - started) * 1000,
+    }
+    entry.async_on_unload(coordinator.async_add_row_listener(async_rows_changed))
+    await async_add_entities_batched(async_add_entities, entities)
 
 
 class HAProxyStatsBinarySensor(HAProxyStatsEntity, BinarySensorEntity):
+    _context_column = "status"
+
     def __init__(
         self,
         coordinator: HAProxyStatsCoordinator,
         entry: ConfigEntry,
-        row_key: str,
+        row_index: int,
         description: HAProxyBinarySensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator, entry, row_key, description)
-        self._attr_unique_id = f"{entry.entry_id}_{row_key}_{description.key}"
+        super().__init__(coordinator, entry, row_index, description)
+        self._attr_unique_id = row_unique_id(entry, self._row_key, description.key)
 
     @property
     def is_on(self) -> bool | None:
-        row = self._row
-        if row is None:
+        if not self._present:
             return None
 
-        status = (row.get("status") or "").upper()
+        status = self.coordinator.data.status[self._row_index].upper()
         if not status:
             return None
 
@@ -119,12 +178,37 @@ class HAProxyStatsBinarySensor(HAProxyStatsEntity, BinarySensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
-        row = self._row
-        if row is None:
+        if not self._present:
             return None
 
-        status = row.get("status")
+        status = self.coordinator.data.status[self._row_index]
         if not status:
             return None
 
-        return {"status": status}
+        return {"status": status}
+
+
+class HAProxyAnomalyBinarySensor(HAProxyStatsEntity, BinarySensorEntity):
+    _unrecorded_attributes = frozenset((*ANOMALY_SPIKE_COLUMNS, *ANOMALY_DROP_COLUMNS))
+
+    def __init__(
+        self,
+        coordinator: HAProxyStatsCoordinator,
+        entry: ConfigEntry,
+        row_index: int,
+        description: HAProxyBinarySensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry, row_index, description)
+        self._attr_unique_id = row_unique_id(entry, self._row_key, description.key)
+
+    @property
+    def is_on(self) -> bool | None:
+        if not self._present:
+            return None
+        return self._row_index in self.coordinator.anomaly_detector.anomalies
+
+    @property
+    def extra_state_attributes(self) -> dict[str, dict[str, float]] | None:
+        if not self._present:
+            return None
+        return self.coordinator.anomaly_detector.anomalies.get(self._row_index)
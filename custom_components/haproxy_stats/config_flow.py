@@ -6,6 +6,7 @@ from aiohttp import BasicAuth
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
@@ -17,29 +18,114 @@ from .const import (
     CONF_PASSWORD,
     CONF_VERIFY_SSL,
     CONF_SCAN_INTERVAL,
+    CONF_SOCKET,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RATE_SMOOTHING,
+    CONF_RATE_THRESHOLD,
+    CONF_TRACKED_PROXIES,
+    CONF_TRANSPORT,
+    CONF_EXCLUDE_PROXIES,
+    CONF_EXCLUDE_SERVERS,
+    CONF_INCLUDE_SERVERS,
+    CONF_LAZY_SERVERS,
+    CONF_METRICS,
+    CONF_ROW_TYPES,
+    CONF_PARSE_MODE,
+    CONF_PARSE_THRESHOLD,
+    CONF_THROTTLE_WRITES,
+    CONF_COUNTER_WRITE_INTERVAL,
+    CONF_COUNTER_MIN_CHANGE,
+    CONF_COUNTER_MIN_RELATIVE_CHANGE,
+    CONF_RATE_WRITE_INTERVAL,
+    CONF_RATE_MIN_CHANGE,
+    CONF_RATE_MIN_RELATIVE_CHANGE,
+    CONF_LATENCY_WRITE_INTERVAL,
+    CONF_LATENCY_MIN_CHANGE,
+    CONF_LATENCY_MIN_RELATIVE_CHANGE,
+    CONF_INFO_INTERVAL,
+    CONF_SKIP_MAINT_SERVERS,
+    CONF_LATENCY_PERCENTILES,
+    CONF_LATENCY_WINDOW,
+    CONF_HISTORY,
+    CONF_HISTORY_SAMPLES,
+    CONF_HISTORY_MEMORY,
+    CONF_ANOMALY_DETECTION,
+    CONF_ANOMALY_THRESHOLD,
+    CONF_ANOMALY_DROP,
+    CONF_SYSLOG_LISTENER,
+    CONF_SYSLOG_PORT,
+    CONF_SYSLOG_SOURCES,
     DEFAULT_NAME,
     DEFAULT_URL,
     DEFAULT_DATA_SIZE_UNIT,
     DEFAULT_VERIFY_SSL,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SOCKET,
+    DEFAULT_TRANSPORT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RATE_SMOOTHING,
+    DEFAULT_RATE_THRESHOLD,
+    DEFAULT_LAZY_SERVERS,
+    DEFAULT_PARSE_MODE,
+    DEFAULT_PARSE_THRESHOLD,
+    DEFAULT_THROTTLE_WRITES,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_SKIP_MAINT_SERVERS,
+    DEFAULT_LATENCY_PERCENTILES,
+    DEFAULT_LATENCY_WINDOW,
+    DEFAULT_HISTORY,
+    DEFAULT_HISTORY_SAMPLES,
+    DEFAULT_HISTORY_MEMORY,
+    DEFAULT_ANOMALY_DETECTION,
+    DEFAULT_ANOMALY_THRESHOLD,
+    DEFAULT_ANOMALY_DROP,
+    DEFAULT_SYSLOG_LISTENER,
+    DEFAULT_SYSLOG_PORT,
+    DEFAULT_SYSLOG_SOURCES,
+    PARSE_MODES,
+    ROW_TYPES,
     DATA_SIZE_UNITS,
+    STAT_COLUMNS,
+    TRANSPORT_PROMETHEUS,
+    TRANSPORT_SOCKET,
+    TRANSPORTS,
+    WRITE_GROUP_COUNTER,
+    WRITE_GROUP_LATENCY,
+    WRITE_GROUP_RATE,
 )
+from .binary_sensor import ANOMALY_BINARY_SENSOR_DESCRIPTION, BINARY_SENSOR_DESCRIPTIONS
+from .sensor import LATENCY_PERCENTILE_DESCRIPTIONS, SENSOR_DESCRIPTIONS, write_thresholds
+from .transport import HAProxySocketTransport, split_endpoints
 
 
 class CannotConnect(Exception):
     pass
 
 
-async def _async_validate_input(hass: HomeAssistant, data: dict) -> None:
-    url = data[CONF_URL]
-    username = data.get(CONF_USERNAME)
-    password = data.get(CONF_PASSWORD)
-    verify_ssl = data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+async def _async_validate_socket(address: str) -> None:
+    transport = HAProxySocketTransport(address, STAT_COLUMNS)
+    try:
+        async with async_timeout.timeout(10):
+            info = await transport.async_command("show info")
+        if "Name:" not in info:
+            raise CannotConnect
+    except Exception as err:
+        raise CannotConnect from err
+    finally:
+        await transport.async_close()
 
-    auth = None
-    if username or password:
-        auth = BasicAuth(username or "", password or "")
 
+async def _async_validate_url(
+    hass: HomeAssistant,
+    url: str,
+    auth: BasicAuth | None,
+    verify_ssl: bool,
+    marker: str = "pxname",
+) -> None:
     session = async_get_clientsession(hass)
 
     try:
@@ -49,12 +135,39 @@ async def _async_validate_input(hass: HomeAssistant, data: dict) -> None:
                 if response.status != 200:
                     raise CannotConnect
                 text = await response.text()
-                if "pxname" not in text:
+                if marker not in text:
                     raise CannotConnect
     except Exception as err:
         raise CannotConnect from err
 
 
+async def _async_validate_input(hass: HomeAssistant, data: dict) -> None:
+    if data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT) == TRANSPORT_SOCKET:
+        addresses = split_endpoints(data.get(CONF_SOCKET, DEFAULT_SOCKET))
+        if not addresses:
+            raise CannotConnect
+        for address in addresses:
+            await _async_validate_socket(address)
+        return
+
+    urls = split_endpoints(data[CONF_URL])
+
+    username = data.get(CONF_USERNAME)
+    password = data.get(CONF_PASSWORD)
+    verify_ssl = data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+
+    auth = None
+    if username or password:
+        auth = BasicAuth(username or "", password or "")
+
+    marker = "pxname"
+    if data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT) == TRANSPORT_PROMETHEUS:
+        marker = "haproxy_"
+
+    for url in urls:
+        await _async_validate_url(hass, url, auth, verify_ssl, marker)
+
+
 class HAProxyStatsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
@@ -62,18 +175,25 @@ class HAProxyStatsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            try:
-                await _async_validate_input(self.hass, user_input)
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
+            transport = user_input.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+            urls = split_endpoints(user_input.get(CONF_URL, ""))
+            if transport != TRANSPORT_SOCKET and not urls:
+                errors[CONF_URL] = "url_required"
             else:
-                title = user_input.get(CONF_NAME) or DEFAULT_NAME
-                return self.async_create_entry(title=title, data=user_input)
+                try:
+                    await _async_validate_input(self.hass, user_input)
+                except CannotConnect:
+                    errors["base"] = "cannot_connect"
+                else:
+                    title = user_input.get(CONF_NAME) or DEFAULT_NAME
+                    return self.async_create_entry(title=title, data=user_input)
 
         schema = vol.Schema(
             {
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
-                vol.Required(CONF_URL, default=DEFAULT_URL): str,
+                vol.Optional(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): vol.In(TRANSPORTS),
+                vol.Optional(CONF_URL, description={"suggested_value": DEFAULT_URL}): str,
+                vol.Optional(CONF_SOCKET, default=DEFAULT_SOCKET): str,
                 vol.Optional(CONF_USERNAME): str,
                 vol.Optional(CONF_PASSWORD): str,
                 vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
@@ -110,6 +230,16 @@ class HAProxyStatsOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        tracked_proxies = list(self.entry.options.get(CONF_TRACKED_PROXIES, []))
+        known_proxies = set(tracked_proxies)
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id)
+        if entry_data is not None:
+            known_proxies.update(entry_data["coordinator"].data.pxname)
+
+        counter = write_thresholds(self.entry.options, WRITE_GROUP_COUNTER)
+        rate = write_thresholds(self.entry.options, WRITE_GROUP_RATE)
+        latency = write_thresholds(self.entry.options, WRITE_GROUP_LATENCY)
+
         schema = vol.Schema(
             {
                 vol.Optional(
@@ -133,10 +263,216 @@ class HAProxyStatsOptionsFlow(config_entries.OptionsFlow):
                         self.entry.data.get(CONF_DATA_SIZE_UNIT, DEFAULT_DATA_SIZE_UNIT),
                     ),
                 ): vol.In(DATA_SIZE_UNITS),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=self.entry.options.get(
+                        CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Optional(
+                    CONF_RATE_THRESHOLD,
+                    default=self.entry.options.get(
+                        CONF_RATE_THRESHOLD, DEFAULT_RATE_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_RATE_SMOOTHING,
+                    default=self.entry.options.get(
+                        CONF_RATE_SMOOTHING, DEFAULT_RATE_SMOOTHING
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=0.95)),
+                vol.Optional(
+                    CONF_TRACKED_PROXIES,
+                    default=tracked_proxies,
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=sorted(known_proxies),
+                        multiple=True,
+                        custom_value=True,
+                    )
+                ),
+                vol.Optional(
+                    CONF_EXCLUDE_PROXIES,
+                    default=self.entry.options.get(CONF_EXCLUDE_PROXIES, ""),
+                ): str,
+                vol.Optional(
+                    CONF_INCLUDE_SERVERS,
+                    default=self.entry.options.get(CONF_INCLUDE_SERVERS, ""),
+                ): str,
+                vol.Optional(
+                    CONF_EXCLUDE_SERVERS,
+                    default=self.entry.options.get(CONF_EXCLUDE_SERVERS, ""),
+                ): str,
+                vol.Optional(
+                    CONF_ROW_TYPES,
+                    default=list(self.entry.options.get(CONF_ROW_TYPES, ROW_TYPES)),
+                ): vol.All(
+                    selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=list(ROW_TYPES),
+                            multiple=True,
+                            translation_key=CONF_ROW_TYPES,
+                        )
+                    ),
+                    vol.Length(min=1),
+                ),
+                vol.Optional(
+                    CONF_METRICS,
+                    default=list(self.entry.options.get(CONF_METRICS, [])),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            description.key
+                            for description in (
+                                *SENSOR_DESCRIPTIONS,
+                                *LATENCY_PERCENTILE_DESCRIPTIONS,
+                                *BINARY_SENSOR_DESCRIPTIONS,
+                                ANOMALY_BINARY_SENSOR_DESCRIPTION,
+                            )
+                        ],
+                        multiple=True,
+                    )
+                ),
+                vol.Optional(
+                    CONF_PARSE_MODE,
+                    default=self.entry.options.get(CONF_PARSE_MODE, DEFAULT_PARSE_MODE),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=list(PARSE_MODES),
+                        translation_key=CONF_PARSE_MODE,
+                    )
+                ),
+                vol.Optional(
+                    CONF_PARSE_THRESHOLD,
+                    default=self.entry.options.get(
+                        CONF_PARSE_THRESHOLD, DEFAULT_PARSE_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_THROTTLE_WRITES,
+                    default=self.entry.options.get(
+                        CONF_THROTTLE_WRITES, DEFAULT_THROTTLE_WRITES
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_COUNTER_WRITE_INTERVAL, default=counter[0]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=86400)),
+                vol.Optional(
+                    CONF_COUNTER_MIN_CHANGE, default=counter[1]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_COUNTER_MIN_RELATIVE_CHANGE, default=counter[2]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_RATE_WRITE_INTERVAL, default=rate[0]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=86400)),
+                vol.Optional(
+                    CONF_RATE_MIN_CHANGE, default=rate[1]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_RATE_MIN_RELATIVE_CHANGE, default=rate[2]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_LATENCY_WRITE_INTERVAL, default=latency[0]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=86400)),
+                vol.Optional(
+                    CONF_LATENCY_MIN_CHANGE, default=latency[1]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_LATENCY_MIN_RELATIVE_CHANGE, default=latency[2]
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_INFO_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Optional(
+                    CONF_LATENCY_PERCENTILES,
+                    default=self.entry.options.get(
+                        CONF_LATENCY_PERCENTILES, DEFAULT_LATENCY_PERCENTILES
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_LATENCY_WINDOW,
+                    default=self.entry.options.get(
+                        CONF_LATENCY_WINDOW, DEFAULT_LATENCY_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=1440)),
+                vol.Optional(
+                    CONF_HISTORY,
+                    default=self.entry.options.get(CONF_HISTORY, DEFAULT_HISTORY),
+                ): bool,
+                vol.Optional(
+                    CONF_HISTORY_SAMPLES,
+                    default=self.entry.options.get(
+                        CONF_HISTORY_SAMPLES, DEFAULT_HISTORY_SAMPLES
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=10000)),
+                vol.Optional(
+                    CONF_HISTORY_MEMORY,
+                    default=self.entry.options.get(
+                        CONF_HISTORY_MEMORY, DEFAULT_HISTORY_MEMORY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=4096)),
+                vol.Optional(
+                    CONF_ANOMALY_DETECTION,
+                    default=self.entry.options.get(
+                        CONF_ANOMALY_DETECTION, DEFAULT_ANOMALY_DETECTION
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_ANOMALY_THRESHOLD,
+                    default=self.entry.options.get(
+                        CONF_ANOMALY_THRESHOLD, DEFAULT_ANOMALY_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_ANOMALY_DROP,
+                    default=self.entry.options.get(CONF_ANOMALY_DROP, DEFAULT_ANOMALY_DROP),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_SYSLOG_LISTENER,
+                    default=self.entry.options.get(
+                        CONF_SYSLOG_LISTENER, DEFAULT_SYSLOG_LISTENER
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_SYSLOG_PORT,
+                    default=self.entry.options.get(CONF_SYSLOG_PORT, DEFAULT_SYSLOG_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+                vol.Optional(
+                    CONF_SYSLOG_SOURCES,
+                    default=self.entry.options.get(CONF_SYSLOG_SOURCES, DEFAULT_SYSLOG_SOURCES),
+                ): str,
+                vol.Optional(
+                    CONF_SKIP_MAINT_SERVERS,
+                    default=self.entry.options.get(
+                        CONF_SKIP_MAINT_SERVERS, DEFAULT_SKIP_MAINT_SERVERS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_LAZY_SERVERS,
+                    default=self.entry.options.get(
+                        CONF_LAZY_SERVERS, DEFAULT_LAZY_SERVERS
+                    ),
+                ): bool,
             }
         )
 
         return self.async_show_form(
             step_id="init",
             data_schema=schema,
-        )
+        )
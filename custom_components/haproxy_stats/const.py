@@ -7,12 +7,98 @@ CONF_PASSWORD = "password"
 CONF_VERIFY_SSL = "verify_ssl"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_DATA_SIZE_UNIT = "data_size_unit"
+CONF_TRANSPORT = "transport"
+CONF_SOCKET = "socket"
+CONF_TRACKED_PROXIES = "tracked_proxies"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_RATE_THRESHOLD = "rate_threshold"
+CONF_RATE_SMOOTHING = "rate_smoothing"
+CONF_EXCLUDE_PROXIES = "exclude_proxies"
+CONF_INCLUDE_SERVERS = "include_servers"
+CONF_EXCLUDE_SERVERS = "exclude_servers"
+CONF_ROW_TYPES = "row_types"
+CONF_METRICS = "metrics"
+CONF_LAZY_SERVERS = "lazy_servers"
+CONF_PARSE_MODE = "parse_mode"
+CONF_PARSE_THRESHOLD = "parse_threshold"
+CONF_THROTTLE_WRITES = "throttle_writes"
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
+CONF_COUNTER_WRITE_INTERVAL = "counter_write_interval"
+CONF_COUNTER_MIN_CHANGE = "counter_min_change"
+CONF_COUNTER_MIN_RELATIVE_CHANGE = "counter_min_relative_change"
+CONF_RATE_WRITE_INTERVAL = "rate_write_interval"
+CONF_RATE_MIN_CHANGE = "rate_min_change"
+CONF_RATE_MIN_RELATIVE_CHANGE = "rate_min_relative_change"
+CONF_LATENCY_WRITE_INTERVAL = "latency_write_interval"
+CONF_LATENCY_MIN_CHANGE = "latency_min_change"
+CONF_LATENCY_MIN_RELATIVE_CHANGE = "latency_min_relative_change"
+CONF_INFO_INTERVAL = "info_interval"
+CONF_SKIP_MAINT_SERVERS = "skip_maint_servers"
+CONF_LATENCY_PERCENTILES = "latency_percentiles"
+CONF_LATENCY_WINDOW = "latency_window"
+CONF_HISTORY = "history"
+CONF_HISTORY_SAMPLES = "history_samples"
+CONF_HISTORY_MEMORY = "history_memory"
+CONF_ANOMALY_DETECTION = "anomaly_detection"
+CONF_ANOMALY_THRESHOLD = "anomaly_threshold"
+CONF_ANOMALY_DROP = "anomaly_drop"
+CONF_SYSLOG_LISTENER = "syslog_listener"
+CONF_SYSLOG_PORT = "syslog_port"
+CONF_SYSLOG_SOURCES = "syslog_sources"
 
 DEFAULT_NAME = "HAProxy"
 DEFAULT_VERIFY_SSL = False
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_URL = "http://192.168.1.1:8822/haproxy?stats;csv"
 DEFAULT_DATA_SIZE_UNIT = "MB"
+DEFAULT_SOCKET = "/var/run/haproxy.sock"
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MIN_SCAN_INTERVAL = 5
+DEFAULT_MAX_SCAN_INTERVAL = 300
+DEFAULT_RATE_THRESHOLD = 0
+DEFAULT_RATE_SMOOTHING = 0.0
+DEFAULT_LAZY_SERVERS = False
+DEFAULT_PARSE_THRESHOLD = 1024
+DEFAULT_THROTTLE_WRITES = False
+DEFAULT_MIN_WRITE_INTERVAL = 0
+DEFAULT_INFO_INTERVAL = 60
+DEFAULT_SKIP_MAINT_SERVERS = False
+DEFAULT_LATENCY_PERCENTILES = False
+DEFAULT_LATENCY_WINDOW = 60
+DEFAULT_HISTORY = False
+DEFAULT_HISTORY_SAMPLES = 120
+DEFAULT_HISTORY_MEMORY = 32
+DEFAULT_ANOMALY_DETECTION = False
+DEFAULT_ANOMALY_THRESHOLD = 5.0
+DEFAULT_ANOMALY_DROP = 80
+DEFAULT_SYSLOG_LISTENER = False
+DEFAULT_SYSLOG_PORT = 5140
+DEFAULT_SYSLOG_SOURCES = ""
+
+TRANSPORT_HTTP = "http"
+TRANSPORT_SOCKET = "socket"
+TRANSPORT_PROMETHEUS = "prometheus"
+TRANSPORTS: tuple[str, ...] = (TRANSPORT_HTTP, TRANSPORT_SOCKET, TRANSPORT_PROMETHEUS)
+DEFAULT_TRANSPORT = TRANSPORT_HTTP
+
+PARSE_MODE_INLINE = "inline"
+PARSE_MODE_EXECUTOR = "executor"
+PARSE_MODE_PROCESS = "process"
+PARSE_MODES: tuple[str, ...] = (PARSE_MODE_INLINE, PARSE_MODE_EXECUTOR, PARSE_MODE_PROCESS)
+DEFAULT_PARSE_MODE = PARSE_MODE_EXECUTOR
+
+ROW_TYPE_FRONTEND = "frontend"
+ROW_TYPE_BACKEND = "backend"
+ROW_TYPE_SERVER = "server"
+ROW_TYPES: tuple[str, ...] = (ROW_TYPE_FRONTEND, ROW_TYPE_BACKEND, ROW_TYPE_SERVER)
+
+STAT_OBJECT_TYPES: dict[str, int] = {
+    ROW_TYPE_FRONTEND: 1,
+    ROW_TYPE_BACKEND: 2,
+    ROW_TYPE_SERVER: 4,
+}
 
 DATA_SIZE_UNITS: tuple[str, ...] = ("B", "kB", "MB", "GB", "TB")
 
@@ -23,3 +109,173 @@ DATA_SIZE_UNIT_FACTORS: dict[str, float] = {
     "GB": 1_000_000_000.0,
     "TB": 1_000_000_000_000.0,
 }
+
+STATS_CHUNK_SIZE = 64 * 1024
+ENDPOINT_TIMEOUT = 10
+MAX_CONCURRENT_FETCHES = 4
+ROW_REMOVAL_POLLS = 3
+ROW_REMOVAL_GRACE = 300
+RUNTIME_BATCH_MAX_LENGTH = 8192
+SYSLOG_BIND_HOST = "0.0.0.0"
+SYSLOG_MAX_MESSAGE_SIZE = 64 * 1024
+RUNTIME_SERVER_STATES: tuple[str, ...] = ("ready", "drain", "maint")
+RUNTIME_PATCH_COLUMNS: tuple[str, ...] = ("weight",)
+HTTP_POOL_SIZE = 2
+ENTITY_ADD_BATCH_SIZE = 500
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+HTTP_KEEPALIVE_MARGIN = 15
+HTTP_KEEPALIVE_MAX = 45
+ADAPTIVE_BACKOFF_FACTOR = 1.5
+ADAPTIVE_HISTORY_SIZE = 20
+TIMING_HISTORY_SIZE = 60
+WRITE_GROUP_COUNTER = "counter"
+WRITE_GROUP_RATE = "rate"
+WRITE_GROUP_LATENCY = "latency"
+WRITE_GROUP_OPTIONS: dict[str, tuple[str, str, str]] = {
+    WRITE_GROUP_COUNTER: (
+        CONF_COUNTER_WRITE_INTERVAL,
+        CONF_COUNTER_MIN_CHANGE,
+        CONF_COUNTER_MIN_RELATIVE_CHANGE,
+    ),
+    WRITE_GROUP_RATE: (
+        CONF_RATE_WRITE_INTERVAL,
+        CONF_RATE_MIN_CHANGE,
+        CONF_RATE_MIN_RELATIVE_CHANGE,
+    ),
+    WRITE_GROUP_LATENCY: (
+        CONF_LATENCY_WRITE_INTERVAL,
+        CONF_LATENCY_MIN_CHANGE,
+        CONF_LATENCY_MIN_RELATIVE_CHANGE,
+    ),
+}
+WRITE_GROUP_DEFAULTS: dict[str, tuple[float, float, float]] = {
+    WRITE_GROUP_COUNTER: (300.0, 0.0, 0.0),
+    WRITE_GROUP_RATE: (30.0, 0.0, 10.0),
+    WRITE_GROUP_LATENCY: (30.0, 5.0, 10.0),
+}
+THROTTLE_MAX_STALENESS = 900.0
+
+FETCH_TIMING_PHASES: tuple[str, ...] = (
+    "dns",
+    "connect",
+    "ttfb",
+    "body",
+    "decode",
+    "parse",
+    "offload",
+    "blocking",
+)
+TIMING_PHASES: tuple[str, ...] = (
+    *FETCH_TIMING_PHASES,
+    "fetch",
+    "build",
+    "diff",
+    "dispatch",
+    "total",
+)
+
+NUMERIC_STAT_COLUMNS: tuple[str, ...] = (
+    "scur",
+    "smax",
+    "stot",
+    "bin",
+    "bout",
+    "rate",
+    "ereq",
+    "eresp",
+    "econ",
+    "wretr",
+    "wredis",
+    "qcur",
+    "weight",
+    "bck",
+    "qmax",
+    "qtime",
+    "ctime",
+    "rtime",
+    "ttime",
+    "hrsp_5xx",
+    "check_duration",
+    "lastchg",
+)
+
+ERROR_STAT_COLUMNS: tuple[str, ...] = ("ereq", "eresp", "econ")
+LATENCY_STAT_COLUMNS: tuple[str, ...] = ("qtime", "ctime", "rtime", "ttime")
+LATENCY_PERCENTILES: tuple[int, ...] = (50, 95, 99)
+HISTORY_COLUMNS: tuple[str, ...] = (
+    "scur",
+    "rate",
+    "qcur",
+    "rtime",
+    "stot_rate",
+    "bin_rate",
+    "bout_rate",
+    "errors_rate",
+)
+HISTORY_STATISTICS: tuple[str, ...] = ("min", "max", "avg", "p50", "p95", "p99", "count")
+HISTORY_ATTRIBUTE_STATISTICS: tuple[str, ...] = ("min", "max", "avg")
+ANOMALY_SPIKE_COLUMNS: tuple[str, ...] = ("errors_rate", "qcur", "rtime", "ttime")
+ANOMALY_DROP_COLUMNS: tuple[str, ...] = ("scur", "rate")
+ANOMALY_ALPHA = 0.1
+ANOMALY_WARMUP = 10
+ANOMALY_MIN_DEVIATION = 1.0
+ANOMALY_MIN_DROP_BASELINE = 10
+EVENT_ANOMALY = "haproxy_stats_anomaly"
+
+DERIVED_RATE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "stot_rate": ("stot",),
+    "bin_rate": ("bin",),
+    "bout_rate": ("bout",),
+    "errors_rate": ERROR_STAT_COLUMNS,
+}
+
+BACKEND_AGGREGATE_COLUMNS: tuple[str, ...] = (
+    "servers_up",
+    "servers_down",
+    "servers_maint",
+    "servers_drain",
+    "servers_active",
+    "servers_backup",
+    "capacity",
+    "queue_total",
+)
+
+STAT_COLUMNS: tuple[str, ...] = ("pxname", "svname", "status", *NUMERIC_STAT_COLUMNS)
+
+PROMETHEUS_COLUMNS: dict[str, str] = {
+    "status": "status",
+    "current_sessions": "scur",
+    "max_sessions": "smax",
+    "sessions_total": "stot",
+    "bytes_in_total": "bin",
+    "bytes_out_total": "bout",
+    "current_session_rate": "rate",
+    "request_errors_total": "ereq",
+    "response_errors_total": "eresp",
+    "connection_errors_total": "econ",
+    "retry_warnings_total": "wretr",
+    "redispatch_warnings_total": "wredis",
+    "current_queue": "qcur",
+    "weight": "weight",
+    "max_queue": "qmax",
+    "queue_time_average_seconds": "qtime",
+    "connect_time_average_seconds": "ctime",
+    "response_time_average_seconds": "rtime",
+    "total_time_average_seconds": "ttime",
+    "http_responses_total": "hrsp_5xx",
+    "check_duration_seconds": "check_duration",
+    "last_status_change_seconds": "lastchg",
+}
+PROMETHEUS_MILLISECOND_METRICS = frozenset(
+    {
+        "queue_time_average_seconds",
+        "connect_time_average_seconds",
+        "response_time_average_seconds",
+        "total_time_average_seconds",
+        "check_duration_seconds",
+    }
+)
+PROMETHEUS_LABEL_FILTERS: dict[str, tuple[str, str]] = {
+    "http_responses_total": ("code", "5xx"),
+}
@@ -1,28 +1,111 @@
 from __future__ import annotations
 
-import csv
+import asyncio
 import logging
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Collection, Iterable
+from datetime import timedelta
+from typing import Any
 
 import async_timeout
-from aiohttp import BasicAuth
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    CONF_URL,
-    CONF_USERNAME,
-    CONF_PASSWORD,
-    CONF_VERIFY_SSL,
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_HISTORY_SIZE,
+    ANOMALY_DROP_COLUMNS,
+    ANOMALY_SPIKE_COLUMNS,
+    CONF_ANOMALY_DETECTION,
+    CONF_ANOMALY_DROP,
+    CONF_ANOMALY_THRESHOLD,
+    CONF_ADAPTIVE_POLLING,
+    CONF_HISTORY,
+    CONF_HISTORY_MEMORY,
+    CONF_HISTORY_SAMPLES,
+    CONF_LATENCY_PERCENTILES,
+    CONF_LATENCY_WINDOW,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PARSE_MODE,
+    CONF_PARSE_THRESHOLD,
+    CONF_RATE_SMOOTHING,
+    CONF_RATE_THRESHOLD,
+    CONF_SYSLOG_LISTENER,
+    CONF_SYSLOG_PORT,
+    CONF_SYSLOG_SOURCES,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ANOMALY_DETECTION,
+    DEFAULT_ANOMALY_DROP,
+    DEFAULT_ANOMALY_THRESHOLD,
+    DEFAULT_HISTORY,
+    DEFAULT_HISTORY_MEMORY,
+    DEFAULT_HISTORY_SAMPLES,
+    DEFAULT_LATENCY_PERCENTILES,
+    DEFAULT_LATENCY_WINDOW,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PARSE_MODE,
+    DEFAULT_PARSE_THRESHOLD,
+    DEFAULT_RATE_SMOOTHING,
+    DEFAULT_RATE_THRESHOLD,
+    DEFAULT_SYSLOG_LISTENER,
+    DEFAULT_SYSLOG_PORT,
+    DEFAULT_SYSLOG_SOURCES,
+    ENDPOINT_TIMEOUT,
+    EVENT_ANOMALY,
+    ERROR_STAT_COLUMNS,
+    FETCH_TIMING_PHASES,
+    HISTORY_COLUMNS,
+    LATENCY_PERCENTILES,
+    LATENCY_STAT_COLUMNS,
+    MAX_CONCURRENT_FETCHES,
+    ROW_REMOVAL_GRACE,
+    ROW_REMOVAL_POLLS,
+    ROW_TYPE_SERVER,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+    STAT_COLUMNS,
+    TIMING_HISTORY_SIZE,
 )
+from .anomaly import AnomalyDetector
+from .entity import row_device_identifier, row_device_info
+from .filters import backend_up_proxy, collapsed_backends, create_row_matcher, row_type
+from .history import RowRingBuffer, StatsHistory
+from .snapshot import MISSING, HAProxyStatsSnapshot
+from .syslog_listener import HAProxySyslogListener, log_hostname, parse_log_event
+from .transport import (
+    HAProxyHttpTransport,
+    HAProxySocketTransport,
+    HAProxyTransportError,
+    create_transports,
+    split_endpoints,
+)
+from .workers import ParseWorker
 
 _LOGGER = logging.getLogger(__name__)
 
+TIMINGS_CONTEXT = "timings"
+
+
+def entry_option(entry: ConfigEntry, key: str, default: Any) -> Any:
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
 
-class HAProxyStatsCoordinator(DataUpdateCoordinator[dict[str, dict[str, str]]]):
+class HAProxyStatsCoordinator(DataUpdateCoordinator[HAProxyStatsSnapshot]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, update_interval) -> None:
         super().__init__(
             hass,
@@ -31,67 +114,711 @@ class HAProxyStatsCoordinator(DataUpdateCoordinator[dict[str, dict[str, str]]]):
             update_interval=update_interval,
         )
         self.entry = entry
-
-    async def _async_update_data(self) -> dict[str, dict[str, str]]:
-        url = self.entry.data[CONF_URL]
-        username = self.entry.data.get(CONF_USERNAME)
-        password = self.entry.data.get(CONF_PASSWORD)
-        verify_ssl = self.entry.options.get(
-            CONF_VERIFY_SSL,
-            self.entry.data.get(CONF_VERIFY_SSL, False),
+        self.matcher = create_row_matcher(hass, entry)
+        self.parse_worker = ParseWorker(
+            hass,
+            entry.options.get(CONF_PARSE_MODE, DEFAULT_PARSE_MODE),
+            int(entry.options.get(CONF_PARSE_THRESHOLD, DEFAULT_PARSE_THRESHOLD)) * 1024,
+        )
+        self.transports = create_transports(
+            hass, entry, STAT_COLUMNS, self.matcher, self.parse_worker
+        )
+        self.node_errors: dict[str, str] = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._context_listeners: dict[Any, set[CALLBACK_TYPE]] = {}
+        self._changes: set[tuple[int, str]] | None = None
+        self._notified_success = False
+        self._row_listeners: list[Callable[[set[int], set[int]], None]] = []
+        self.added_rows: set[int] = set()
+        self.removed_rows: set[int] = set()
+        self._missing_rows: dict[int, tuple[int, float]] = {}
+        self.changed_rows = 0
+        self.unchanged_rows = 0
+        self.adaptive_polling = entry_option(
+            entry, CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._min_interval = float(
+            entry_option(entry, CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
         )
+        self._max_interval = max(
+            float(entry_option(entry, CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)),
+            self._min_interval,
+        )
+        self._rate_threshold = int(
+            entry_option(entry, CONF_RATE_THRESHOLD, DEFAULT_RATE_THRESHOLD)
+        )
+        self._rate_smoothing = float(
+            entry_option(entry, CONF_RATE_SMOOTHING, DEFAULT_RATE_SMOOTHING)
+        )
+        self.interval_adjustments: deque[dict[str, Any]] = deque(
+            maxlen=ADAPTIVE_HISTORY_SIZE
+        )
+        self.timings: deque[dict[str, float]] = deque(maxlen=TIMING_HISTORY_SIZE)
+        self._deferred_writes: set[Any] = set()
+        self.state_writes = 0
+        self.suppressed_writes = 0
+        self._pending_timings: dict[str, float] | None = None
+        self._device_info: dict[int, DeviceInfo] = {}
+        self._store = snapshot_store(hass, entry)
+        self._save_pending = False
+        self.restored = False
+        self.startup: dict[str, Any] = {}
+        self.latency_history: RowRingBuffer | None = None
+        if entry.options.get(CONF_LATENCY_PERCENTILES, DEFAULT_LATENCY_PERCENTILES):
+            self.latency_history = RowRingBuffer(
+                LATENCY_STAT_COLUMNS,
+                int(entry.options.get(CONF_LATENCY_WINDOW, DEFAULT_LATENCY_WINDOW)),
+                LATENCY_PERCENTILES,
+            )
+        self.history: StatsHistory | None = None
+        if entry.options.get(CONF_HISTORY, DEFAULT_HISTORY):
+            self.history = StatsHistory(
+                HISTORY_COLUMNS,
+                int(entry.options.get(CONF_HISTORY_SAMPLES, DEFAULT_HISTORY_SAMPLES)),
+                int(entry.options.get(CONF_HISTORY_MEMORY, DEFAULT_HISTORY_MEMORY)) * 1048576,
+            )
+        self.anomaly_detector: AnomalyDetector | None = None
+        if entry.options.get(CONF_ANOMALY_DETECTION, DEFAULT_ANOMALY_DETECTION):
+            self.anomaly_detector = AnomalyDetector(
+                ANOMALY_SPIKE_COLUMNS,
+                ANOMALY_DROP_COLUMNS,
+                float(entry.options.get(CONF_ANOMALY_THRESHOLD, DEFAULT_ANOMALY_THRESHOLD)),
+                float(entry.options.get(CONF_ANOMALY_DROP, DEFAULT_ANOMALY_DROP)),
+            )
+        self.syslog: HAProxySyslogListener | None = None
+        self.log_events = {
+            "applied": 0,
+            "unchanged": 0,
+            "ignored": 0,
+            "rejected": 0,
+            "unknown_node": 0,
+        }
+        self._log_nodes: dict[str, str] = {}
+        self._log_addresses: dict[str, str] = {}
+        self._log_sources = frozenset(
+            split_endpoints(entry.options.get(CONF_SYSLOG_SOURCES, DEFAULT_SYSLOG_SOURCES))
+        )
+        if entry.options.get(CONF_SYSLOG_LISTENER, DEFAULT_SYSLOG_LISTENER):
+            self.syslog = HAProxySyslogListener(
+                int(entry.options.get(CONF_SYSLOG_PORT, DEFAULT_SYSLOG_PORT)),
+                self.async_handle_log_message,
+            )
+            for node in self.transports:
+                host, separator, port = node.partition("#")[0].rpartition(":")
+                if not separator or not port.isdigit():
+                    host = node.partition("#")[0]
+                if host.startswith("/"):
+                    host = "localhost"
+                self._log_nodes.setdefault(host.strip("[]"), node)
 
-        auth = None
-        if username or password:
-            auth = BasicAuth(username or "", password or "")
+    async def async_restore(self) -> bool:
+        try:
+            data = await self._store.async_load()
+            if data is None:
+                return False
+            snapshot = await self.hass.async_add_executor_job(
+                HAProxyStatsSnapshot.from_storage, data
+            )
+        except (KeyError, TypeError, ValueError, zlib.error) as err:
+            _LOGGER.warning("Ignoring stored HAProxy snapshot: %s", err)
+            return False
+
+        matcher = self.matcher
+        for index in snapshot.rows():
+            if not matcher(snapshot.pxname[index], snapshot.svname[index]):
+                snapshot.present[index] = 0
+        self.data = snapshot
+        self.restored = True
+        return True
+
+    def _storage_data(self) -> dict[str, Any]:
+        self._save_pending = False
+        return self.data.as_storage()
 
-        session = async_get_clientsession(self.hass)
+    @callback
+    def _async_schedule_save(self) -> None:
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._storage_data, SNAPSHOT_SAVE_DELAY)
 
+    async def async_start_syslog(self) -> None:
+        if self.syslog is None:
+            return
+        for host, node in self._log_nodes.items():
+            try:
+                addresses = await self.hass.loop.getaddrinfo(host, None)
+            except OSError as err:
+                _LOGGER.warning("Could not resolve %s to accept its syslog messages: %s", host, err)
+                continue
+            for *_info, sockaddr in addresses:
+                self._log_addresses.setdefault(sockaddr[0], node)
         try:
-            async with async_timeout.timeout(15):
-                response = await session.get(url, auth=auth, ssl=verify_ssl)
-                async with response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"HTTP status {response.status}")
-                    text = await response.text()
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching HAProxy stats: {err}") from err
+            await self.syslog.async_start()
+        except OSError as err:
+            _LOGGER.error(
+                "Could not listen for HAProxy syslog messages on port %s: %s",
+                self.syslog.port,
+                err,
+            )
+
+    @callback
+    def async_handle_log_message(self, message: str, peer: str) -> None:
+        node = self._log_addresses.get(peer)
+        if node is None:
+            if peer not in self._log_sources:
+                self.log_events["rejected"] += 1
+                return
+            node = self._log_nodes.get(log_hostname(message) or "")
+            if node is None and len(self.transports) == 1:
+                node = next(iter(self.transports))
+            if node is None:
+                self.log_events["unknown_node"] += 1
+                return
+
+        event = parse_log_event(message)
+        snapshot = self.data
+        if event is None or snapshot is None:
+            self.log_events["ignored"] += 1
+            return
+
+        pxname, svname, status = event
+        nodes = tuple(self.transports)
+        patched = snapshot.patch_status(pxname, svname, status, node, nodes)
+        if status == "UP" and svname != "BACKEND":
+            patched |= snapshot.patch_status(pxname, "BACKEND", "UP", node, nodes, ("DOWN",))
+        if not patched:
+            self.log_events["unchanged"] += 1
+            return
+
+        self.log_events["applied"] += 1
+        _LOGGER.debug("HAProxy log set %s/%s to %s", pxname, svname, status)
+        for index in patched:
+            for update_callback in list(self._context_listeners.get((index, "status"), ())):
+                update_callback()
+        self._async_schedule_save()
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        if self.syslog is not None:
+            await self.syslog.async_stop()
+        if self._save_pending and self.data is not None:
+            await self._store.async_save(self._storage_data())
+        for transport in self.transports.values():
+            await transport.async_close()
+        await self.parse_worker.async_close()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        remove = super().async_add_listener(update_callback, context)
+        if context is None:
+            return remove
+
+        self._context_listeners.setdefault(context, set()).add(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            listeners = self._context_listeners.get(context)
+            if listeners is not None:
+                listeners.discard(update_callback)
+                if not listeners:
+                    del self._context_listeners[context]
+
+        return remove_listener
+
+    @callback
+    def async_add_row_listener(
+        self, listener: Callable[[set[int], set[int]], None]
+    ) -> Callable[[], None]:
+        self._row_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._row_listeners:
+                self._row_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_defer_write(self, context: Any) -> None:
+        self.suppressed_writes += 1
+        self._deferred_writes.add(context)
+
+    def row_device_info(self, row_index: int) -> DeviceInfo:
+        device_info = self._device_info.get(row_index)
+        if device_info is None:
+            transport = self.transports.get(self.data.node[row_index]) or next(
+                iter(self.transports.values()), None
+            )
+            device_info = row_device_info(
+                self.entry,
+                self.data,
+                row_index,
+                transport.configuration_url if transport is not None else None,
+            )
+            self._device_info[row_index] = device_info
+        return device_info
+
+    @property
+    def last_timings(self) -> dict[str, float] | None:
+        return self.timings[-1] if self.timings else None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        started = time.perf_counter()
+        writes = self.state_writes
+        suppressed = self.suppressed_writes
+        changes = self._changes
+        self._changes = None
+        deferred = self._deferred_writes
+        self._deferred_writes = set()
+
+        broadcast = changes is None or self.last_update_success != self._notified_success
+        if broadcast:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+        else:
+            for update_callback, context in list(self._listeners.values()):
+                if context is None:
+                    update_callback()
+
+            for context in changes | deferred:
+                for update_callback in list(self._context_listeners.get(context, ())):
+                    update_callback()
+
+        self._async_notify_rows()
+
+        timings = self._pending_timings
+        if timings is not None:
+            self._pending_timings = None
+            timings["dispatch"] = (time.perf_counter() - started) * 1000
+            timings["total"] += timings["dispatch"]
+            timings["blocking"] = timings.get("blocking", 0.0) + timings["dispatch"]
+            timings["writes"] = self.state_writes - writes
+            timings["suppressed"] = self.suppressed_writes - suppressed
+            self.timings.append(timings)
+            if not broadcast:
+                for update_callback in list(self._context_listeners.get(TIMINGS_CONTEXT, ())):
+                    update_callback()
+
+    @callback
+    def _async_notify_rows(self) -> None:
+        added = self.added_rows
+        removed = self.removed_rows
+        if not added and not removed:
+            return
+        self.added_rows = set()
+        self.removed_rows = set()
+
+        for listener in list(self._row_listeners):
+            listener(added, removed)
+        if removed:
+            self._async_remove_devices(removed)
+            self._release_rows(removed)
+
+    def _release_rows(self, removed: set[int]) -> None:
+        self.data.release_rows(removed)
+        for row_index in removed:
+            self._device_info.pop(row_index, None)
+        if self.latency_history is not None:
+            self.latency_history.release(removed)
+        if self.anomaly_detector is not None:
+            self.anomaly_detector.release(removed)
 
-        return _parse_csv(text)
+    @callback
+    def _async_remove_devices(self, removed: set[int]) -> None:
+        device_registry = dr.async_get(self.hass)
+        entity_registry = er.async_get(self.hass)
+        for row_index in removed:
+            device = device_registry.async_get_device(
+                identifiers={row_device_identifier(self.entry, self.data, row_index)}
+            )
+            if device is None:
+                continue
+            if er.async_entries_for_device(
+                entity_registry, device.id, include_disabled_entities=True
+            ):
+                continue
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.entry.entry_id
+            )
 
+    @callback
+    def async_handle_registry_update(self, event: Event) -> None:
+        if event.data["action"] != "update" or "disabled_by" not in event.data.get("changes", {}):
+            return
+        entity_registry = er.async_get(self.hass)
+        registry_entry = entity_registry.async_get(event.data["entity_id"])
+        if (
+            registry_entry is None
+            or registry_entry.config_entry_id != self.entry.entry_id
+            or backend_up_proxy(self.entry, registry_entry.unique_id) is None
+        ):
+            return
+        collapsed = collapsed_backends(self.hass, self.entry)
+        if collapsed == self.matcher.collapsed_backends:
+            return
 
-def _parse_csv(text: str) -> dict[str, dict[str, str]]:
-    data: dict[str, dict[str, str]] = {}
-    lines = [line for line in text.splitlines() if line.strip()]
+        snapshot = self.data
+        newly_collapsed = collapsed - self.matcher.collapsed_backends
+        if snapshot is not None:
+            servers = {
+                index
+                for index in range(len(snapshot.keys))
+                if snapshot.pxname[index] in newly_collapsed
+                and row_type(snapshot.svname[index]) == ROW_TYPE_SERVER
+            }
+            prefixes = tuple(
+                f"{self.entry.entry_id}_{snapshot.keys[index]}_" for index in servers
+            )
+            for server_entry in er.async_entries_for_config_entry(
+                entity_registry, self.entry.entry_id
+            ):
+                if server_entry.unique_id.startswith(prefixes):
+                    entity_registry.async_remove(server_entry.entity_id)
+            self._async_remove_devices(servers)
+        _LOGGER.debug("HAProxy backends without server entities: %s", sorted(collapsed))
+        self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
 
-    if not lines:
-        return data
+    async def _async_fetch_node(
+        self,
+        transport: HAProxyHttpTransport | HAProxySocketTransport,
+    ) -> list[tuple[str, ...]]:
+        async with self._semaphore:
+            async with async_timeout.timeout(ENDPOINT_TIMEOUT):
+                return await transport.async_fetch_stats()
 
-    header: list[str] | None = None
+    @property
+    def runtime_transports(self) -> dict[str, HAProxySocketTransport]:
+        return {
+            node: transport
+            for node, transport in self.transports.items()
+            if isinstance(transport, HAProxySocketTransport)
+        }
 
-    for row in csv.reader(lines):
-        if not row:
-            continue
+    async def _async_execute(
+        self, transport: HAProxySocketTransport, commands: Iterable[str]
+    ) -> None:
+        async with async_timeout.timeout(ENDPOINT_TIMEOUT):
+            await transport.async_execute(commands)
 
-        if row[0].startswith("#"):
-            row[0] = row[0].lstrip("# ").strip()
-            header = row
-            continue
+    async def _async_fetch_servers(
+        self, transport: HAProxySocketTransport, servers: Collection[tuple[str, str]]
+    ) -> list[tuple[str, ...]]:
+        async with self._semaphore:
+            async with async_timeout.timeout(ENDPOINT_TIMEOUT):
+                return await transport.async_fetch_servers(servers)
 
-        if header is None:
-            continue
+    async def async_run_commands(
+        self,
+        commands: Collection[str],
+        servers: Collection[tuple[str, str]] | None,
+        node: str | None = None,
+    ) -> None:
+        transports = {
+            name: transport
+            for name, transport in self.runtime_transports.items()
+            if not node or name == node
+        }
+        results = await asyncio.gather(
+            *(self._async_execute(transport, commands) for transport in transports.values()),
+            return_exceptions=True,
+        )
+
+        errors: dict[str, str] = {}
+        for name, result in zip(transports, results):
+            if isinstance(result, Exception):
+                errors[name] = str(result) or type(result).__name__
+            elif isinstance(result, BaseException):
+                raise result
+
+        if servers is None:
+            await self.async_request_refresh()
+        else:
+            await self.async_refresh_servers(
+                servers, [name for name in transports if name not in errors]
+            )
+
+        if errors:
+            raise HAProxyTransportError(
+                "; ".join(f"{name}: {error}" for name, error in errors.items())
+            )
+
+    async def async_refresh_servers(
+        self, servers: Collection[tuple[str, str]], nodes: Iterable[str]
+    ) -> None:
+        transports = {node: self.runtime_transports[node] for node in nodes}
+        results = await asyncio.gather(
+            *(self._async_fetch_servers(transport, servers) for transport in transports.values()),
+            return_exceptions=True,
+        )
+
+        rows: dict[str, list[tuple[str, ...]]] = {}
+        for node, result in zip(transports, results):
+            if isinstance(result, Exception):
+                _LOGGER.debug("Error refreshing HAProxy servers on %s: %s", node, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                rows[node] = result
+
+        if not rows or self.data is None:
+            return
+        snapshot = self.data.copy()
+        if not snapshot.patch_rows(STAT_COLUMNS, rows, tuple(self.transports)):
+            return
+        snapshot.aggregate_backends(self.matcher.filters_servers)
+        self._record_changes(snapshot)
+        self.data = snapshot
+        self._async_schedule_save()
+        self.async_update_listeners()
+
+    async def _async_update_data(self) -> HAProxyStatsSnapshot:
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self._async_fetch_node(transport) for transport in self.transports.values()),
+            return_exceptions=True,
+        )
+
+        nodes: dict[str, list[tuple[str, ...]]] = {}
+        errors: dict[str, str] = {}
+        for node, result in zip(self.transports, results):
+            if isinstance(result, Exception):
+                errors[node] = str(result) or type(result).__name__
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                nodes[node] = result
+
+        for node in errors.keys() - self.node_errors.keys():
+            _LOGGER.warning("Error fetching HAProxy stats from %s: %s", node, errors[node])
+        self.node_errors = errors
+
+        if not nodes:
+            raise UpdateFailed(
+                "Error fetching HAProxy stats: "
+                + "; ".join(f"{node}: {error}" for node, error in errors.items())
+            )
+
+        fetched = time.perf_counter()
+        snapshot = HAProxyStatsSnapshot.from_nodes(
+            STAT_COLUMNS, nodes, self.data, aggregate_nodes=tuple(self.transports)
+        )
+        snapshot.derive_rates(self.data, self._rate_smoothing)
+        snapshot.group_backends(self.data)
+        snapshot.aggregate_backends(self.matcher.filters_servers)
+        if self.latency_history is not None:
+            self.latency_history.update(snapshot, self.data)
+        if self.history is not None:
+            self.history.record(snapshot)
+        anomalies = None
+        if self.anomaly_detector is not None:
+            anomalies = self.anomaly_detector.update(snapshot)
+        built = time.perf_counter()
+        self._record_changes(snapshot)
+        if anomalies is not None:
+            self._record_anomalies(snapshot, *anomalies)
+        self._record_rows(snapshot)
+        diffed = time.perf_counter()
+
+        timings = self._fetch_timings(nodes)
+        timings["fetch"] = (fetched - started) * 1000
+        timings["build"] = (built - fetched) * 1000
+        timings["diff"] = (diffed - built) * 1000
+        timings["total"] = (diffed - started) * 1000
+        timings["blocking"] = timings.get("blocking", 0.0) + (diffed - fetched) * 1000
+        timings["rows"] = sum(len(rows) for rows in nodes.values())
+        timings["time"] = snapshot.timestamp
+        self._pending_timings = timings
+        if self.adaptive_polling:
+            self._adapt_interval(snapshot)
+        self._async_schedule_save()
+        return snapshot
+
+    def _fetch_timings(self, nodes: dict[str, list[tuple[str, ...]]]) -> dict[str, float]:
+        timings: dict[str, float] = {"bytes": 0}
+        for node in nodes:
+            transport_timings = self.transports[node].timings
+            timings["bytes"] += transport_timings.get("bytes", 0)
+            for phase in FETCH_TIMING_PHASES:
+                value = transport_timings.get(phase)
+                if value is None:
+                    continue
+                if phase in ("decode", "parse", "blocking"):
+                    timings[phase] = timings.get(phase, 0.0) + value * 1000
+                else:
+                    timings[phase] = max(timings.get(phase, 0.0), value * 1000)
+        return timings
+
+    def _record_changes(self, snapshot: HAProxyStatsSnapshot) -> None:
+        changes = snapshot.changes(self.data)
+        changed_rows = {index for index, _ in changes}
+        self._changes = changes
+        self.changed_rows = len(changed_rows)
+        self.unchanged_rows = sum(
+            1 for index in snapshot.rows() if index not in changed_rows
+        )
+
+    def _record_anomalies(
+        self, snapshot: HAProxyStatsSnapshot, started: set[int], ended: set[int]
+    ) -> None:
+        anomalies = self.anomaly_detector.anomalies
+        changes = self._changes
+        changes.update((index, "anomaly") for index in anomalies.keys() | ended)
+        changes.update(
+            (index, "anomaly") for index, column in tuple(changes) if column == "status"
+        )
+        for index in sorted(started):
+            _LOGGER.debug("HAProxy anomaly on %s: %s", snapshot.keys[index], anomalies[index])
+            self.hass.bus.async_fire(
+                EVENT_ANOMALY,
+                {
+                    "config_entry_id": self.entry.entry_id,
+                    "key": snapshot.keys[index],
+                    "proxy": snapshot.pxname[index],
+                    "server": snapshot.svname[index],
+                    "node": snapshot.node[index],
+                    "metrics": anomalies[index],
+                },
+            )
 
-        if len(row) < len(header):
-            row += [""] * (len(header) - len(row))
+    def _record_rows(self, snapshot: HAProxyStatsSnapshot) -> None:
+        previous = self.data
+        if previous is None:
+            return
 
-        item = dict(zip(header, row))
-        pxname = item.get("pxname") or ""
-        svname = item.get("svname") or ""
+        size = len(previous.keys)
+        present = snapshot.present
+        previous_present = previous.present
+        added = {
+            index
+            for index in snapshot.rows()
+            if index >= size or not previous_present[index]
+        }
+        missing = self._missing_rows
+        for index in added:
+            missing.pop(index, None)
+        removed: set[int] = set()
+        if not self.node_errors:
+            for index in range(size):
+                if present[index] or not (previous_present[index] or index in missing):
+                    continue
+                polls, since = missing.get(index, (0, snapshot.timestamp))
+                polls += 1
+                if polls >= ROW_REMOVAL_POLLS and snapshot.timestamp - since >= ROW_REMOVAL_GRACE:
+                    missing.pop(index, None)
+                    removed.add(index)
+                else:
+                    missing[index] = (polls, since)
+
+        self.added_rows = (self.added_rows - removed) | added
+        self.removed_rows = (self.removed_rows - added) | removed
+        if added or removed:
+            _LOGGER.debug("HAProxy rows added: %d, removed: %d", len(added), len(removed))
+
+    def _adapt_interval(self, snapshot: HAProxyStatsSnapshot) -> None:
+        if self.update_interval is None:
+            return
+
+        current = self.update_interval.total_seconds()
+        reason = self._incident_reason(snapshot)
+        if reason is not None:
+            interval = self._min_interval
+        else:
+            interval = min(current * ADAPTIVE_BACKOFF_FACTOR, self._max_interval)
+            reason = "stable"
+
+        if interval == current:
+            return
+
+        self.update_interval = timedelta(seconds=interval)
+        self.interval_adjustments.append(
+            {
+                "time": dt_util.utcnow().isoformat(),
+                "interval": interval,
+                "reason": reason,
+            }
+        )
+        _LOGGER.debug("Polling interval set to %.1fs: %s", interval, reason)
+
+    def _incident_reason(self, snapshot: HAProxyStatsSnapshot) -> str | None:
+        previous = self.data
+        if previous is None:
+            return None
+
+        size = len(previous.keys)
+        for index, column in self._changes or ():
+            if index >= size or not previous.present[index]:
+                continue
+            if column == "status":
+                status = snapshot.status[index] or "missing"
+                return f"{snapshot.keys[index]} status changed to {status}"
+            if column in ERROR_STAT_COLUMNS:
+                old = previous.values[column][index]
+                new = snapshot.values[column][index]
+                if old != MISSING and new > old:
+                    return f"{snapshot.keys[index]} {column} increased by {new - old}"
+
+        if self._rate_threshold > 0:
+            rates = snapshot.values["rate"]
+            peak = max((rates[index] for index in snapshot.rows()), default=MISSING)
+            if peak >= self._rate_threshold:
+                return f"session rate {peak}/s reached threshold {self._rate_threshold}/s"
+
+        return None
+
+
+class HAProxyInfoCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        stats: HAProxyStatsCoordinator,
+        update_interval,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_info",
+            update_interval=update_interval,
+        )
+        self.entry = entry
+        self.transports = stats.transports
+        self.node_errors: dict[str, str] = {}
+
+    async def _async_fetch_node(
+        self,
+        transport: HAProxyHttpTransport | HAProxySocketTransport,
+    ) -> dict[str, Any]:
+        async with async_timeout.timeout(ENDPOINT_TIMEOUT):
+            return await transport.async_fetch_info()
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        results = await asyncio.gather(
+            *(self._async_fetch_node(transport) for transport in self.transports.values()),
+            return_exceptions=True,
+        )
 
-        if not pxname or not svname:
-            continue
+        info: dict[str, dict[str, Any]] = {}
+        errors: dict[str, str] = {}
+        for node, result in zip(self.transports, results):
+            if isinstance(result, Exception):
+                errors[node] = str(result) or type(result).__name__
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                info[node] = result
 
-        key = f"{pxname}:{svname}"
-        data[key] = item
+        for node in errors.keys() - self.node_errors.keys():
+            _LOGGER.warning("Error fetching HAProxy info from %s: %s", node, errors[node])
+        self.node_errors = errors
 
-    return data
+        if not info:
+            raise UpdateFailed(
+                "Error fetching HAProxy info: "
+                + "; ".join(f"{node}: {error}" for node, error in errors.items())
+            )
+        return info
@@ -4,9 +4,24 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, CONF_PASSWORD, CONF_USERNAME
+from .const import DOMAIN, CONF_PASSWORD, CONF_USERNAME, TIMING_PHASES
 
 TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+PERCENTILES = (50, 95, 99)
+
+
+def _percentiles(history: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    result: dict[str, dict[str, float]] = {}
+    for phase in (*TIMING_PHASES, "bytes", "rows", "writes", "suppressed"):
+        values = sorted(item[phase] for item in history if phase in item)
+        if not values:
+            continue
+        result[phase] = {
+            f"p{percentile}": values[min(len(values) - 1, len(values) * percentile // 100)]
+            for percentile in PERCENTILES
+        }
+        result[phase]["max"] = values[-1]
+    return result
 
 
 async def async_get_config_entry_diagnostics(
@@ -14,8 +29,84 @@ async def async_get_config_entry_diagnostics(
     entry: ConfigEntry,
 ) -> dict:
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    info_coordinator = hass.data[DOMAIN][entry.entry_id]["info_coordinator"]
+    interval = coordinator.update_interval
+    timings = list(coordinator.timings)
 
     return {
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
-        "data": list(coordinator.data.values()),
-    }
+        "nodes": {
+            node: coordinator.node_errors.get(node, "ok")
+            for node in coordinator.transports
+        },
+        "connections": {
+            node: transport.connection_stats
+            for node, transport in coordinator.transports.items()
+        },
+        "startup": coordinator.startup,
+        "updates": {
+            "changed_rows": coordinator.changed_rows,
+            "unchanged_rows": coordinator.unchanged_rows,
+        },
+        "state_writes": {
+            "written": coordinator.state_writes,
+            "suppressed": coordinator.suppressed_writes,
+        },
+        "polling": {
+            "adaptive": coordinator.adaptive_polling,
+            "interval": interval.total_seconds() if interval else None,
+            "adjustments": list(coordinator.interval_adjustments),
+        },
+        "latency_history": (
+            None
+            if coordinator.latency_history is None
+            else {
+                "window": coordinator.latency_history.size,
+                "memory_bytes": coordinator.latency_history.memory,
+            }
+        ),
+        "history": (
+            None
+            if coordinator.history is None
+            else {
+                "samples": coordinator.history.samples,
+                "rows": coordinator.history.rows,
+                "capacity": coordinator.history.capacity,
+                "evictions": coordinator.history.evictions,
+                "memory_bytes": coordinator.history.memory,
+            }
+        ),
+        "anomalies": (
+            None
+            if coordinator.anomaly_detector is None
+            else {
+                "threshold": coordinator.anomaly_detector.threshold,
+                "detected": coordinator.anomaly_detector.detected,
+                "memory_bytes": coordinator.anomaly_detector.memory,
+                "active": {
+                    coordinator.data.keys[index]: metrics
+                    for index, metrics in coordinator.anomaly_detector.anomalies.items()
+                },
+            }
+        ),
+        "syslog": (
+            None
+            if coordinator.syslog is None
+            else {
+                "port": coordinator.syslog.port,
+                "running": coordinator.syslog.running,
+                "received": coordinator.syslog.received,
+                "errors": coordinator.syslog.errors,
+                "events": coordinator.log_events,
+            }
+        ),
+        "timings": {
+            "percentiles": _percentiles(timings),
+            "history": timings,
+        },
+        "info": {
+            "data": info_coordinator.data,
+            "errors": info_coordinator.node_errors,
+        },
+        "data": coordinator.data.as_rows(),
+    }
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable, Sequence
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_URL
+from .const import DOMAIN, ENTITY_ADD_BATCH_SIZE
+from .snapshot import HAProxyStatsSnapshot
 
 
 def _format_device_name(entry_title: str, pxname: str, svname: str) -> str:
@@ -31,37 +39,146 @@ def _format_model_name(svname: str) -> str:
     return "Server"
 
 
+def row_unique_id(entry: ConfigEntry, row_key: str, key: str) -> str:
+    return f"{entry.entry_id}_{row_key}_{key}"
+
+
+def row_device_identifier(
+    entry: ConfigEntry,
+    snapshot: HAProxyStatsSnapshot,
+    row_index: int,
+) -> tuple[str, ...]:
+    identifier = (
+        DOMAIN,
+        entry.entry_id,
+        snapshot.pxname[row_index] or "HAProxy",
+        snapshot.svname[row_index],
+    )
+    node = snapshot.node[row_index]
+    return (*identifier, node) if node else identifier
+
+
+def row_device_info(
+    entry: ConfigEntry,
+    snapshot: HAProxyStatsSnapshot,
+    row_index: int,
+    configuration_url: str | None,
+) -> DeviceInfo:
+    svname = snapshot.svname[row_index]
+    node = snapshot.node[row_index]
+    name = _format_device_name(entry.title, snapshot.pxname[row_index] or "HAProxy", svname)
+    if node:
+        name = f"{name} ({node})"
+    return DeviceInfo(
+        identifiers={row_device_identifier(entry, snapshot, row_index)},
+        name=name,
+        manufacturer="HAProxy",
+        model=_format_model_name(svname),
+        configuration_url=configuration_url,
+    )
+
+
+async def async_add_entities_batched(
+    async_add_entities: AddEntitiesCallback,
+    entities: Sequence[Entity],
+    batch_size: int = ENTITY_ADD_BATCH_SIZE,
+) -> None:
+    for start in range(0, len(entities), batch_size):
+        if start:
+            await asyncio.sleep(0)
+        async_add_entities(entities[start : start + batch_size])
+
+
+@callback
+def async_remove_row_entities(
+    hass: HomeAssistant,
+    platform: str,
+    entry: ConfigEntry,
+    row_keys: Iterable[str],
+    keys: Iterable[str],
+    entities_known: set[str],
+) -> None:
+    registry = er.async_get(hass)
+    keys = tuple(keys)
+    for row_key in row_keys:
+        for key in keys:
+            unique_id = row_unique_id(entry, row_key, key)
+            entities_known.discard(unique_id)
+            entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+
+
+def entry_device_info(entry: ConfigEntry, node: str = "") -> DeviceInfo:
+    name = _format_device_name(entry.title, "HAProxy", "process")
+    if not node:
+        return DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=name,
+            manufacturer="HAProxy",
+            model="Process",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id, node)},
+        name=f"{name} ({node})",
+        manufacturer="HAProxy",
+        model="Process",
+        entry_type=DeviceEntryType.SERVICE,
+        via_device=(DOMAIN, entry.entry_id),
+    )
+
+
+class HAProxyEntryEntity(CoordinatorEntity):
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        description,
+        context=None,
+        node: str = "",
+    ) -> None:
+        super().__init__(coordinator, context)
+        self.entity_description = description
+        self._entry = entry
+        self._node = node
+        if node:
+            self._attr_unique_id = f"{entry.entry_id}_{node}_{description.key}"
+        else:
+            self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = entry_device_info(entry, node)
+
+
 class HAProxyStatsEntity(CoordinatorEntity):
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator, entry: ConfigEntry, row_key: str, description) -> None:
-        super().__init__(coordinator)
+    _context_column: str | None = None
+
+    def __init__(self, coordinator, entry: ConfigEntry, row_index: int, description) -> None:
+        super().__init__(coordinator, (row_index, self._context_column or description.key))
         self.entity_description = description
         self._entry = entry
-        self._row_key = row_key
+        self._row_index = row_index
+        self._row_key = coordinator.data.keys[row_index]
 
     @property
-    def _row(self) -> dict[str, str] | None:
-        return self.coordinator.data.get(self._row_key)
+    def _present(self) -> bool:
+        return bool(self.coordinator.data.present[self._row_index])
 
     @property
     def _pxname(self) -> str:
-        row = self._row or {}
-        return row.get("pxname", "HAProxy")
+        return self.coordinator.data.pxname[self._row_index] or "HAProxy"
 
     @property
     def _svname(self) -> str:
-        row = self._row or {}
-        return row.get("svname", "")
+        return self.coordinator.data.svname[self._row_index]
+
+    @property
+    def _node(self) -> str:
+        return self.coordinator.data.node[self._row_index]
 
     @property
     def device_info(self) -> DeviceInfo:
-        pxname = self._pxname
-        svname = self._svname
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id, pxname, svname)},
-            name=_format_device_name(self._entry.title, pxname, svname),
-            manufacturer="HAProxy",
-            model=_format_model_name(svname),
-            configuration_url=self._entry.data.get(CONF_URL),
-        )
+        return self.coordinator.row_device_info(self._row_index)
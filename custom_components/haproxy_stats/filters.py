@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    CONF_EXCLUDE_PROXIES,
+    CONF_EXCLUDE_SERVERS,
+    CONF_INCLUDE_SERVERS,
+    CONF_LAZY_SERVERS,
+    CONF_ROW_TYPES,
+    CONF_TRACKED_PROXIES,
+    DEFAULT_LAZY_SERVERS,
+    ROW_TYPE_BACKEND,
+    ROW_TYPE_FRONTEND,
+    ROW_TYPE_SERVER,
+    ROW_TYPES,
+)
+
+BACKEND_ROW_KEY_RE = re.compile(r"(?P<proxy>.*):BACKEND(?:@.+)?")
+
+
+def split_patterns(value: str | Iterable[str] | None) -> list[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = re.split(r"[\s,]+", value)
+    return [pattern for pattern in value if pattern]
+
+
+def _compile(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+
+def row_type(svname: str) -> str:
+    if svname == "FRONTEND":
+        return ROW_TYPE_FRONTEND
+    if svname == "BACKEND":
+        return ROW_TYPE_BACKEND
+    return ROW_TYPE_SERVER
+
+
+class RowMatcher:
+    def __init__(
+        self,
+        include_proxies: Iterable[str] = (),
+        exclude_proxies: Iterable[str] = (),
+        include_servers: Iterable[str] = (),
+        exclude_servers: Iterable[str] = (),
+        row_types: Iterable[str] = ROW_TYPES,
+        collapsed_backends: Iterable[str] = (),
+    ) -> None:
+        self.include_proxies = frozenset(include_proxies)
+        self._exclude_proxies = _compile(exclude_proxies)
+        self._include_servers = _compile(include_servers)
+        self._exclude_servers = _compile(exclude_servers)
+        self._row_types = frozenset(row_types)
+        self.collapsed_backends = frozenset(collapsed_backends)
+        self.matches_all = not (
+            self.include_proxies
+            or self._exclude_proxies
+            or self._include_servers
+            or self._exclude_servers
+            or self.collapsed_backends
+            or not self._row_types.issuperset(ROW_TYPES)
+        )
+
+    def filters_servers(self, pxname: str) -> bool:
+        return (
+            ROW_TYPE_SERVER not in self._row_types
+            or pxname in self.collapsed_backends
+            or self._include_servers is not None
+            or self._exclude_servers is not None
+        )
+
+    def __call__(self, pxname: str, svname: str) -> bool:
+        if self.include_proxies and pxname not in self.include_proxies:
+            return False
+        if self._exclude_proxies is not None and self._exclude_proxies.match(pxname):
+            return False
+
+        kind = row_type(svname)
+        if kind not in self._row_types:
+            return False
+        if kind != ROW_TYPE_SERVER:
+            return True
+
+        if pxname in self.collapsed_backends:
+            return False
+        if self._include_servers is not None and not self._include_servers.match(svname):
+            return False
+        if self._exclude_servers is not None and self._exclude_servers.match(svname):
+            return False
+        return True
+
+
+def backend_up_proxy(entry: ConfigEntry, unique_id: str) -> str | None:
+    prefix = f"{entry.entry_id}_"
+    suffix = "_backend_up"
+    if not unique_id.startswith(prefix) or not unique_id.endswith(suffix):
+        return None
+    match = BACKEND_ROW_KEY_RE.fullmatch(unique_id[len(prefix) : -len(suffix)])
+    return match["proxy"] if match is not None else None
+
+
+def collapsed_backends(hass: HomeAssistant, entry: ConfigEntry) -> set[str]:
+    registry = er.async_get(hass)
+    disabled: dict[str, bool] = {}
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        proxy = backend_up_proxy(entry, registry_entry.unique_id)
+        if proxy is not None:
+            disabled[proxy] = disabled.get(proxy, True) and registry_entry.disabled_by is not None
+    return {proxy for proxy, is_disabled in disabled.items() if is_disabled}
+
+
+def create_row_matcher(hass: HomeAssistant, entry: ConfigEntry) -> RowMatcher:
+    options = entry.options
+    collapsed: set[str] = set()
+    if options.get(CONF_LAZY_SERVERS, DEFAULT_LAZY_SERVERS):
+        collapsed = collapsed_backends(hass, entry)
+
+    return RowMatcher(
+        include_proxies=options.get(CONF_TRACKED_PROXIES, ()),
+        exclude_proxies=split_patterns(options.get(CONF_EXCLUDE_PROXIES)),
+        include_servers=split_patterns(options.get(CONF_INCLUDE_SERVERS)),
+        exclude_servers=split_patterns(options.get(CONF_EXCLUDE_SERVERS)),
+        row_types=options.get(CONF_ROW_TYPES, ROW_TYPES),
+        collapsed_backends=collapsed,
+    )
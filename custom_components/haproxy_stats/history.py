@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from .snapshot import MISSING, HAProxyStatsSnapshot
+
+
+def percentile_column(column: str, percentile: int) -> str:
+    return f"{column}_p{percentile}"
+
+
+class RowRingBuffer:
+    def __init__(self, columns: Iterable[str], size: int, percentiles: Iterable[int]) -> None:
+        self.columns = tuple(columns)
+        self.size = max(int(size), 1)
+        self.percentiles = tuple(percentiles)
+        self._rows = 0
+        self._samples = {column: array("d") for column in self.columns}
+        self._cursor = {column: array("l") for column in self.columns}
+        self._count = {column: array("l") for column in self.columns}
+
+    @property
+    def memory(self) -> int:
+        return sum(
+            samples.itemsize * len(samples) for samples in self._samples.values()
+        )
+
+    def _grow(self, rows: int) -> None:
+        added = rows - self._rows
+        if added <= 0:
+            return
+        for column in self.columns:
+            self._samples[column].extend(array("d", [math.nan]) * (added * self.size))
+            self._cursor[column].extend(array("l", [0]) * added)
+            self._count[column].extend(array("l", [0]) * added)
+        self._rows = rows
+
+    def release(self, indices: Iterable[int]) -> None:
+        size = self.size
+        for index in indices:
+            if index >= self._rows:
+                continue
+            for column in self.columns:
+                self._samples[column][index * size : (index + 1) * size] = (
+                    array("d", [math.nan]) * size
+                )
+                self._cursor[column][index] = 0
+                self._count[column][index] = 0
+
+    def update(
+        self,
+        snapshot: HAProxyStatsSnapshot,
+        previous: HAProxyStatsSnapshot | None,
+    ) -> None:
+        rows = len(snapshot.keys)
+        self._grow(rows)
+        size = self.size
+        present = snapshot.present
+
+        for column in self.columns:
+            values = snapshot.values[column]
+            samples = self._samples[column]
+            cursor = self._cursor[column]
+            count = self._count[column]
+            outputs = []
+            for percentile in self.percentiles:
+                name = percentile_column(column, percentile)
+                old = previous.derived.get(name) if previous is not None else None
+                output = array("d", [math.nan]) * rows
+                if old is not None:
+                    output[: len(old)] = old
+                snapshot.derived[name] = output
+                outputs.append((percentile, output))
+
+            for index in range(rows):
+                value = values[index]
+                if not present[index] or value == MISSING:
+                    continue
+                base = index * size
+                position = cursor[index]
+                evicted = samples[base + position]
+                samples[base + position] = value
+                cursor[index] = (position + 1) % size
+                if count[index] < size:
+                    count[index] += 1
+                elif evicted == value:
+                    continue
+
+                window = sorted(samples[base : base + count[index]])
+                last = len(window) - 1
+                for percentile, output in outputs:
+                    output[index] = window[min(last, (len(window) * percentile) // 100)]
+
+
+class StatsHistory:
+    def __init__(self, columns: Iterable[str], samples: int, memory_limit: int) -> None:
+        self.columns = tuple(columns)
+        self.samples = max(int(samples), 2)
+        row_bytes = len(self.columns) * self.samples * array("d").itemsize
+        self.capacity = max(int(memory_limit) // row_bytes, 1)
+        self.timestamps = array("d", [math.nan]) * self.samples
+        self.evictions = 0
+        self._position = -1
+        self._polls = 0
+        self._data = {column: array("d") for column in self.columns}
+        self._slots: OrderedDict[int, int] = OrderedDict()
+        self._admitted: dict[int, int] = {}
+        self._free: list[int] = []
+        self._allocated = 0
+
+    @property
+    def rows(self) -> int:
+        return len(self._slots)
+
+    @property
+    def memory(self) -> int:
+        return self.timestamps.itemsize * (
+            len(self.timestamps) + sum(len(data) for data in self._data.values())
+        )
+
+    def _clear(self, slot: int) -> None:
+        start = slot * self.samples
+        for data in self._data.values():
+            data[start : start + self.samples] = array("d", [math.nan]) * self.samples
+
+    def _release(self, index: int) -> None:
+        slot = self._slots.pop(index)
+        del self._admitted[index]
+        self._clear(slot)
+        self._free.append(slot)
+
+    def _admit(self, index: int) -> int | None:
+        if self._free:
+            slot = self._free.pop()
+        elif self._allocated < self.capacity:
+            slot = self._allocated
+            self._allocated += 1
+            for data in self._data.values():
+                data.extend(array("d", [math.nan]) * self.samples)
+        elif self._slots:
+            oldest = next(iter(self._slots))
+            if self._polls - self._admitted[oldest] < self.samples:
+                return None
+            slot = self._slots.pop(oldest)
+            del self._admitted[oldest]
+            self.evictions += 1
+            self._clear(slot)
+        else:
+            return None
+        self._slots[index] = slot
+        self._admitted[index] = self._polls
+        return slot
+
+    def record(self, snapshot: HAProxyStatsSnapshot) -> None:
+        self._position = position = (self._position + 1) % self.samples
+        self._polls += 1
+        self.timestamps[position] = snapshot.timestamp
+        present = snapshot.present
+        for index in [
+            index for index in self._slots if index >= len(present) or not present[index]
+        ]:
+            self._release(index)
+        for index in snapshot.rows():
+            if index not in self._slots and self._admit(index) is None:
+                break
+
+        size = self.samples
+        slots = self._slots
+        for column in self.columns:
+            data = self._data[column]
+            values = snapshot.values.get(column)
+            derived = snapshot.derived.get(column)
+            for index, slot in slots.items():
+                number = math.nan
+                if values is not None:
+                    if values[index] != MISSING:
+                        number = values[index]
+                elif derived is not None:
+                    number = derived[index]
+                data[slot * size + position] = number
+
+    def touch(self, index: int) -> int | None:
+        slot = self._slots.get(index)
+        if slot is not None:
+            self._slots.move_to_end(index)
+        return slot
+
+    def query(
+        self,
+        index: int,
+        column: str,
+        window: float | None = None,
+        statistics: Iterable[str] = ("min", "max", "avg"),
+        touch: bool = True,
+    ) -> dict[str, float | int | None]:
+        slot = self.touch(index) if touch else self._slots.get(index)
+        data = self._data.get(column)
+        points: list[float] = []
+        if slot is not None and data is not None and self._position >= 0:
+            cutoff = -math.inf
+            if window:
+                cutoff = self.timestamps[self._position] - window
+            base = slot * self.samples
+            points = sorted(
+                value
+                for value, timestamp in zip(data[base : base + self.samples], self.timestamps)
+                if timestamp >= cutoff and not math.isnan(value)
+            )
+
+        result: dict[str, float | int | None] = {}
+        for statistic in statistics:
+            if statistic == "count":
+                result[statistic] = len(points)
+            elif not points:
+                result[statistic] = None
+            elif statistic == "min":
+                result[statistic] = points[0]
+            elif statistic == "max":
+                result[statistic] = points[-1]
+            elif statistic == "avg":
+                result[statistic] = sum(points) / len(points)
+            elif statistic.startswith("p"):
+                rank = (len(points) * int(statistic[1:])) // 100
+                result[statistic] = points[min(len(points) - 1, rank)]
+        return result
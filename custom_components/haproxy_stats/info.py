@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import html
+import re
+import time
+
+INFO_FIELDS: tuple[str, ...] = (
+    "Version",
+    "Uptime_sec",
+    "CurrConns",
+    "MaxConn",
+    "CumConns",
+    "ConnRate",
+    "SessRate",
+    "SslRate",
+    "CurrSslConns",
+    "Idle_pct",
+    "Memmax_MB",
+    "PoolAlloc_MB",
+    "PoolUsed_MB",
+    "Tasks",
+    "Run_queue",
+)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_PAGE_PATTERNS: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...] = (
+    (re.compile(r"HAProxy version ([^\s,]+)"), ("Version",)),
+    (re.compile(r"uptime = (\d+)d (\d+)h(\d+)m(\d+)s"), ("Uptime_sec",)),
+    (re.compile(r"memmax = (\d+)"), ("Memmax_MB",)),
+    (re.compile(r"maxconn = (\d+)"), ("MaxConn",)),
+    (re.compile(r"current conns = (\d+)"), ("CurrConns",)),
+    (re.compile(r"conn rate = (\d+)/sec"), ("ConnRate",)),
+    (re.compile(r"Running tasks: (\d+)/(\d+)"), ("Run_queue", "Tasks")),
+    (re.compile(r"idle = (\d+) ?%"), ("Idle_pct",)),
+)
+
+PROMETHEUS_INFO_METRICS: dict[str, str] = {
+    "haproxy_process_uptime_seconds": "Uptime_sec",
+    "haproxy_process_current_connections": "CurrConns",
+    "haproxy_process_max_connections": "MaxConn",
+    "haproxy_process_connections_total": "CumConns",
+    "haproxy_process_current_connection_rate": "ConnRate",
+    "haproxy_process_current_session_rate": "SessRate",
+    "haproxy_process_current_ssl_rate": "SslRate",
+    "haproxy_process_current_ssl_connections": "CurrSslConns",
+    "haproxy_process_idle_time_percent": "Idle_pct",
+    "haproxy_process_max_memory_bytes": "Memmax_MB",
+    "haproxy_process_pool_allocated_bytes": "PoolAlloc_MB",
+    "haproxy_process_pool_used_bytes": "PoolUsed_MB",
+    "haproxy_process_current_tasks": "Tasks",
+    "haproxy_process_current_run_queue": "Run_queue",
+}
+_VERSION_LABEL_RE = re.compile(r'version="([^"]*)"')
+
+
+def _number(raw: str) -> int | float | str:
+    try:
+        return int(raw)
+    except ValueError:
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+
+
+def parse_show_info(text: str) -> dict[str, int | float | str]:
+    info: dict[str, int | float | str] = {}
+    for line in text.splitlines():
+        name, separator, value = line.partition(":")
+        if not separator:
+            continue
+        name = name.strip()
+        if name in INFO_FIELDS:
+            value = value.strip()
+            info[name] = value if name == "Version" else _number(value)
+    return info
+
+
+def parse_stats_page(page: str) -> dict[str, int | float | str]:
+    text = html.unescape(_TAG_RE.sub(" ", page))
+    text = re.sub(r"[ \t]+", " ", text)
+    info: dict[str, int | float | str] = {}
+    for pattern, fields in _PAGE_PATTERNS:
+        match = pattern.search(text)
+        if match is None:
+            continue
+        if fields == ("Uptime_sec",):
+            days, hours, minutes, seconds = (int(group) for group in match.groups())
+            info["Uptime_sec"] = ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+            continue
+        for field, value in zip(fields, match.groups()):
+            info[field] = value if field == "Version" else _number(value)
+    return info
+
+
+def parse_prometheus_info(text: str) -> dict[str, int | float | str]:
+    info: dict[str, int | float | str] = {}
+    for line in text.splitlines():
+        if not line.startswith("haproxy_process_"):
+            continue
+        name, _, rest = line.partition(" ")
+        metric, _, labels = name.partition("{")
+        if metric == "haproxy_process_build_info":
+            match = _VERSION_LABEL_RE.search(line)
+            if match is not None:
+                info["Version"] = match.group(1)
+            continue
+        value = line.rpartition("}")[2].split() if labels else rest.split()
+        if not value:
+            continue
+        number = _number(value[0])
+        if isinstance(number, str):
+            continue
+        if metric == "haproxy_process_start_time_seconds":
+            info.setdefault("Uptime_sec", int(time.time() - number))
+            continue
+        field = PROMETHEUS_INFO_METRICS.get(metric)
+        if field is None:
+            continue
+        if metric.endswith("_bytes"):
+            number = round(number / 1048576)
+        elif isinstance(number, float) and number.is_integer():
+            number = int(number)
+        info[field] = number
+    return info
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import csv
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+
+from .const import PROMETHEUS_COLUMNS, PROMETHEUS_LABEL_FILTERS, PROMETHEUS_MILLISECOND_METRICS
+
+RowFilter = Callable[[str, str], bool]
+
+PROMETHEUS_ROW_NAMES = {"frontend": "FRONTEND", "backend": "BACKEND", "server": ""}
+PROMETHEUS_STATUS_CODES = {
+    "frontend": ("STOP", "OPEN"),
+    "backend": ("DOWN", "UP"),
+    "server": ("DOWN", "UP", "MAINT", "DRAIN", "NOLB"),
+}
+PROMETHEUS_FRONTEND_STATES = {"UP": "OPEN", "DOWN": "STOP"}
+_LABEL_RE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def _milliseconds(raw: str) -> str:
+    try:
+        return str(round(float(raw) * 1000))
+    except ValueError:
+        return ""
+
+
+class _LineParser(ABC):
+    def __init__(self, columns: Iterable[str], row_filter: RowFilter | None = None) -> None:
+        self._columns = tuple(columns)
+        self._row_filter = row_filter
+        self._buffer = b""
+        self._rows: list[tuple[str, ...]] = []
+        self._decode_time = 0.0
+        self._parse_time = 0.0
+        self._size = 0
+        self.timings: dict[str, float] = {}
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._columns
+
+    def feed(self, chunk: bytes) -> None:
+        self._size += len(chunk)
+        if self._buffer:
+            chunk = self._buffer + chunk
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            self._buffer = chunk
+            return
+        self._buffer = chunk[end + 1 :]
+        self._parse_text(chunk[:end])
+
+    def close(self) -> list[tuple[str, ...]]:
+        if self._buffer:
+            self._parse_text(self._buffer)
+            self._buffer = b""
+        started = time.perf_counter()
+        self._finish()
+        self._parse_time += time.perf_counter() - started
+        rows = self._rows
+        self._rows = []
+        self.timings = {
+            "decode": self._decode_time,
+            "parse": self._parse_time,
+            "bytes": self._size,
+        }
+        self._reset_timings()
+        return rows
+
+    def reset(self) -> None:
+        self._buffer = b""
+        self._rows = []
+        self._reset_timings()
+
+    def _reset_timings(self) -> None:
+        self._decode_time = 0.0
+        self._parse_time = 0.0
+        self._size = 0
+
+    def _parse_text(self, data: bytes) -> None:
+        started = time.perf_counter()
+        text = data.decode("utf-8", "replace")
+        decoded = time.perf_counter()
+        for line in text.split("\n"):
+            self._parse_line(line.rstrip("\r"))
+        self._decode_time += decoded - started
+        self._parse_time += time.perf_counter() - decoded
+
+    def parse(self, text: str) -> list[tuple[str, ...]]:
+        self.feed(text.encode())
+        return self.close()
+
+    @abstractmethod
+    def _parse_line(self, line: str) -> None:
+        pass
+
+    @abstractmethod
+    def _finish(self) -> None:
+        pass
+
+
+class HAProxyCsvParser(_LineParser):
+    def __init__(self, columns: Iterable[str], row_filter: RowFilter | None = None) -> None:
+        super().__init__(columns, row_filter)
+        self._header_line: str | None = None
+        self._indices: tuple[int, ...] = ()
+        self._pxname_index = -1
+        self._svname_index = -1
+
+    def _parse_line(self, line: str) -> None:
+        if not line.strip():
+            return
+
+        if line.startswith("#"):
+            if line != self._header_line:
+                self._set_header(line)
+            return
+
+        if self._header_line is None:
+            return
+
+        if '"' in line:
+            fields = next(csv.reader([line]))
+        else:
+            fields = line.split(",")
+
+        count = len(fields)
+        pxname = fields[self._pxname_index] if 0 <= self._pxname_index < count else ""
+        svname = fields[self._svname_index] if 0 <= self._svname_index < count else ""
+        if not pxname or not svname:
+            return
+        if self._row_filter is not None and not self._row_filter(pxname, svname):
+            return
+
+        self._rows.append(
+            tuple(fields[index] if 0 <= index < count else "" for index in self._indices)
+        )
+
+    def _set_header(self, line: str) -> None:
+        header = next(csv.reader([line.lstrip("# ")]))
+        positions = {name.strip(): index for index, name in enumerate(header)}
+        self._header_line = line
+        self._indices = tuple(positions.get(column, -1) for column in self._columns)
+        self._pxname_index = positions.get("pxname", -1)
+        self._svname_index = positions.get("svname", -1)
+
+    def _finish(self) -> None:
+        pass
+
+
+class HAProxyTypedParser(_LineParser):
+    def __init__(self, columns: Iterable[str], row_filter: RowFilter | None = None) -> None:
+        super().__init__(columns, row_filter)
+        self._positions = {column: index for index, column in enumerate(self._columns)}
+        self._object: str | None = None
+        self._fields: list[str] = []
+
+    def reset(self) -> None:
+        super().reset()
+        self._object = None
+
+    def _parse_line(self, line: str) -> None:
+        name, _, rest = line.partition(":")
+        _tags, _, rest = rest.partition(":")
+        _type, _, value = rest.partition(":")
+        parts = name.split(".")
+        if len(parts) < 5:
+            return
+
+        obj = ".".join(parts[:3])
+        if obj != self._object:
+            self._finish()
+            self._object = obj
+            self._fields = [""] * len(self._columns)
+
+        position = self._positions.get(parts[4])
+        if position is not None:
+            self._fields[position] = value
+
+    def _finish(self) -> None:
+        if self._object is None:
+            return
+        self._object = None
+        fields = tuple(self._fields)
+        pxname = self._positions.get("pxname")
+        svname = self._positions.get("svname")
+        if pxname is None or svname is None or not fields[pxname] or not fields[svname]:
+            return
+        if self._row_filter is not None and not self._row_filter(fields[pxname], fields[svname]):
+            return
+        self._rows.append(fields)
+
+
+class HAProxyPrometheusParser(_LineParser):
+    def __init__(self, columns: Iterable[str], row_filter: RowFilter | None = None) -> None:
+        super().__init__(columns, row_filter)
+        positions = {column: index for index, column in enumerate(self._columns)}
+        self._pxname_index = positions.get("pxname", -1)
+        self._svname_index = positions.get("svname", -1)
+        self._status_index = positions.get("status", -1)
+        self._metrics: dict[str, tuple[str, int, str]] = {}
+        for kind in PROMETHEUS_ROW_NAMES:
+            for suffix, column in PROMETHEUS_COLUMNS.items():
+                position = positions.get(column)
+                if position is not None:
+                    self._metrics[f"haproxy_{kind}_{suffix}"] = (kind, position, suffix)
+        self._records: dict[tuple[str, str], list[str] | None] = {}
+
+    def reset(self) -> None:
+        super().reset()
+        self._records = {}
+
+    def _parse_line(self, line: str) -> None:
+        if not line or line[0] == "#":
+            return
+        brace = line.find("{")
+        if brace < 0:
+            return
+        metric = self._metrics.get(line[:brace])
+        if metric is None:
+            return
+        end = line.rfind("}")
+        value = line[end + 1 :].split()
+        if end < brace or not value:
+            return
+
+        kind, position, suffix = metric
+        labels = dict(_LABEL_RE.findall(line, brace, end))
+        pxname = labels.get("proxy", "")
+        svname = PROMETHEUS_ROW_NAMES[kind] or labels.get("server", "")
+        if not pxname or not svname:
+            return
+        label_filter = PROMETHEUS_LABEL_FILTERS.get(suffix)
+        if label_filter is not None and labels.get(label_filter[0]) != label_filter[1]:
+            return
+
+        key = (pxname, svname)
+        try:
+            fields = self._records[key]
+        except KeyError:
+            fields = None
+            if self._row_filter is None or self._row_filter(pxname, svname):
+                fields = [""] * len(self._columns)
+                if self._pxname_index >= 0:
+                    fields[self._pxname_index] = pxname
+                if self._svname_index >= 0:
+                    fields[self._svname_index] = svname
+            self._records[key] = fields
+        if fields is None:
+            return
+
+        if position == self._status_index:
+            status = self._status(kind, labels.get("state"), value[0])
+            if status:
+                fields[position] = status
+        elif suffix in PROMETHEUS_MILLISECOND_METRICS:
+            fields[position] = _milliseconds(value[0])
+        else:
+            fields[position] = value[0]
+
+    @staticmethod
+    def _status(kind: str, state: str | None, raw: str) -> str:
+        try:
+            number = int(float(raw))
+        except ValueError:
+            return ""
+        if state is not None:
+            if number <= 0:
+                return ""
+            if kind == "frontend":
+                return PROMETHEUS_FRONTEND_STATES.get(state, state)
+            return state
+        codes = PROMETHEUS_STATUS_CODES[kind]
+        return codes[number] if 0 <= number < len(codes) else ""
+
+    def _finish(self) -> None:
+        records = self._records
+        self._records = {}
+        self._rows.extend(tuple(fields) for fields in records.values() if fields is not None)
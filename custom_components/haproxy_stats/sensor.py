@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -9,19 +12,47 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfInformation
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    Platform,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
+    BACKEND_AGGREGATE_COLUMNS,
+    CONF_METRICS,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_THROTTLE_WRITES,
+    DEFAULT_MIN_WRITE_INTERVAL,
+    DEFAULT_THROTTLE_WRITES,
+    HISTORY_ATTRIBUTE_STATISTICS,
+    LATENCY_PERCENTILES,
+    LATENCY_STAT_COLUMNS,
+    THROTTLE_MAX_STALENESS,
+    WRITE_GROUP_COUNTER,
+    WRITE_GROUP_DEFAULTS,
+    WRITE_GROUP_LATENCY,
+    WRITE_GROUP_OPTIONS,
+    WRITE_GROUP_RATE,
     CONF_DATA_SIZE_UNIT,
     DATA_SIZE_UNIT_FACTORS,
     DEFAULT_DATA_SIZE_UNIT,
 )
-from .coordinator import HAProxyStatsCoordinator
-from .entity import HAProxyStatsEntity
+from .coordinator import TIMINGS_CONTEXT, HAProxyInfoCoordinator, HAProxyStatsCoordinator
+from .entity import (
+    HAProxyEntryEntity,
+    HAProxyStatsEntity,
+    async_add_entities_batched,
+    async_remove_row_entities,
+    row_unique_id,
+)
+from .history import percentile_column
 
 HA_DATA_SIZE_UNITS = {
     "B": UnitOfInformation.BYTES,
@@ -31,11 +62,68 @@ HA_DATA_SIZE_UNITS = {
     "TB": UnitOfInformation.TERABYTES,
 }
 
+HA_DATA_RATE_UNITS = {
+    "B": UnitOfDataRate.BYTES_PER_SECOND,
+    "kB": UnitOfDataRate.KILOBYTES_PER_SECOND,
+    "MB": UnitOfDataRate.MEGABYTES_PER_SECOND,
+    "GB": UnitOfDataRate.GIGABYTES_PER_SECOND,
+    "TB": UnitOfDataRate.GIGABYTES_PER_SECOND,
+}
+
+DATA_RATE_UNIT_FACTORS: dict[str, float] = {
+    **DATA_SIZE_UNIT_FACTORS,
+    "TB": DATA_SIZE_UNIT_FACTORS["GB"],
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class HAProxySensorEntityDescription(SensorEntityDescription):
-    parse_int: bool = True
     is_data_size: bool = False
+    is_data_rate: bool = False
+    write_group: str | None = None
+    only_svname: str | None = None
+    exclude_svnames: tuple[str, ...] = ()
+
+
+def write_thresholds(options: Mapping[str, Any], group: str) -> tuple[float, float, float]:
+    interval, change, relative_change = WRITE_GROUP_DEFAULTS[group]
+    interval = float(options.get(CONF_MIN_WRITE_INTERVAL, DEFAULT_MIN_WRITE_INTERVAL)) or interval
+    interval_key, change_key, relative_change_key = WRITE_GROUP_OPTIONS[group]
+    return (
+        float(options.get(interval_key, interval)),
+        float(options.get(change_key, change)),
+        float(options.get(relative_change_key, relative_change)),
+    )
+
+
+def _latency_description(
+    key: str, translation_key: str, name: str, enabled: bool = True
+) -> HAProxySensorEntityDescription:
+    return HAProxySensorEntityDescription(
+        key=key,
+        translation_key=translation_key,
+        name=name,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=enabled,
+        write_group=WRITE_GROUP_LATENCY,
+        exclude_svnames=("FRONTEND",),
+    )
+
+
+def _backend_count_description(
+    key: str, name: str, icon: str
+) -> HAProxySensorEntityDescription:
+    return HAProxySensorEntityDescription(
+        key=key,
+        translation_key=key,
+        name=name,
+        icon=icon,
+        native_unit_of_measurement="servers",
+        state_class=SensorStateClass.MEASUREMENT,
+        only_svname="BACKEND",
+    )
 
 
 SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
@@ -59,6 +147,7 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         name="Total Sessions",
         icon="mdi:counter",
         state_class=SensorStateClass.TOTAL_INCREASING,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="bin",
@@ -67,9 +156,9 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DATA_SIZE,
         native_unit_of_measurement=UnitOfInformation.MEGABYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        parse_int=False,
         is_data_size=True,
         suggested_display_precision=2,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="bout",
@@ -78,9 +167,9 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DATA_SIZE,
         native_unit_of_measurement=UnitOfInformation.MEGABYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        parse_int=False,
         is_data_size=True,
         suggested_display_precision=2,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="rate",
@@ -96,6 +185,7 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         icon="mdi:alert-circle",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="eresp",
@@ -104,6 +194,7 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         icon="mdi:alert-circle-outline",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="econ",
@@ -112,6 +203,7 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         icon="mdi:alert-circle",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="wretr",
@@ -120,6 +212,7 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         icon="mdi:alert-circle",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        write_group=WRITE_GROUP_COUNTER,
     ),
     HAProxySensorEntityDescription(
         key="wredis",
@@ -128,7 +221,316 @@ SENSOR_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = (
         icon="mdi:alert-circle",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        write_group=WRITE_GROUP_COUNTER,
+    ),
+    HAProxySensorEntityDescription(
+        key="stot_rate",
+        translation_key="sessions_per_second",
+        name="Sessions per Second",
+        icon="mdi:chart-line",
+        native_unit_of_measurement="sessions/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        write_group=WRITE_GROUP_RATE,
+    ),
+    HAProxySensorEntityDescription(
+        key="bin_rate",
+        translation_key="bytes_in_rate",
+        name="Bytes In Rate",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.MEGABYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        is_data_rate=True,
+        suggested_display_precision=2,
+        write_group=WRITE_GROUP_RATE,
+    ),
+    HAProxySensorEntityDescription(
+        key="bout_rate",
+        translation_key="bytes_out_rate",
+        name="Bytes Out Rate",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.MEGABYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        is_data_rate=True,
+        suggested_display_precision=2,
+        write_group=WRITE_GROUP_RATE,
+    ),
+    HAProxySensorEntityDescription(
+        key="errors_rate",
+        translation_key="errors_per_second",
+        name="Errors per Second",
+        icon="mdi:alert-circle",
+        native_unit_of_measurement="errors/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=2,
+        write_group=WRITE_GROUP_RATE,
+    ),
+    _latency_description("qtime", "queue_time", "Queue Time", False),
+    _latency_description("ctime", "connect_time", "Connect Time", False),
+    _latency_description("rtime", "response_time", "Response Time"),
+    _latency_description("ttime", "total_time", "Total Time"),
+    HAProxySensorEntityDescription(
+        key="qcur",
+        translation_key="queue",
+        name="Queue",
+        icon="mdi:tray-full",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        exclude_svnames=("FRONTEND",),
+    ),
+    HAProxySensorEntityDescription(
+        key="qmax",
+        translation_key="queue_max",
+        name="Max Queue",
+        icon="mdi:tray-plus",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        exclude_svnames=("FRONTEND",),
+    ),
+    HAProxySensorEntityDescription(
+        key="hrsp_5xx",
+        translation_key="responses_5xx",
+        name="5xx Responses",
+        icon="mdi:alert-octagon",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        write_group=WRITE_GROUP_COUNTER,
+    ),
+    HAProxySensorEntityDescription(
+        key="check_duration",
+        translation_key="check_duration",
+        name="Health Check Duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        write_group=WRITE_GROUP_RATE,
+        exclude_svnames=("FRONTEND", "BACKEND"),
+    ),
+    HAProxySensorEntityDescription(
+        key="lastchg",
+        translation_key="last_status_change",
+        name="Time Since Status Change",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        write_group=WRITE_GROUP_COUNTER,
+        exclude_svnames=("FRONTEND",),
+    ),
+    _backend_count_description("servers_up", "Servers Up", "mdi:server"),
+    _backend_count_description("servers_down", "Servers Down", "mdi:server-off"),
+    _backend_count_description("servers_maint", "Servers in Maintenance", "mdi:server-minus"),
+    _backend_count_description("servers_drain", "Servers Draining", "mdi:server-remove"),
+    _backend_count_description("servers_active", "Active Servers Up", "mdi:server-network"),
+    _backend_count_description("servers_backup", "Backup Servers Up", "mdi:server-security"),
+    HAProxySensorEntityDescription(
+        key="capacity",
+        translation_key="capacity",
+        name="Capacity",
+        icon="mdi:gauge",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        only_svname="BACKEND",
     ),
+    HAProxySensorEntityDescription(
+        key="queue_total",
+        translation_key="queue_total",
+        name="Queued Requests",
+        icon="mdi:tray-full",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        only_svname="BACKEND",
+    ),
+)
+
+LATENCY_NAMES = {
+    "qtime": ("queue_time", "Queue Time"),
+    "ctime": ("connect_time", "Connect Time"),
+    "rtime": ("response_time", "Response Time"),
+    "ttime": ("total_time", "Total Time"),
+}
+
+LATENCY_PERCENTILE_DESCRIPTIONS: tuple[HAProxySensorEntityDescription, ...] = tuple(
+    HAProxySensorEntityDescription(
+        key=percentile_column(column, percentile),
+        translation_key=f"{LATENCY_NAMES[column][0]}_p{percentile}",
+        name=f"{LATENCY_NAMES[column][1]} p{percentile}",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=percentile == 95 and column in ("rtime", "ttime"),
+        exclude_svnames=("FRONTEND",),
+    )
+    for column in LATENCY_STAT_COLUMNS
+    for percentile in LATENCY_PERCENTILES
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HAProxyTimingSensorEntityDescription(SensorEntityDescription):
+    timing: str
+
+
+def _duration_description(
+    key: str, timing: str, name: str, enabled: bool = False
+) -> HAProxyTimingSensorEntityDescription:
+    return HAProxyTimingSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        name=name,
+        timing=timing,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=enabled,
+        suggested_display_precision=1,
+    )
+
+
+TIMING_SENSOR_DESCRIPTIONS: tuple[HAProxyTimingSensorEntityDescription, ...] = (
+    _duration_description("refresh_duration", "total", "Refresh Duration", True),
+    _duration_description("dns_duration", "dns", "DNS Lookup Duration"),
+    _duration_description("connect_duration", "connect", "Connect Duration"),
+    _duration_description("first_byte_duration", "ttfb", "Time to First Byte"),
+    _duration_description("body_duration", "body", "Body Download Duration"),
+    _duration_description("decode_duration", "decode", "Decode Duration"),
+    _duration_description("parse_duration", "parse", "Parse Duration"),
+    _duration_description("diff_duration", "diff", "Diff Duration"),
+    _duration_description("dispatch_duration", "dispatch", "Dispatch Duration"),
+    _duration_description("offload_duration", "offload", "Offloaded Parse Duration"),
+    _duration_description("loop_blocking_duration", "blocking", "Event Loop Blocking"),
+    HAProxyTimingSensorEntityDescription(
+        key="payload_size",
+        translation_key="payload_size",
+        name="Payload Size",
+        timing="bytes",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    HAProxyTimingSensorEntityDescription(
+        key="suppressed_writes",
+        translation_key="suppressed_writes",
+        name="Suppressed State Writes",
+        timing="suppressed",
+        icon="mdi:database-minus",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    HAProxyTimingSensorEntityDescription(
+        key="row_count",
+        translation_key="row_count",
+        name="Rows",
+        timing="rows",
+        icon="mdi:table-row",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HAProxyInfoSensorEntityDescription(SensorEntityDescription):
+    field: str
+
+
+def _info_description(
+    key: str, field: str, name: str, icon: str, unit: str | None = None, enabled: bool = True
+) -> HAProxyInfoSensorEntityDescription:
+    return HAProxyInfoSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        name=name,
+        field=field,
+        icon=icon,
+        native_unit_of_measurement=unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=enabled,
+    )
+
+
+INFO_SENSOR_DESCRIPTIONS: tuple[HAProxyInfoSensorEntityDescription, ...] = (
+    HAProxyInfoSensorEntityDescription(
+        key="process_version",
+        translation_key="process_version",
+        name="Version",
+        field="Version",
+        icon="mdi:tag",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    HAProxyInfoSensorEntityDescription(
+        key="process_uptime",
+        translation_key="process_uptime",
+        name="Uptime",
+        field="Uptime_sec",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    _info_description(
+        "process_current_connections", "CurrConns", "Current Connections", "mdi:lan-connect"
+    ),
+    _info_description("process_max_connections", "MaxConn", "Max Connections", "mdi:lan-check"),
+    HAProxyInfoSensorEntityDescription(
+        key="process_total_connections",
+        translation_key="process_total_connections",
+        name="Total Connections",
+        field="CumConns",
+        icon="mdi:counter",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    _info_description(
+        "process_connection_rate", "ConnRate", "Connection Rate", "mdi:speedometer", "1/s"
+    ),
+    _info_description("process_session_rate", "SessRate", "Session Rate", "mdi:speedometer", "1/s"),
+    _info_description("process_ssl_rate", "SslRate", "SSL Rate", "mdi:lock", "1/s", False),
+    _info_description(
+        "process_ssl_connections",
+        "CurrSslConns",
+        "Current SSL Connections",
+        "mdi:lock",
+        enabled=False,
+    ),
+    _info_description("process_idle", "Idle_pct", "Idle", "mdi:gauge", PERCENTAGE),
+    HAProxyInfoSensorEntityDescription(
+        key="process_memory_limit",
+        translation_key="process_memory_limit",
+        name="Memory Limit",
+        field="Memmax_MB",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    HAProxyInfoSensorEntityDescription(
+        key="process_pool_allocated",
+        translation_key="process_pool_allocated",
+        name="Pool Memory Allocated",
+        field="PoolAlloc_MB",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    HAProxyInfoSensorEntityDescription(
+        key="process_pool_used",
+        translation_key="process_pool_used",
+        name="Pool Memory Used",
+        field="PoolUsed_MB",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.MEGABYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+    ),
+    _info_description("process_tasks", "Tasks", "Tasks", "mdi:format-list-checks", enabled=False),
+    _info_description("process_run_queue", "Run_queue", "Run Queue", "mdi:tray-full"),
 )
 
 
@@ -140,33 +542,172 @@ async def async_setup_entry(
     coordinator: HAProxyStatsCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     entities_known: set[str] = hass.data[DOMAIN][entry.entry_id]["entities_known"]
 
-    entities: list[HAProxyStatsSensor] = []
+    metrics = set(entry.options.get(CONF_METRICS, ()))
+    descriptions = [
+        description
+        for description in SENSOR_DESCRIPTIONS
+        if not metrics or description.key in metrics
+    ]
+    if coordinator.latency_history is not None:
+        descriptions.extend(
+            description
+            for description in LATENCY_PERCENTILE_DESCRIPTIONS
+            if not metrics or description.key in metrics
+        )
+
+    def row_entities(rows: Iterable[int]) -> list[HAProxyStatsSensor]:
+        entities: list[HAProxyStatsSensor] = []
+        for row_index in rows:
+            row_key = coordinator.data.keys[row_index]
+            svname = coordinator.data.svname[row_index].upper()
+            for description in descriptions:
+                if description.only_svname and svname != description.only_svname:
+                    continue
+                if svname in description.exclude_svnames:
+                    continue
+                unique_id = row_unique_id(entry, row_key, description.key)
+                if unique_id in entities_known:
+                    continue
+                entities.append(HAProxyStatsSensor(coordinator, entry, row_index, description))
+                entities_known.add(unique_id)
+        return entities
+
+    @callback
+    def async_rows_changed(added: set[int], removed: set[int]) -> None:
+        async_remove_row_entities(
+            hass,
+            Platform.SENSOR,
+            entry,
+            (coordinator.data.keys[row_index] for row_index in removed),
+            (
+                description.key
+                for description in (*SENSOR_DESCRIPTIONS, *LATENCY_PERCENTILE_DESCRIPTIONS)
+            ),
+            entities_known,
+        )
+        entities = row_entities(sorted(added))
+        if entities:
+            async_add_entities(entities)
 
-    for row_key in coordinator.data:
-        for description in SENSOR_DESCRIPTIONS:
-            unique_id = f"{entry.entry_id}_{row_key}_{description.key}"
-            if unique_id in entities_known:
-                continue
-            entities.append(HAProxyStatsSensor(coordinator, entry, row_key, description))
-            entities_known.add(unique_id)
+    async_add_entities(
+        HAProxyTimingSensor(coordinator, entry, description)
+        for description in TIMING_SENSOR_DESCRIPTIONS
+    )
 
-    async_add_entities(entities)
+    info_coordinator: HAProxyInfoCoordinator = hass.data[DOMAIN][entry.entry_id][
+        "info_coordinator"
+    ]
+    nodes = list(info_coordinator.transports) if len(info_coordinator.transports) > 1 else [""]
+    async_add_entities(
+        HAProxyInfoSensor(info_coordinator, entry, description, node)
+        for node in nodes
+        for description in INFO_SENSOR_DESCRIPTIONS
+    )
+
+    started = time.perf_counter()
+    entities = row_entities(coordinator.data.rows())
+    coordinator.startup[Platform.SENSOR] = {
+        "entities": len(entities),
+        "build_ms": (time.perf_counter() - started) * 1000,
+    }
+    entry.async_on_unload(coordinator.async_add_row_listener(async_rows_changed))
+    await async_add_entities_batched(async_add_entities, entities)
 
 
 class HAProxyStatsSensor(HAProxyStatsEntity, SensorEntity):
+    _unrecorded_attributes = frozenset(
+        f"history_{statistic}" for statistic in HISTORY_ATTRIBUTE_STATISTICS
+    )
+
     def __init__(
         self,
         coordinator: HAProxyStatsCoordinator,
         entry: ConfigEntry,
-        row_key: str,
+        row_index: int,
         description: HAProxySensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator, entry, row_key, description)
-        self._attr_unique_id = f"{entry.entry_id}_{row_key}_{description.key}"
+        super().__init__(coordinator, entry, row_index, description)
+        self._attr_unique_id = row_unique_id(entry, self._row_key, description.key)
         self._data_size_unit = entry.options.get(
             CONF_DATA_SIZE_UNIT,
             entry.data.get(CONF_DATA_SIZE_UNIT, DEFAULT_DATA_SIZE_UNIT),
         )
+        self._min_write_interval = 0.0
+        self._min_change = 0.0
+        self._min_relative_change = 0.0
+        if description.write_group is not None:
+            (
+                self._min_write_interval,
+                self._min_change,
+                self._min_relative_change,
+            ) = write_thresholds(entry.options, description.write_group)
+            self._min_relative_change /= 100
+        self._throttled = bool(
+            entry.options.get(CONF_THROTTLE_WRITES, DEFAULT_THROTTLE_WRITES)
+            and (self._min_change or self._min_relative_change or self._min_write_interval)
+        )
+        self._written: tuple[bool, int | float | None] | None = None
+        self._written_at = 0.0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._throttled:
+            state = (
+                self.available,
+                self.coordinator.data.value(self._row_index, self.entity_description.key),
+            )
+            if state == self._written:
+                return
+            now = time.monotonic()
+            if not self._significant(state, now):
+                self.coordinator.async_defer_write(self.coordinator_context)
+                return
+            self._written = state
+            self._written_at = now
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        if not super().available:
+            return False
+        key = self.entity_description.key
+        if key not in BACKEND_AGGREGATE_COLUMNS or not self._present:
+            return True
+        return self.coordinator.data.value(self._row_index, key) is not None
+
+    def _significant(self, state: tuple[bool, int | float | None], now: float) -> bool:
+        written = self._written
+        if written is None or state[0] != written[0]:
+            return True
+        value = state[1]
+        last = written[1]
+        if value is None or last is None:
+            return True
+        if now - self._written_at < self._min_write_interval:
+            return False
+        if now - self._written_at >= THROTTLE_MAX_STALENESS:
+            return True
+
+        change = abs(value - last)
+        if change < self._min_change:
+            return False
+        if last and change < abs(last) * self._min_relative_change:
+            return False
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | int | None] | None:
+        history = self.coordinator.history
+        key = self.entity_description.key
+        if history is None or key not in history.columns:
+            return None
+        return {
+            f"history_{statistic}": value
+            for statistic, value in history.query(
+                self._row_index, key, statistics=HISTORY_ATTRIBUTE_STATISTICS, touch=False
+            ).items()
+        }
 
     @property
     def native_unit_of_measurement(self):
@@ -179,38 +720,92 @@ class HAProxyStatsSensor(HAProxyStatsEntity, SensorEntity):
                 UnitOfInformation.MEGABYTES,
             )
 
+        if (
+            isinstance(self.entity_description, HAProxySensorEntityDescription)
+            and self.entity_description.is_data_rate
+        ):
+            return HA_DATA_RATE_UNITS.get(
+                self._data_size_unit,
+                UnitOfDataRate.MEGABYTES_PER_SECOND,
+            )
+
         return self.entity_description.native_unit_of_measurement
 
     @property
     def native_value(self):
-        row = self._row
-        if row is None:
-            return None
-
-        raw = row.get(self.entity_description.key)
-        if raw in (None, ""):
+        value = self.coordinator.data.value(self._row_index, self.entity_description.key)
+        if value is None:
             return None
 
         if (
             isinstance(self.entity_description, HAProxySensorEntityDescription)
             and self.entity_description.is_data_size
         ):
-            try:
-                bytes_value = float(raw)
-                factor = DATA_SIZE_UNIT_FACTORS.get(self._data_size_unit)
-                if not factor:
-                    return None
-                return bytes_value / factor
-            except ValueError:
+            factor = DATA_SIZE_UNIT_FACTORS.get(self._data_size_unit)
+            if not factor:
                 return None
+            return value / factor
 
         if (
             isinstance(self.entity_description, HAProxySensorEntityDescription)
-            and self.entity_description.parse_int
+            and self.entity_description.is_data_rate
         ):
-            try:
-                return int(float(raw))
-            except ValueError:
+            factor = DATA_RATE_UNIT_FACTORS.get(self._data_size_unit)
+            if not factor:
                 return None
+            return value / factor
+
+        return value
+
+
+class HAProxyTimingSensor(HAProxyEntryEntity, SensorEntity):
+    def __init__(
+        self,
+        coordinator: HAProxyStatsCoordinator,
+        entry: ConfigEntry,
+        description: HAProxyTimingSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry, description, TIMINGS_CONTEXT)
+
+    @property
+    def native_value(self):
+        timings = self.coordinator.last_timings
+        if timings is None:
+            return None
+        return timings.get(self.entity_description.timing)
+
+
+class HAProxyInfoSensor(HAProxyEntryEntity, SensorEntity):
+    def __init__(
+        self,
+        coordinator: HAProxyInfoCoordinator,
+        entry: ConfigEntry,
+        description: HAProxyInfoSensorEntityDescription,
+        node: str,
+    ) -> None:
+        super().__init__(coordinator, entry, description, node=node)
+
+    @property
+    def _info(self) -> dict | None:
+        data = self.coordinator.data
+        if not data:
+            return None
+        if self._node:
+            return data.get(self._node)
+        return next(iter(data.values()), None)
+
+    @property
+    def available(self) -> bool:
+        info = self._info
+        return (
+            super().available
+            and info is not None
+            and self.entity_description.field in info
+        )
 
-        return raw
+    @property
+    def native_value(self):
+        info = self._info
+        if info is None:
+            return None
+        return info.get(self.entity_description.field)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Collection
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    HISTORY_ATTRIBUTE_STATISTICS,
+    HISTORY_STATISTICS,
+    RUNTIME_SERVER_STATES,
+)
+from .transport import HAProxyTransportError
+
+SERVICE_QUERY_HISTORY = "query_history"
+SERVICE_SET_SERVER_STATE = "set_server_state"
+SERVICE_SET_WEIGHT = "set_weight"
+SERVICE_DISABLE_HEALTH_CHECK = "disable_health_check"
+SERVICE_CLEAR_COUNTERS = "clear_counters"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PROXY = "proxy"
+ATTR_SERVER = "server"
+ATTR_NODE = "node"
+ATTR_COLUMNS = "columns"
+ATTR_WINDOW = "window"
+ATTR_STATISTICS = "statistics"
+ATTR_SERVERS = "servers"
+ATTR_STATE = "state"
+ATTR_WEIGHT = "weight"
+ATTR_ALL = "all"
+
+SERVER_RE = re.compile(r"^[A-Za-z0-9_.:-]+/[A-Za-z0-9_.:-]+$")
+
+QUERY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PROXY): cv.string,
+        vol.Optional(ATTR_SERVER, default="BACKEND"): cv.string,
+        vol.Optional(ATTR_NODE, default=""): cv.string,
+        vol.Optional(ATTR_COLUMNS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_WINDOW): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_STATISTICS, default=list(HISTORY_ATTRIBUTE_STATISTICS)): vol.All(
+            cv.ensure_list, [vol.In(HISTORY_STATISTICS)]
+        ),
+    }
+)
+
+RUNTIME_SCHEMA = {
+    vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_NODE): cv.string,
+}
+SERVERS_SCHEMA = {
+    **RUNTIME_SCHEMA,
+    vol.Required(ATTR_SERVERS): vol.All(
+        cv.ensure_list, vol.Length(min=1), [vol.All(cv.string, vol.Match(SERVER_RE))]
+    ),
+}
+SET_SERVER_STATE_SCHEMA = vol.Schema(
+    {**SERVERS_SCHEMA, vol.Required(ATTR_STATE): vol.In(RUNTIME_SERVER_STATES)}
+)
+SET_WEIGHT_SCHEMA = vol.Schema(
+    {
+        **SERVERS_SCHEMA,
+        vol.Required(ATTR_WEIGHT): vol.All(vol.Coerce(int), vol.Range(min=0, max=256)),
+    }
+)
+DISABLE_HEALTH_CHECK_SCHEMA = vol.Schema(SERVERS_SCHEMA)
+CLEAR_COUNTERS_SCHEMA = vol.Schema(
+    {**RUNTIME_SCHEMA, vol.Optional(ATTR_ALL, default=False): cv.boolean}
+)
+
+
+def _servers(call: ServiceCall) -> list[tuple[str, str]]:
+    return list(
+        dict.fromkeys(tuple(server.split("/", 1)) for server in call.data[ATTR_SERVERS])
+    )
+
+
+async def _async_run_commands(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    commands: Collection[str],
+    servers: Collection[tuple[str, str]] | None,
+) -> None:
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    node = call.data.get(ATTR_NODE)
+    data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if data is None or not data["coordinator"].runtime_transports:
+        raise ServiceValidationError(
+            "Runtime actions need a loaded HAProxy entry with the socket transport"
+        )
+    coordinator = data["coordinator"]
+    if node and node not in coordinator.runtime_transports:
+        raise ServiceValidationError(f"Unknown HAProxy node: {node}")
+
+    try:
+        await coordinator.async_run_commands(commands, servers, node)
+    except HAProxyTransportError as err:
+        raise HomeAssistantError(f"HAProxy rejected the runtime command: {err}") from err
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def async_query_history(call: ServiceCall) -> ServiceResponse:
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        proxy = call.data[ATTR_PROXY]
+        server = call.data[ATTR_SERVER]
+        node = call.data[ATTR_NODE]
+        key = f"{proxy}:{server}@{node}" if node else f"{proxy}:{server}"
+
+        enabled = False
+        rows = []
+        for loaded_entry_id, data in hass.data.get(DOMAIN, {}).items():
+            if entry_id and loaded_entry_id != entry_id:
+                continue
+            coordinator = data["coordinator"]
+            history = coordinator.history
+            if history is None or coordinator.data is None:
+                continue
+            enabled = True
+            index = coordinator.data.index.get(key)
+            if index is None:
+                continue
+
+            columns = call.data.get(ATTR_COLUMNS) or history.columns
+            unknown = [column for column in columns if column not in history.columns]
+            if unknown:
+                raise ServiceValidationError(
+                    f"Columns without history: {', '.join(unknown)}; "
+                    f"available: {', '.join(history.columns)}"
+                )
+            rows.append(
+                {
+                    ATTR_CONFIG_ENTRY_ID: loaded_entry_id,
+                    ATTR_PROXY: proxy,
+                    ATTR_SERVER: server,
+                    ATTR_NODE: node,
+                    ATTR_COLUMNS: {
+                        column: history.query(
+                            index,
+                            column,
+                            call.data.get(ATTR_WINDOW),
+                            call.data[ATTR_STATISTICS],
+                        )
+                        for column in columns
+                    },
+                }
+            )
+
+        if not enabled:
+            raise ServiceValidationError("History is not enabled for any HAProxy entry")
+        return {"rows": rows}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_HISTORY,
+        async_query_history,
+        schema=QUERY_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_set_server_state(call: ServiceCall) -> None:
+        servers = _servers(call)
+        state = call.data[ATTR_STATE]
+        await _async_run_commands(
+            hass,
+            call,
+            [f"set server {proxy}/{server} state {state}" for proxy, server in servers],
+            servers,
+        )
+
+    async def async_set_weight(call: ServiceCall) -> None:
+        servers = _servers(call)
+        weight = call.data[ATTR_WEIGHT]
+        await _async_run_commands(
+            hass,
+            call,
+            [f"set weight {proxy}/{server} {weight}" for proxy, server in servers],
+            servers,
+        )
+
+    async def async_disable_health_check(call: ServiceCall) -> None:
+        servers = _servers(call)
+        await _async_run_commands(
+            hass,
+            call,
+            [f"disable health {proxy}/{server}" for proxy, server in servers],
+            servers,
+        )
+
+    async def async_clear_counters(call: ServiceCall) -> None:
+        command = "clear counters all" if call.data[ATTR_ALL] else "clear counters"
+        await _async_run_commands(hass, call, [command], None)
+
+    for service, handler, schema in (
+        (SERVICE_SET_SERVER_STATE, async_set_server_state, SET_SERVER_STATE_SCHEMA),
+        (SERVICE_SET_WEIGHT, async_set_weight, SET_WEIGHT_SCHEMA),
+        (
+            SERVICE_DISABLE_HEALTH_CHECK,
+            async_disable_health_check,
+            DISABLE_HEALTH_CHECK_SCHEMA,
+        ),
+        (SERVICE_CLEAR_COUNTERS, async_clear_counters, CLEAR_COUNTERS_SCHEMA),
+    ):
+        hass.services.async_register(DOMAIN, service, handler, schema=schema)
@@ -0,0 +1,601 @@
+from __future__ import annotations
+
+import base64
+import math
+import sys
+import time
+import zlib
+from array import array
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from .const import (
+    BACKEND_AGGREGATE_COLUMNS,
+    DERIVED_RATE_COLUMNS,
+    NUMERIC_STAT_COLUMNS,
+    RUNTIME_PATCH_COLUMNS,
+)
+
+MISSING = -1
+
+AGGREGATE_MAX_COLUMNS = frozenset(
+    {"smax", "qmax", "qtime", "ctime", "rtime", "ttime", "check_duration", "lastchg"}
+)
+
+
+def _parse_number(raw: str) -> int:
+    if not raw:
+        return MISSING
+    try:
+        return int(raw)
+    except ValueError:
+        try:
+            return int(float(raw))
+        except ValueError:
+            return MISSING
+
+
+def _encode(values: array | bytearray) -> str:
+    return base64.b64encode(zlib.compress(values, 1)).decode("ascii")
+
+
+def _decode(typecode: str, raw: str, size: int, swap: bool) -> array:
+    values = array(typecode)
+    values.frombytes(zlib.decompress(base64.b64decode(raw)))
+    if swap:
+        values.byteswap()
+    if len(values) != size:
+        raise ValueError(f"Stored column has {len(values)} rows, expected {size}")
+    return values
+
+
+def _status_rank(status: str) -> int:
+    if status.startswith(("UP", "OPEN")):
+        return 2
+    return 1 if status else 0
+
+
+def server_state(status: str) -> str:
+    status = status.upper()
+    if status.startswith("MAINT"):
+        return "maint"
+    if status.startswith(("DRAIN", "NOLB")):
+        return "drain"
+    if status.startswith(("UP", "NO CHECK")):
+        return "up"
+    return "down"
+
+
+def _merge_numbers(
+    totals: list[int],
+    numbers: list[int],
+    modes: tuple[bool, ...],
+) -> None:
+    for position, (total, number, use_max) in enumerate(zip(totals, numbers, modes)):
+        if number == MISSING:
+            continue
+        if total == MISSING:
+            totals[position] = number
+        elif use_max:
+            totals[position] = max(total, number)
+        else:
+            totals[position] = total + number
+
+
+class HAProxyStatsSnapshot:
+    __slots__ = (
+        "keys",
+        "index",
+        "pxname",
+        "svname",
+        "node",
+        "status",
+        "present",
+        "free",
+        "values",
+        "derived",
+        "groups",
+        "timestamp",
+    )
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.index: dict[str, int] = {}
+        self.pxname: list[str] = []
+        self.svname: list[str] = []
+        self.node: list[str] = []
+        self.status: list[str] = []
+        self.present = bytearray()
+        self.free: list[int] = []
+        self.values: dict[str, array] = {
+            column: array("q") for column in NUMERIC_STAT_COLUMNS
+        }
+        self.derived: dict[str, array] = {}
+        self.groups: dict[int, tuple[int, ...]] = {}
+        self.timestamp = 0.0
+
+    @classmethod
+    def from_rows(
+        cls,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[str]],
+        previous: HAProxyStatsSnapshot | None = None,
+        timestamp: float | None = None,
+    ) -> HAProxyStatsSnapshot:
+        return cls.from_nodes(columns, {"": rows}, previous, timestamp)
+
+    @classmethod
+    def from_nodes(
+        cls,
+        columns: Sequence[str],
+        nodes: Mapping[str, Iterable[Sequence[str]]],
+        previous: HAProxyStatsSnapshot | None = None,
+        timestamp: float | None = None,
+        aggregate_nodes: Sequence[str] = (),
+    ) -> HAProxyStatsSnapshot:
+        snapshot = cls()
+        snapshot.timestamp = time.time() if timestamp is None else timestamp
+        if previous is not None:
+            size = len(previous.keys)
+            snapshot.keys = list(previous.keys)
+            snapshot.index = dict(previous.index)
+            snapshot.pxname = list(previous.pxname)
+            snapshot.svname = list(previous.svname)
+            snapshot.node = list(previous.node)
+            snapshot.status = [""] * size
+            snapshot.present = bytearray(size)
+            snapshot.free = list(previous.free)
+            for values in snapshot.values.values():
+                values.extend(array("q", [MISSING]) * size)
+
+        positions = {column: index for index, column in enumerate(columns)}
+        pxname_pos = positions["pxname"]
+        svname_pos = positions["svname"]
+        status_pos = positions.get("status")
+        numeric_pos = [positions.get(column) for column in snapshot.values]
+        modes = tuple(column in AGGREGATE_MAX_COLUMNS for column in snapshot.values)
+
+        aggregate = len(aggregate_nodes or nodes) > 1
+        complete = all(node in nodes for node in aggregate_nodes)
+        totals: dict[str, tuple[str, str, list[str], list[int]]] = {}
+
+        for node, rows in nodes.items():
+            suffix = f"@{node}" if aggregate else ""
+            for row in rows:
+                pxname = row[pxname_pos]
+                svname = row[svname_pos]
+                status = row[status_pos] if status_pos is not None else ""
+                numbers = [
+                    _parse_number(row[position]) if position is not None else MISSING
+                    for position in numeric_pos
+                ]
+                key = f"{pxname}:{svname}"
+                snapshot._set_row(
+                    key + suffix,
+                    pxname,
+                    svname,
+                    node if aggregate else "",
+                    status,
+                    numbers,
+                )
+                if not aggregate or not complete:
+                    continue
+
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = (pxname, svname, [status], list(numbers))
+                else:
+                    total[2].append(status)
+                    _merge_numbers(total[3], numbers, modes)
+
+        for key, (pxname, svname, statuses, numbers) in totals.items():
+            status = max(statuses, key=_status_rank)
+            snapshot._set_row(key, pxname, svname, "", status, numbers)
+
+        return snapshot
+
+    def _set_row(
+        self,
+        key: str,
+        pxname: str,
+        svname: str,
+        node: str,
+        status: str,
+        numbers: list[int],
+    ) -> None:
+        index = self.index.get(key)
+        if index is None:
+            if self.free:
+                index = self.free.pop()
+                self.keys[index] = key
+                self.pxname[index] = pxname
+                self.svname[index] = svname
+                self.node[index] = node
+            else:
+                index = len(self.keys)
+                self.keys.append(key)
+                self.pxname.append(pxname)
+                self.svname.append(svname)
+                self.node.append(node)
+                self.status.append("")
+                self.present.append(0)
+                for values in self.values.values():
+                    values.append(MISSING)
+            self.index[key] = index
+
+        self.present[index] = 1
+        self.status[index] = status
+        for values, number in zip(self.values.values(), numbers):
+            values[index] = number
+
+    def copy(self) -> HAProxyStatsSnapshot:
+        snapshot = HAProxyStatsSnapshot()
+        snapshot.keys = list(self.keys)
+        snapshot.index = dict(self.index)
+        snapshot.pxname = list(self.pxname)
+        snapshot.svname = list(self.svname)
+        snapshot.node = list(self.node)
+        snapshot.status = list(self.status)
+        snapshot.present = bytearray(self.present)
+        snapshot.free = list(self.free)
+        snapshot.values = {column: array("q", values) for column, values in self.values.items()}
+        snapshot.derived = {column: array("d", values) for column, values in self.derived.items()}
+        snapshot.groups = self.groups
+        snapshot.timestamp = self.timestamp
+        return snapshot
+
+    def release_rows(self, indices: Iterable[int]) -> None:
+        for index in indices:
+            key = self.keys[index]
+            if not key or self.present[index]:
+                continue
+            del self.index[key]
+            self.keys[index] = ""
+            self.pxname[index] = ""
+            self.svname[index] = ""
+            self.node[index] = ""
+            self.status[index] = ""
+            for values in self.values.values():
+                values[index] = MISSING
+            for derived in self.derived.values():
+                derived[index] = math.nan
+            self.free.append(index)
+
+    def patch_rows(
+        self,
+        columns: Sequence[str],
+        nodes: Mapping[str, Iterable[Sequence[str]]],
+        aggregate_nodes: Sequence[str] = (),
+    ) -> set[int]:
+        positions = {column: index for index, column in enumerate(columns)}
+        pxname_pos = positions["pxname"]
+        svname_pos = positions["svname"]
+        status_pos = positions.get("status")
+        patch_columns = [column for column in RUNTIME_PATCH_COLUMNS if column in self.values]
+        patch_pos = [positions.get(column) for column in patch_columns]
+        aggregate = len(aggregate_nodes) > 1
+        patched: set[int] = set()
+        totals: set[str] = set()
+
+        for node, rows in nodes.items():
+            suffix = f"@{node}" if aggregate else ""
+            for row in rows:
+                key = f"{row[pxname_pos]}:{row[svname_pos]}"
+                index = self.index.get(key + suffix)
+                if index is None or not self.present[index]:
+                    continue
+                self.status[index] = row[status_pos] if status_pos is not None else ""
+                for column, position in zip(patch_columns, patch_pos):
+                    self.values[column][index] = (
+                        _parse_number(row[position]) if position is not None else MISSING
+                    )
+                patched.add(index)
+                if aggregate:
+                    totals.add(key)
+
+        modes = tuple(column in AGGREGATE_MAX_COLUMNS for column in patch_columns)
+        for key in totals:
+            index = self.index.get(key)
+            if index is None:
+                continue
+            statuses: list[str] = []
+            numbers: list[int] | None = None
+            for node in aggregate_nodes:
+                node_index = self.index.get(f"{key}@{node}")
+                if node_index is None or not self.present[node_index]:
+                    continue
+                statuses.append(self.status[node_index])
+                row_numbers = [self.values[column][node_index] for column in patch_columns]
+                if numbers is None:
+                    numbers = row_numbers
+                else:
+                    _merge_numbers(numbers, row_numbers, modes)
+            if numbers is None:
+                continue
+            self.status[index] = max(statuses, key=_status_rank)
+            for column, number in zip(patch_columns, numbers):
+                self.values[column][index] = number
+            patched.add(index)
+        return patched
+
+    def patch_status(
+        self,
+        pxname: str,
+        svname: str,
+        status: str,
+        node: str = "",
+        aggregate_nodes: Sequence[str] = (),
+        replace: Collection[str] | None = None,
+    ) -> set[int]:
+        key = f"{pxname}:{svname}"
+        aggregate = len(aggregate_nodes) > 1
+        index = self.index.get(f"{key}@{node}" if aggregate else key)
+        if index is None or not self.present[index]:
+            return set()
+        if self.status[index] == status:
+            return set()
+        if replace is not None and self.status[index] not in replace:
+            return set()
+        self.status[index] = status
+        patched = {index}
+
+        total = self.index.get(key) if aggregate else None
+        if total is not None and self.present[total]:
+            statuses = [
+                self.status[node_index]
+                for node_index in (self.index.get(f"{key}@{name}") for name in aggregate_nodes)
+                if node_index is not None and self.present[node_index]
+            ]
+            status = max(statuses, key=_status_rank)
+            if self.status[total] != status:
+                self.status[total] = status
+                patched.add(total)
+        return patched
+
+    def as_storage(self) -> dict[str, Any]:
+        return {
+            "byteorder": sys.byteorder,
+            "timestamp": self.timestamp,
+            "keys": self.keys,
+            "pxname": self.pxname,
+            "svname": self.svname,
+            "node": self.node,
+            "status": self.status,
+            "present": _encode(self.present),
+            "values": {column: _encode(values) for column, values in self.values.items()},
+            "derived": {column: _encode(values) for column, values in self.derived.items()},
+        }
+
+    @classmethod
+    def from_storage(cls, data: Mapping[str, Any]) -> HAProxyStatsSnapshot:
+        snapshot = cls()
+        size = len(data["keys"])
+        swap = data["byteorder"] != sys.byteorder
+        snapshot.timestamp = float(data["timestamp"])
+        snapshot.keys = list(data["keys"])
+        snapshot.index = {key: index for index, key in enumerate(snapshot.keys) if key}
+        snapshot.free = [index for index, key in enumerate(snapshot.keys) if not key]
+        for name in ("pxname", "svname", "node", "status"):
+            column = list(data[name])
+            if len(column) != size:
+                raise ValueError(f"Stored {name} has {len(column)} rows, expected {size}")
+            setattr(snapshot, name, column)
+        snapshot.present = bytearray(zlib.decompress(base64.b64decode(data["present"])))
+        if len(snapshot.present) != size:
+            raise ValueError("Stored row flags do not match the row count")
+
+        stored = data["values"]
+        for column in snapshot.values:
+            if column in stored:
+                snapshot.values[column] = _decode("q", stored[column], size, swap)
+            else:
+                snapshot.values[column] = array("q", [MISSING]) * size
+        snapshot.derived = {
+            column: _decode("d", raw, size, swap) for column, raw in data["derived"].items()
+        }
+        snapshot.group_backends(None)
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: object) -> bool:
+        index = self.index.get(key)  # type: ignore[arg-type]
+        return index is not None and bool(self.present[index])
+
+    def rows(self) -> Iterator[int]:
+        return (index for index, present in enumerate(self.present) if present)
+
+    def value(self, index: int, column: str) -> int | float | None:
+        if not self.present[index]:
+            return None
+        values = self.values.get(column)
+        if values is not None:
+            value = values[index]
+            return None if value == MISSING else value
+        derived = self.derived.get(column)
+        if derived is None:
+            return None
+        number = derived[index]
+        return None if math.isnan(number) else number
+
+    def derive_rates(
+        self,
+        previous: HAProxyStatsSnapshot | None,
+        smoothing: float = 0.0,
+    ) -> None:
+        size = len(self.keys)
+        for name in DERIVED_RATE_COLUMNS:
+            self.derived[name] = array("d", [math.nan]) * size
+        if previous is None:
+            return
+        elapsed = self.timestamp - previous.timestamp
+        if elapsed <= 0:
+            return
+
+        sources = [
+            (
+                self.derived[name],
+                previous.derived.get(name) or array("d", [math.nan]) * len(previous.keys),
+                [(self.values[column], previous.values[column]) for column in columns],
+            )
+            for name, columns in DERIVED_RATE_COLUMNS.items()
+        ]
+        present = self.present
+        previous_present = previous.present
+
+        for index in range(len(previous.keys)):
+            if not present[index] or not previous_present[index]:
+                continue
+            for rates, previous_rates, pairs in sources:
+                last = previous_rates[index]
+                delta = 0
+                counted = False
+                reset = False
+                for values, previous_values in pairs:
+                    new = values[index]
+                    old = previous_values[index]
+                    if new == MISSING or old == MISSING:
+                        continue
+                    if new < old:
+                        reset = True
+                        break
+                    delta += new - old
+                    counted = True
+
+                if reset:
+                    rates[index] = last
+                elif counted:
+                    rate = delta / elapsed
+                    if smoothing and not math.isnan(last):
+                        rate = smoothing * last + (1 - smoothing) * rate
+                    rates[index] = rate
+
+    def group_backends(self, previous: HAProxyStatsSnapshot | None) -> None:
+        if (
+            previous is not None
+            and len(previous.keys) == len(self.keys)
+            and previous.present == self.present
+        ):
+            self.groups = previous.groups
+            return
+
+        backends: dict[tuple[str, str], int] = {}
+        servers: dict[tuple[str, str], list[int]] = {}
+        for index in self.rows():
+            group = (self.pxname[index], self.node[index])
+            svname = self.svname[index]
+            if svname == "BACKEND":
+                backends[group] = index
+            elif svname not in ("FRONTEND", "LISTENER"):
+                servers.setdefault(group, []).append(index)
+
+        self.groups = {
+            index: tuple(servers.get(group, ())) for group, index in backends.items()
+        }
+
+    def aggregate_backends(self, partial: Callable[[str], bool] | None = None) -> None:
+        size = len(self.keys)
+        columns = {
+            name: array("d", [math.nan]) * size for name in BACKEND_AGGREGATE_COLUMNS
+        }
+        self.derived.update(columns)
+        weights = self.values["weight"]
+        backup = self.values["bck"]
+        queues = self.values["qcur"]
+
+        for backend, servers in self.groups.items():
+            if partial is not None and partial(self.pxname[backend]):
+                continue
+            counts = {"up": 0, "down": 0, "maint": 0, "drain": 0}
+            active_up = 0
+            backup_up = 0
+            weight_up = 0
+            weight_total = 0
+            queue = max(queues[backend], 0)
+            for index in servers:
+                state = server_state(self.status[index])
+                counts[state] += 1
+                queue += max(queues[index], 0)
+                is_backup = backup[index] > 0
+                if not is_backup:
+                    weight_total += max(weights[index], 0)
+                if state != "up":
+                    continue
+                if is_backup:
+                    backup_up += 1
+                else:
+                    active_up += 1
+                    weight_up += max(weights[index], 0)
+
+            columns["servers_up"][backend] = counts["up"]
+            columns["servers_down"][backend] = counts["down"]
+            columns["servers_maint"][backend] = counts["maint"]
+            columns["servers_drain"][backend] = counts["drain"]
+            columns["servers_active"][backend] = active_up
+            columns["servers_backup"][backend] = backup_up
+            columns["queue_total"][backend] = queue
+            if weight_total:
+                columns["capacity"][backend] = weight_up * 100 / weight_total
+            elif servers:
+                columns["capacity"][backend] = 0.0
+
+    def changes(self, previous: HAProxyStatsSnapshot | None) -> set[tuple[int, str]]:
+        size = len(previous.keys) if previous is not None else 0
+        changed: set[tuple[int, str]] = set()
+        columns = ("status", *self.values, *self.derived)
+
+        for index in range(size, len(self.keys)):
+            changed.update((index, column) for column in columns)
+        if previous is None:
+            return changed
+
+        if self.present[:size] != previous.present:
+            for index, (new, old) in enumerate(zip(self.present, previous.present)):
+                if new != old:
+                    changed.update((index, column) for column in columns)
+
+        if self.status[:size] != previous.status:
+            changed.update(
+                (index, "status")
+                for index, (new, old) in enumerate(zip(self.status, previous.status))
+                if new != old
+            )
+
+        for column, values in self.values.items():
+            old_values = previous.values[column]
+            if values[:size] == old_values:
+                continue
+            changed.update(
+                (index, column)
+                for index, (new, old) in enumerate(zip(values, old_values))
+                if new != old
+            )
+
+        for column, derived in self.derived.items():
+            old_derived = previous.derived.get(column)
+            if old_derived is None:
+                changed.update((index, column) for index in range(size))
+                continue
+            changed.update(
+                (index, column)
+                for index, (new, old) in enumerate(zip(derived, old_derived))
+                if new != old and not (math.isnan(new) and math.isnan(old))
+            )
+
+        return changed
+
+    def as_dict(self, index: int) -> dict[str, str | int | float | None]:
+        item: dict[str, str | int | float | None] = {
+            "pxname": self.pxname[index],
+            "svname": self.svname[index],
+            "status": self.status[index],
+        }
+        if self.node[index]:
+            item["node"] = self.node[index]
+        for column in (*self.values, *self.derived):
+            item[column] = self.value(index, column)
+        return item
+
+    def as_rows(self) -> list[dict[str, str | int | float | None]]:
+        return [self.as_dict(index) for index in self.rows()]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Callable
+
+from .const import SYSLOG_BIND_HOST, SYSLOG_MAX_MESSAGE_SIZE
+
+SERVER_EVENT_RE = re.compile(r"\bServer (?P<proxy>[^/\s]+)/(?P<server>[^\s,]+),? (?P<text>.*)")
+BACKEND_EVENT_RE = re.compile(r"\b[Bb]ackend (?P<proxy>\S+) has no server available")
+RFC5424_HOSTNAME_RE = re.compile(r"^<\d+>\d+ \S+ (?P<hostname>\S+) ")
+RFC3164_HOSTNAME_RE = re.compile(r"^<\d+>\w{3} [ \d]\d \d\d:\d\d:\d\d (?P<hostname>\S+) ")
+
+
+def parse_log_event(message: str) -> tuple[str, str, str] | None:
+    match = SERVER_EVENT_RE.search(message)
+    if match is None:
+        match = BACKEND_EVENT_RE.search(message)
+        if match is None:
+            return None
+        return match["proxy"], "BACKEND", "DOWN"
+
+    lowered = match["text"].partition(", reason:")[0].lower()
+    if "leaving" not in lowered and "maintenance" in lowered:
+        status = "MAINT"
+    elif "leaving" not in lowered and "drain" in lowered:
+        status = "DRAIN"
+    elif lowered.startswith(("is down", "is going down")):
+        status = "DOWN"
+    elif lowered.startswith("is up"):
+        status = "UP"
+    else:
+        return None
+    return match["proxy"], match["server"], status
+
+
+def log_hostname(message: str) -> str | None:
+    match = RFC5424_HOSTNAME_RE.match(message) or RFC3164_HOSTNAME_RE.match(message)
+    return match["hostname"] if match is not None else None
+
+
+async def _async_read_frame(reader: asyncio.StreamReader) -> bytes | None:
+    try:
+        head = await reader.readexactly(1)
+    except asyncio.IncompleteReadError:
+        return None
+    if not head.isdigit():
+        return head + await reader.readline()
+
+    length = head + await reader.readuntil(b" ")
+    size = int(length[:-1])
+    if size > SYSLOG_MAX_MESSAGE_SIZE:
+        raise ValueError(f"Syslog frame of {size} bytes exceeds the limit")
+    return await reader.readexactly(size)
+
+
+class _SyslogDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, listener: HAProxySyslogListener) -> None:
+        self._listener = listener
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._listener.receive(data, addr[0])
+
+
+class HAProxySyslogListener:
+    def __init__(
+        self,
+        port: int,
+        handler: Callable[[str, str], None],
+        host: str = SYSLOG_BIND_HOST,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.received = 0
+        self.errors = 0
+        self._handler = handler
+        self._datagram: asyncio.DatagramTransport | None = None
+        self._server: asyncio.Server | None = None
+        self._streams: set[asyncio.StreamWriter] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._datagram is not None
+
+    async def async_start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._datagram, _ = await loop.create_datagram_endpoint(
+            lambda: _SyslogDatagramProtocol(self),
+            local_addr=(self.host, self.port),
+        )
+        try:
+            self._server = await asyncio.start_server(
+                self._async_handle_stream, self.host, self.port
+            )
+        except BaseException:
+            await self.async_stop()
+            raise
+
+    async def async_stop(self) -> None:
+        datagram = self._datagram
+        server = self._server
+        self._datagram = None
+        self._server = None
+        if datagram is not None:
+            datagram.close()
+        if server is not None:
+            server.close()
+        for writer in list(self._streams):
+            writer.close()
+        if server is not None:
+            await server.wait_closed()
+
+    def receive(self, data: bytes, peer: str) -> None:
+        message = data.decode("utf-8", "replace").strip()
+        if not message:
+            return
+        self.received += 1
+        self._handler(message, peer)
+
+    async def _async_handle_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peername = writer.get_extra_info("peername")
+        peer = peername[0] if isinstance(peername, tuple) else ""
+        self._streams.add(writer)
+        try:
+            while (frame := await _async_read_frame(reader)) is not None:
+                self.receive(frame, peer)
+        except (
+            ConnectionError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            ValueError,
+        ):
+            self.errors += 1
+        finally:
+            self._streams.discard(writer)
+            writer.close()
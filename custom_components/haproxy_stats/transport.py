@@ -0,0 +1,723 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from urllib.parse import urlsplit
+
+from types import SimpleNamespace
+
+from aiohttp import (
+    BasicAuth,
+    ClientResponse,
+    ClientSession,
+    ServerDisconnectedError,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsResolveHostEndParams,
+    TraceDnsResolveHostStartParams,
+    hdrs,
+)
+from yarl import URL
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PASSWORD,
+    CONF_ROW_TYPES,
+    CONF_SCAN_INTERVAL,
+    CONF_SKIP_MAINT_SERVERS,
+    CONF_SOCKET,
+    CONF_TRANSPORT,
+    CONF_URL,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SKIP_MAINT_SERVERS,
+    DEFAULT_SOCKET,
+    DEFAULT_TRANSPORT,
+    DEFAULT_VERIFY_SSL,
+    HTTP_KEEPALIVE_MARGIN,
+    HTTP_KEEPALIVE_MAX,
+    HTTP_POOL_SIZE,
+    ROW_TYPE_BACKEND,
+    ROW_TYPE_SERVER,
+    ROW_TYPES,
+    RUNTIME_BATCH_MAX_LENGTH,
+    STAT_OBJECT_TYPES,
+    STATS_CHUNK_SIZE,
+    TRANSPORT_PROMETHEUS,
+    TRANSPORT_SOCKET,
+)
+from .filters import RowMatcher
+from .info import parse_prometheus_info, parse_show_info, parse_stats_page
+from .parser import (
+    HAProxyCsvParser,
+    HAProxyPrometheusParser,
+    HAProxyTypedParser,
+    RowFilter,
+    _LineParser,
+)
+from .workers import ParseJob, ParseWorker
+
+SOCKET_PROMPT = b"\n> "
+STATS_SCOPE_MAX_LENGTH = 32
+SCOPE_NAME_RE = re.compile(r"[A-Za-z0-9_.:-]+")
+INFO_SCOPE = "~"
+PROMETHEUS_INFO_SCOPE = "global"
+
+
+class HAProxyTransportError(Exception):
+    pass
+
+
+class HAProxyHttpTransport:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        url: str,
+        columns: Iterable[str],
+        username: str | None = None,
+        password: str | None = None,
+        verify_ssl: bool = DEFAULT_VERIFY_SSL,
+        proxies: Iterable[str] = (),
+        row_filter: RowFilter | None = None,
+        keepalive_timeout: float = DEFAULT_SCAN_INTERVAL + HTTP_KEEPALIVE_MARGIN,
+        worker: ParseWorker | None = None,
+    ) -> None:
+        self._hass = hass
+        self._url = url
+        self._request_url = URL(self._stats_url(url, tuple(proxies)), encoded=True)
+        self._info_url = URL(self._info_page_url(url), encoded=True)
+        self._https = self._request_url.scheme == "https"
+        self._verify_ssl = verify_ssl
+        self._keepalive_timeout = keepalive_timeout
+        self._headers = {hdrs.ACCEPT_ENCODING: "gzip, deflate"}
+        if username or password:
+            self._headers[hdrs.AUTHORIZATION] = BasicAuth(
+                username or "", password or ""
+            ).encode()
+        self._session: ClientSession | None = None
+        self._unsub_close: CALLBACK_TYPE | None = None
+        self._parser = self._create_parser(columns, row_filter)
+        self._worker = worker
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._last_rows: list[tuple[str, ...]] | None = None
+        self._trace: dict[str, float] = {}
+        self.timings: dict[str, float] = {}
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.handshakes = 0
+
+    def _stats_url(self, url: str, proxies: Sequence[str]) -> str:
+        return build_stats_url(url, proxies)
+
+    def _info_page_url(self, url: str) -> str:
+        return build_info_url(url)
+
+    def _create_parser(
+        self, columns: Iterable[str], row_filter: RowFilter | None
+    ) -> _LineParser:
+        return HAProxyCsvParser(columns, row_filter)
+
+    def _parse_info(self, page: str) -> dict[str, int | float | str]:
+        return parse_stats_page(page)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._parser.columns
+
+    @property
+    def configuration_url(self) -> str | None:
+        return self._url
+
+    @property
+    def connection_stats(self) -> dict[str, int | float]:
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "tls_handshakes": self.handshakes,
+            "keepalive_timeout": self._keepalive_timeout,
+        }
+
+    def _async_get_session(self) -> ClientSession:
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        if self._verify_ssl:
+            ssl_context = ssl_util.get_default_context()
+        else:
+            ssl_context = ssl_util.get_default_no_verify_context()
+        connector = TCPConnector(
+            ssl=ssl_context,
+            limit=HTTP_POOL_SIZE,
+            limit_per_host=HTTP_POOL_SIZE,
+            keepalive_timeout=self._keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        self._session = ClientSession(
+            connector=connector,
+            trace_configs=[self._trace_config()],
+        )
+        if self._unsub_close is None:
+            self._unsub_close = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_on_close
+            )
+        return self._session
+
+    def _trace_config(self) -> TraceConfig:
+        trace_config = TraceConfig()
+        trace_config.on_dns_resolvehost_start.append(self._on_dns_start)
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_end)
+        trace_config.on_connection_create_start.append(self._on_connect_start)
+        trace_config.on_connection_create_end.append(self._on_connect_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        return trace_config
+
+    async def _on_dns_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceDnsResolveHostStartParams,
+    ) -> None:
+        context.dns_start = time.perf_counter()
+
+    async def _on_dns_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceDnsResolveHostEndParams,
+    ) -> None:
+        self._trace["dns"] = time.perf_counter() - context.dns_start
+
+    async def _on_connect_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateStartParams,
+    ) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def _on_connect_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        self._trace["connect"] = time.perf_counter() - context.connect_start
+        self.connections_created += 1
+        if self._https:
+            self.handshakes += 1
+
+    async def _on_connection_reused(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        self._trace["connect"] = 0.0
+        self.connections_reused += 1
+
+    async def async_fetch_stats(self) -> list[tuple[str, ...]]:
+        session = self._async_get_session()
+        headers = self._headers
+        if self._last_rows is not None and (self._etag or self._last_modified):
+            headers = dict(headers)
+            if self._etag:
+                headers[hdrs.IF_NONE_MATCH] = self._etag
+            if self._last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+
+        self._trace = {}
+        self.requests += 1
+        job = ParseJob(self._worker, self._parser)
+        started = time.perf_counter()
+        try:
+            response = await self._async_get(session, self._request_url, headers)
+            async with response:
+                headers_at = time.perf_counter()
+                if response.status == 304 and self._last_rows is not None:
+                    self.timings = {
+                        **self._trace,
+                        "ttfb": headers_at - started - self._connect_time(),
+                        "bytes": 0,
+                    }
+                    return self._last_rows
+                if response.status != 200:
+                    raise HAProxyTransportError(f"HTTP status {response.status}")
+                async for chunk in response.content.iter_chunked(STATS_CHUNK_SIZE):
+                    job.feed(chunk)
+                self._etag = response.headers.get(hdrs.ETAG)
+                self._last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+            rows, parse_timings = await job.async_close()
+        except BaseException:
+            job.reset()
+            raise
+
+        self.timings = {
+            **self._trace,
+            **_body_timings(
+                parse_timings,
+                headers_at - started - self._connect_time(),
+                time.perf_counter() - headers_at,
+            ),
+        }
+        self._last_rows = rows if self._etag or self._last_modified else None
+        return rows
+
+    async def async_fetch_info(self) -> dict[str, int | float | str]:
+        session = self._async_get_session()
+        async with await self._async_get(session, self._info_url, self._headers) as response:
+            if response.status != 200:
+                raise HAProxyTransportError(f"HTTP status {response.status}")
+            page = await response.text(errors="replace")
+        return self._parse_info(page)
+
+    async def _async_get(
+        self, session: ClientSession, url: URL, headers: dict[str, str]
+    ) -> ClientResponse:
+        try:
+            return await session.get(url, headers=headers)
+        except ServerDisconnectedError:
+            return await session.get(url, headers=headers)
+
+    def _connect_time(self) -> float:
+        return self._trace.get("dns", 0.0) + self._trace.get("connect", 0.0)
+
+    async def _async_on_close(self, event: Event) -> None:
+        self._unsub_close = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        session = self._session
+        self._session = None
+        if session is not None and not session.closed:
+            await session.close()
+
+
+class HAProxyPrometheusTransport(HAProxyHttpTransport):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        url: str,
+        columns: Iterable[str],
+        scopes: Iterable[str] = ROW_TYPES,
+        skip_maint: bool = DEFAULT_SKIP_MAINT_SERVERS,
+        **kwargs,
+    ) -> None:
+        self._scopes = tuple(scopes)
+        self._skip_maint = skip_maint
+        super().__init__(hass, url, columns, **kwargs)
+
+    def _stats_url(self, url: str, proxies: Sequence[str]) -> str:
+        return build_metrics_url(url, self._scopes, self._skip_maint)
+
+    def _info_page_url(self, url: str) -> str:
+        return build_metrics_url(url, (PROMETHEUS_INFO_SCOPE,))
+
+    def _create_parser(
+        self, columns: Iterable[str], row_filter: RowFilter | None
+    ) -> _LineParser:
+        return HAProxyPrometheusParser(columns, row_filter)
+
+    def _parse_info(self, page: str) -> dict[str, int | float | str]:
+        return parse_prometheus_info(page)
+
+
+class HAProxySocketTransport:
+    def __init__(
+        self,
+        address: str,
+        columns: Iterable[str],
+        proxies: Iterable[str] = (),
+        object_types: int = -1,
+        row_filter: RowFilter | None = None,
+        worker: ParseWorker | None = None,
+    ) -> None:
+        self._address = address
+        self._proxies = tuple(proxies)
+        self._object_types = object_types
+        self._parser = HAProxyTypedParser(columns, row_filter)
+        self._worker = worker
+        self._lock = asyncio.Lock()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._connect_time = 0.0
+        self.timings: dict[str, float] = {}
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._parser.columns
+
+    @property
+    def configuration_url(self) -> str | None:
+        return None
+
+    @property
+    def connection_stats(self) -> dict[str, int | float]:
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+        }
+
+    async def async_fetch_stats(self) -> list[tuple[str, ...]]:
+        types = self._object_types
+        if self._proxies:
+            commands = [f"show stat {proxy} {types} -1 typed" for proxy in self._proxies]
+        elif types != -1:
+            commands = [f"show stat -1 {types} -1 typed"]
+        else:
+            commands = ["show stat typed"]
+
+        first_chunk_at: float | None = None
+        job = ParseJob(self._worker, self._parser)
+
+        def feed(chunk: bytes) -> None:
+            nonlocal first_chunk_at
+            if first_chunk_at is None:
+                first_chunk_at = time.perf_counter()
+            job.feed(chunk)
+
+        self._connect_time = 0.0
+        started = time.perf_counter()
+        try:
+            for command in commands:
+                await self.async_command(command, feed)
+            rows, parse_timings = await job.async_close()
+        except BaseException:
+            job.reset()
+            raise
+
+        finished = time.perf_counter()
+        first_chunk_at = first_chunk_at or finished
+        self.timings = _body_timings(
+            parse_timings,
+            first_chunk_at - started - self._connect_time,
+            finished - first_chunk_at,
+        )
+        self.timings["connect"] = self._connect_time
+        return rows
+
+    async def async_fetch_info(self) -> dict[str, int | float | str]:
+        return parse_show_info(await self.async_command("show info"))
+
+    async def async_fetch_servers(
+        self, servers: Collection[tuple[str, str]]
+    ) -> list[tuple[str, ...]]:
+        wanted = set(servers)
+        proxies = {proxy for proxy, _ in wanted}
+        parser = HAProxyTypedParser(
+            self.columns,
+            lambda pxname, svname: (pxname, svname) in wanted
+            or (svname == "BACKEND" and pxname in proxies),
+        )
+        types = STAT_OBJECT_TYPES[ROW_TYPE_BACKEND] | STAT_OBJECT_TYPES[ROW_TYPE_SERVER]
+        for batch in _command_batches(
+            f"show stat {proxy} {types} -1 typed" for proxy in sorted(proxies)
+        ):
+            await self.async_command(batch, parser.feed)
+        return parser.close()
+
+    async def async_execute(self, commands: Iterable[str]) -> None:
+        errors = []
+        for batch in _command_batches(commands):
+            output = (await self.async_command(batch)).strip()
+            if output:
+                errors.append(output)
+        if errors:
+            raise HAProxyTransportError("\n".join(errors))
+
+    async def async_command(
+        self,
+        command: str,
+        sink: Callable[[bytes], None] | None = None,
+    ) -> str:
+        chunks: list[bytes] = []
+        target = sink or chunks.append
+        delivered = False
+
+        def deliver(chunk: bytes) -> None:
+            nonlocal delivered
+            if chunk:
+                delivered = True
+                target(chunk)
+
+        async with self._lock:
+            for attempt in (1, 2):
+                try:
+                    await self._async_request(command, deliver)
+                    break
+                except ConnectionError:
+                    self._drop_connection()
+                    if attempt == 2 or delivered:
+                        raise
+                except BaseException:
+                    self._drop_connection()
+                    raise
+        return b"".join(chunks).decode("utf-8", "replace")
+
+    async def async_close(self) -> None:
+        async with self._lock:
+            await self._async_disconnect()
+
+    async def _async_request(self, command: str, sink: Callable[[bytes], None]) -> None:
+        reader, writer = await self._async_connect()
+        writer.write(command.encode() + b"\n")
+        await writer.drain()
+        await self._async_read_response(reader, sink)
+
+    async def _async_connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        self.requests += 1
+        if self._reader is not None and self._writer is not None:
+            if not self._writer.is_closing():
+                self.connections_reused += 1
+                return self._reader, self._writer
+            self._drop_connection()
+
+        started = time.perf_counter()
+        if self._address.startswith("/"):
+            reader, writer = await asyncio.open_unix_connection(self._address)
+        else:
+            host, _, port = self._address.rpartition(":")
+            if not host or not port.isdigit():
+                raise HAProxyTransportError(f"Invalid socket address: {self._address}")
+            reader, writer = await asyncio.open_connection(host.strip("[]"), int(port))
+
+        try:
+            writer.write(b"prompt\n")
+            await writer.drain()
+            await self._async_read_response(reader, lambda chunk: None)
+        except BaseException:
+            writer.close()
+            raise
+
+        self._connect_time += time.perf_counter() - started
+        self.connections_created += 1
+        self._reader = reader
+        self._writer = writer
+        return reader, writer
+
+    def _drop_connection(self) -> asyncio.StreamWriter | None:
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is not None:
+            writer.close()
+        return writer
+
+    async def _async_disconnect(self) -> None:
+        writer = self._drop_connection()
+        if writer is None:
+            return
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    @staticmethod
+    async def _async_read_response(
+        reader: asyncio.StreamReader,
+        sink: Callable[[bytes], None],
+    ) -> None:
+        pending = b""
+        keep = len(SOCKET_PROMPT)
+        while True:
+            chunk = await reader.read(STATS_CHUNK_SIZE)
+            if not chunk:
+                raise ConnectionResetError("HAProxy closed the stats socket")
+            pending += chunk
+            if pending.endswith(SOCKET_PROMPT):
+                sink(pending[:-keep])
+                return
+            if len(pending) > keep:
+                sink(pending[:-keep])
+                pending = pending[-keep:]
+
+
+def _body_timings(
+    parser_timings: dict[str, float],
+    ttfb: float,
+    transfer: float,
+) -> dict[str, float]:
+    decode = parser_timings.get("decode", 0.0)
+    parse = parser_timings.get("parse", 0.0)
+    blocking = parser_timings.get("blocking", decode + parse)
+    offload = parser_timings.get("offload")
+    busy = decode + parse if offload is None else blocking + offload
+    timings = {
+        "ttfb": ttfb,
+        "body": max(transfer - busy, 0.0),
+        "decode": decode,
+        "parse": parse,
+        "blocking": blocking,
+        "bytes": parser_timings.get("bytes", 0),
+    }
+    if offload is not None:
+        timings["offload"] = offload
+    return timings
+
+
+def build_stats_url(url: str, proxies: Sequence[str] = ()) -> str:
+    if ";norefresh" not in url:
+        url += ";norefresh"
+    if (
+        len(proxies) == 1
+        and "scope=" not in url
+        and len(proxies[0]) <= STATS_SCOPE_MAX_LENGTH
+        and SCOPE_NAME_RE.fullmatch(proxies[0])
+    ):
+        url += ("&" if "?" in url else "?") + f"scope={proxies[0]}"
+    return url
+
+
+def build_info_url(url: str) -> str:
+    url = re.sub(r";csv(?=;|$|\?)", "", url)
+    if ";norefresh" not in url:
+        url += ";norefresh"
+    return url + ("&" if "?" in url else "?") + f"scope={INFO_SCOPE}"
+
+
+def build_metrics_url(url: str, scopes: Sequence[str] = (), skip_maint: bool = False) -> str:
+    base, _, query = url.partition("?")
+    params = [
+        param
+        for param in query.split("&")
+        if param and not param.startswith("scope=") and param != "no-maint"
+    ]
+    params.extend(f"scope={scope}" for scope in scopes)
+    if skip_maint:
+        params.append("no-maint")
+    return f"{base}?{'&'.join(params)}" if params else base
+
+
+def split_endpoints(value: str) -> list[str]:
+    return [endpoint for endpoint in re.split(r"[\s,]+", value) if endpoint]
+
+
+def _node_name(endpoint: str, taken: Iterable[str] = ()) -> str:
+    name = endpoint
+    if not endpoint.startswith("/"):
+        parts = urlsplit(endpoint)
+        if parts.hostname and parts.port:
+            name = f"{parts.hostname}:{parts.port}"
+        elif parts.hostname:
+            name = parts.hostname
+
+    unique = name
+    count = 1
+    while unique in taken:
+        count += 1
+        unique = f"{name}#{count}"
+    return unique
+
+
+def _command_batches(commands: Iterable[str]) -> Iterator[str]:
+    batch = ""
+    for command in commands:
+        if batch and len(batch) + len(command) + 2 > RUNTIME_BATCH_MAX_LENGTH:
+            yield batch
+            batch = ""
+        batch = f"{batch}; {command}" if batch else command
+    if batch:
+        yield batch
+
+
+def _object_types(row_types: Iterable[str]) -> int:
+    mask = 0
+    for row_type in row_types:
+        mask |= STAT_OBJECT_TYPES.get(row_type, 0)
+    return -1 if mask in (0, sum(STAT_OBJECT_TYPES.values())) else mask
+
+
+def create_transports(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    columns: Iterable[str],
+    matcher: RowMatcher | None = None,
+    worker: ParseWorker | None = None,
+) -> dict[str, HAProxyHttpTransport | HAProxySocketTransport]:
+    columns = tuple(columns)
+    transport = entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    proxies: tuple[str, ...] = ()
+    row_filter: RowFilter | None = None
+    if matcher is not None and not matcher.matches_all:
+        proxies = tuple(sorted(matcher.include_proxies))
+        row_filter = matcher
+    row_types = entry.options.get(CONF_ROW_TYPES, ROW_TYPES)
+    object_types = _object_types(row_types)
+    transports: dict[str, HAProxyHttpTransport | HAProxySocketTransport] = {}
+
+    if transport == TRANSPORT_SOCKET:
+        for address in split_endpoints(entry.data.get(CONF_SOCKET, DEFAULT_SOCKET)):
+            transports[_node_name(address, transports)] = HAProxySocketTransport(
+                address,
+                columns,
+                proxies,
+                object_types,
+                row_filter,
+                worker,
+            )
+        return transports
+
+    verify_ssl = entry.options.get(
+        CONF_VERIFY_SSL,
+        entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+    )
+    interval = float(
+        entry.options.get(
+            CONF_SCAN_INTERVAL,
+            entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        )
+    )
+    if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        interval = max(
+            interval,
+            float(entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)),
+        )
+    options = {
+        "username": entry.data.get(CONF_USERNAME),
+        "password": entry.data.get(CONF_PASSWORD),
+        "verify_ssl": verify_ssl,
+        "proxies": proxies,
+        "row_filter": row_filter,
+        "keepalive_timeout": min(interval + HTTP_KEEPALIVE_MARGIN, HTTP_KEEPALIVE_MAX),
+        "worker": worker,
+    }
+    for url in split_endpoints(entry.data.get(CONF_URL, "")):
+        if transport == TRANSPORT_PROMETHEUS:
+            transports[_node_name(url, transports)] = HAProxyPrometheusTransport(
+                hass,
+                url,
+                columns,
+                scopes=[row_type for row_type in ROW_TYPES if row_type in row_types],
+                skip_maint=entry.options.get(
+                    CONF_SKIP_MAINT_SERVERS, DEFAULT_SKIP_MAINT_SERVERS
+                ),
+                **options,
+            )
+        else:
+            transports[_node_name(url, transports)] = HAProxyHttpTransport(
+                hass, url, columns, **options
+            )
+    return transports
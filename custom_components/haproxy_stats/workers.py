@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_PARSE_MODE,
+    DEFAULT_PARSE_THRESHOLD,
+    PARSE_MODE_EXECUTOR,
+    PARSE_MODE_INLINE,
+    PARSE_MODE_PROCESS,
+)
+from .parser import _LineParser
+
+ParseResult = tuple[list[tuple[str, ...]], dict[str, float]]
+
+
+def parse_chunks(parser: _LineParser, chunks: list[bytes]) -> ParseResult:
+    for chunk in chunks:
+        parser.feed(chunk)
+    rows = parser.close()
+    return rows, parser.timings
+
+
+class ParseJob:
+    __slots__ = ("_worker", "_parser", "_chunks", "_size", "_blocking")
+
+    def __init__(self, worker: ParseWorker | None, parser: _LineParser) -> None:
+        self._worker = worker
+        self._parser = parser
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._blocking = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        if self._chunks:
+            self._chunks.append(chunk)
+            return
+
+        worker = self._worker
+        self._size += len(chunk)
+        if worker is not None and worker.offloads and self._size > worker.threshold:
+            self._chunks.append(chunk)
+            return
+
+        started = time.perf_counter()
+        self._parser.feed(chunk)
+        self._blocking += time.perf_counter() - started
+
+    async def async_close(self) -> ParseResult:
+        chunks = self._chunks
+        self._chunks = []
+        if chunks and self._worker is not None:
+            started = time.perf_counter()
+            rows, timings = await self._worker.async_parse(self._parser, chunks)
+            return rows, {
+                **timings,
+                "blocking": self._blocking,
+                "offload": time.perf_counter() - started,
+            }
+
+        started = time.perf_counter()
+        rows = self._parser.close()
+        self._blocking += time.perf_counter() - started
+        return rows, {**self._parser.timings, "blocking": self._blocking}
+
+    def reset(self) -> None:
+        self._chunks = []
+        self._parser.reset()
+
+
+class ParseWorker:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        mode: str = DEFAULT_PARSE_MODE,
+        threshold: int = DEFAULT_PARSE_THRESHOLD,
+    ) -> None:
+        self._hass = hass
+        self.mode = mode
+        self.threshold = threshold
+        self._pool: ProcessPoolExecutor | None = None
+        self.offloaded = 0
+
+    @property
+    def offloads(self) -> bool:
+        return self.mode != PARSE_MODE_INLINE
+
+    async def async_parse(self, parser: _LineParser, chunks: list[bytes]) -> ParseResult:
+        self.offloaded += 1
+        if self.mode == PARSE_MODE_PROCESS:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._pool, parse_chunks, parser, chunks
+            )
+            parser.reset()
+            return result
+
+        if self.mode == PARSE_MODE_EXECUTOR:
+            future = self._hass.async_add_executor_job(parse_chunks, parser, chunks)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                while not future.done():
+                    try:
+                        await asyncio.wait((future,))
+                    except asyncio.CancelledError:
+                        pass
+                raise
+
+        return parse_chunks(parser, chunks)
+
+    async def async_close(self) -> None:
+        pool = self._pool
+        self._pool = None
+        if pool is not None:
+            await self._hass.async_add_executor_job(pool.shutdown)
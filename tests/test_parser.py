@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.generate import StatsGenerator, StatsShape, chunks
+from custom_components.haproxy_stats.const import STAT_COLUMNS
+from custom_components.haproxy_stats.parser import (
+    HAProxyCsvParser,
+    HAProxyPrometheusParser,
+    HAProxyTypedParser,
+)
+
+
+@pytest.fixture
+def generator() -> StatsGenerator:
+    return StatsGenerator(StatsShape(frontends=2, backends=3, servers=7, seed=1))
+
+
+def expected_rows(generator: StatsGenerator) -> list[tuple[str, ...]]:
+    positions = {column: index for index, column in enumerate(generator.columns)}
+    return [
+        tuple(row[positions[column]] if column in positions else "" for column in STAT_COLUMNS)
+        for row in generator.rows()
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 1 << 20])
+def test_csv_parser_matches_generated_rows(generator: StatsGenerator, size: int) -> None:
+    parser = HAProxyCsvParser(STAT_COLUMNS)
+    for chunk in chunks(generator.csv(), size):
+        parser.feed(chunk)
+    assert parser.close() == expected_rows(generator)
+    assert parser.timings["bytes"] == len(generator.csv())
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 1 << 20])
+def test_typed_parser_matches_generated_rows(generator: StatsGenerator, size: int) -> None:
+    parser = HAProxyTypedParser(STAT_COLUMNS)
+    for chunk in chunks(generator.typed(), size):
+        parser.feed(chunk)
+    assert parser.close() == expected_rows(generator)
+
+
+def test_csv_parser_with_reduced_columns() -> None:
+    generator = StatsGenerator(StatsShape(frontends=1, backends=1, servers=2, columns=18))
+    rows = HAProxyCsvParser(STAT_COLUMNS).parse(generator.csv().decode())
+    assert rows == expected_rows(generator)
+    assert all(row[STAT_COLUMNS.index("weight")] == "" for row in rows)
+
+
+def test_csv_parser_quoted_fields_and_header_change() -> None:
+    parser = HAProxyCsvParser(("pxname", "svname", "status", "scur"))
+    rows = parser.parse(
+        "# pxname,svname,status,scur\n"
+        'web,"srv,1",UP,5\n'
+        "\n"
+        "# svname,pxname,scur\n"
+        "srv2,web,7\n"
+        ",web,1\n"
+    )
+    assert rows == [("web", "srv,1", "UP", "5"), ("web", "srv2", "", "7")]
+
+
+def test_csv_parser_ignores_rows_before_header() -> None:
+    assert HAProxyCsvParser(STAT_COLUMNS).parse("web,srv,UP\n") == []
+
+
+@pytest.mark.parametrize("parser_class", [HAProxyCsvParser, HAProxyTypedParser])
+def test_row_filter(generator: StatsGenerator, parser_class: type) -> None:
+    parser = parser_class(STAT_COLUMNS, lambda pxname, svname: pxname == "be_1")
+    payload = generator.csv() if parser_class is HAProxyCsvParser else generator.typed()
+    rows = parser.parse(payload.decode())
+    assert rows == [row for row in expected_rows(generator) if row[0] == "be_1"]
+    assert [row[1] for row in rows] == ["BACKEND", "srv_1_0", "srv_1_1"]
+
+
+def test_parser_reuse_after_reset(generator: StatsGenerator) -> None:
+    parser = HAProxyTypedParser(STAT_COLUMNS)
+    parser.feed(generator.typed()[:1000])
+    parser.reset()
+    assert parser.parse(generator.typed().decode()) == expected_rows(generator)
+    generator.advance(churn=1.0)
+    assert parser.parse(generator.typed().decode()) == expected_rows(generator)
+
+
+def test_prometheus_parser() -> None:
+    columns = ("pxname", "svname", "status", "scur", "stot", "rtime", "hrsp_5xx")
+    parser = HAProxyPrometheusParser(columns, lambda pxname, svname: svname != "skip")
+    rows = parser.parse(
+        "# HELP haproxy_frontend_current_sessions Current sessions\n"
+        "# TYPE haproxy_frontend_current_sessions gauge\n"
+        'haproxy_frontend_current_sessions{proxy="web"} 3\n'
+        'haproxy_frontend_status{proxy="web",state="UP"} 1\n'
+        'haproxy_backend_status{proxy="app"} 1\n'
+        'haproxy_backend_sessions_total{proxy="app"} 42\n'
+        'haproxy_backend_response_time_average_seconds{proxy="app"} 0.125\n'
+        'haproxy_backend_http_responses_total{proxy="app",code="5xx"} 9\n'
+        'haproxy_backend_http_responses_total{proxy="app",code="2xx"} 100\n'
+        'haproxy_server_status{proxy="app",server="s1",state="UP"} 0\n'
+        'haproxy_server_status{proxy="app",server="s1",state="MAINT"} 1\n'
+        'haproxy_server_current_sessions{proxy="app",server="s1"} 2\n'
+        'haproxy_server_current_sessions{proxy="app",server="skip"} 2\n'
+        "haproxy_process_uptime_seconds 10\n"
+    )
+    assert sorted(rows) == [
+        ("app", "BACKEND", "UP", "", "42", "125", "9"),
+        ("app", "s1", "MAINT", "2", "", "", ""),
+        ("web", "FRONTEND", "OPEN", "3", "", "", ""),
+    ]
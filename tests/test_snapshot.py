@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.haproxy_stats.const import STAT_COLUMNS
+from custom_components.haproxy_stats.snapshot import HAProxyStatsSnapshot
+
+
+def row(pxname: str, svname: str, status: str = "UP", **values: int) -> tuple[str, ...]:
+    fields = {"pxname": pxname, "svname": svname, "status": status}
+    fields.update((column, str(value)) for column, value in values.items())
+    return tuple(fields.get(column, "") for column in STAT_COLUMNS)
+
+
+def snapshot(
+    rows: list[tuple[str, ...]],
+    previous: HAProxyStatsSnapshot | None = None,
+    timestamp: float = 0.0,
+) -> HAProxyStatsSnapshot:
+    return HAProxyStatsSnapshot.from_rows(STAT_COLUMNS, rows, previous, timestamp)
+
+
+def test_changes_without_previous_reports_every_column() -> None:
+    current = snapshot([row("web", "FRONTEND", scur=1)])
+    changes = current.changes(None)
+    assert (0, "status") in changes
+    assert (0, "scur") in changes
+    assert {index for index, _ in changes} == {0}
+
+
+def test_changes_reports_only_changed_cells() -> None:
+    first = snapshot([row("web", "FRONTEND", "OPEN", scur=1), row("app", "BACKEND", scur=2)])
+    first.derive_rates(None)
+    second = snapshot(
+        [row("web", "FRONTEND", "OPEN", scur=5), row("app", "BACKEND", "DOWN", scur=2)],
+        first,
+        10.0,
+    )
+    second.derive_rates(first)
+    assert second.changes(first) == {(0, "scur"), (1, "status")}
+
+
+def test_changes_reports_added_and_missing_rows() -> None:
+    first = snapshot([row("web", "FRONTEND"), row("app", "BACKEND")])
+    second = snapshot([row("app", "BACKEND"), row("app", "s1")], first, 10.0)
+    changed_rows = {index for index, _ in second.changes(first)}
+    assert changed_rows == {0, 2}
+    assert "web:FRONTEND" not in second
+    assert second.value(0, "scur") is None
+
+
+def test_derive_rates() -> None:
+    first = snapshot([row("app", "BACKEND", stot=100, bin=0, ereq=1, eresp=1)], timestamp=0.0)
+    first.derive_rates(None)
+    assert math.isnan(first.derived["stot_rate"][0])
+    assert first.value(0, "stot_rate") is None
+
+    second = snapshot(
+        [row("app", "BACKEND", stot=150, bin=1000, ereq=3, eresp=2, econ=9)], first, 10.0
+    )
+    second.derive_rates(first)
+    assert second.value(0, "stot_rate") == 5.0
+    assert second.value(0, "bin_rate") == 100.0
+    assert second.value(0, "errors_rate") == 0.3
+    assert second.value(0, "bout_rate") is None
+
+
+def test_derive_rates_keeps_rate_on_counter_reset() -> None:
+    first = snapshot([row("app", "BACKEND", stot=100)], timestamp=0.0)
+    first.derive_rates(None)
+    second = snapshot([row("app", "BACKEND", stot=200)], first, 10.0)
+    second.derive_rates(first)
+    third = snapshot([row("app", "BACKEND", stot=5)], second, 20.0)
+    third.derive_rates(second)
+    assert third.value(0, "stot_rate") == 10.0
+
+
+def test_derive_rates_smoothing() -> None:
+    first = snapshot([row("app", "BACKEND", stot=0)], timestamp=0.0)
+    first.derive_rates(None)
+    second = snapshot([row("app", "BACKEND", stot=100)], first, 10.0)
+    second.derive_rates(first, 0.5)
+    third = snapshot([row("app", "BACKEND", stot=100)], second, 20.0)
+    third.derive_rates(second, 0.5)
+    assert second.value(0, "stot_rate") == 10.0
+    assert third.value(0, "stot_rate") == 5.0
+
+
+def test_derive_rates_ignores_rows_without_history() -> None:
+    first = snapshot([row("app", "BACKEND", stot=100)], timestamp=0.0)
+    first.derive_rates(None)
+    second = snapshot([row("app", "BACKEND", stot=100), row("app", "s1", stot=50)], first, 0.0)
+    second.derive_rates(first)
+    assert second.value(1, "stot_rate") is None
+
+
+def aggregated(rows: list[tuple[str, ...]], partial=None) -> HAProxyStatsSnapshot:
+    current = snapshot(rows)
+    current.group_backends(None)
+    current.aggregate_backends(partial)
+    return current
+
+
+def test_aggregate_backends() -> None:
+    current = aggregated(
+        [
+            row("app", "BACKEND", qcur=1),
+            row("app", "s1", "UP", weight=10, qcur=2),
+            row("app", "s2", "DOWN", weight=30),
+            row("app", "s3", "MAINT", weight=10),
+            row("app", "s4", "DRAIN", weight=0),
+            row("app", "b1", "UP", weight=10, bck=1),
+            row("web", "FRONTEND", "OPEN"),
+        ]
+    )
+    backend = current.index["app:BACKEND"]
+    assert current.groups == {backend: (1, 2, 3, 4, 5)}
+    assert {
+        column: current.value(backend, column)
+        for column in (
+            "servers_up",
+            "servers_down",
+            "servers_maint",
+            "servers_drain",
+            "servers_active",
+            "servers_backup",
+            "queue_total",
+            "capacity",
+        )
+    } == {
+        "servers_up": 2,
+        "servers_down": 1,
+        "servers_maint": 1,
+        "servers_drain": 1,
+        "servers_active": 1,
+        "servers_backup": 1,
+        "queue_total": 3,
+        "capacity": 20.0,
+    }
+    assert current.value(current.index["web:FRONTEND"], "servers_up") is None
+
+
+def test_aggregate_backends_without_weights() -> None:
+    current = aggregated([row("app", "BACKEND"), row("app", "s1", "DOWN", weight=0)])
+    assert current.value(0, "capacity") == 0.0
+    current = aggregated([row("app", "BACKEND")])
+    assert current.value(0, "capacity") is None
+    assert current.value(0, "servers_up") == 0
+
+
+def test_aggregate_backends_skips_partial_backends() -> None:
+    current = aggregated(
+        [row("app", "BACKEND"), row("app", "s1"), row("db", "BACKEND"), row("db", "s1")],
+        lambda pxname: pxname == "db",
+    )
+    assert current.value(current.index["app:BACKEND"], "servers_up") == 1
+    assert current.value(current.index["db:BACKEND"], "servers_up") is None
+
+
+@pytest.mark.parametrize("grouped", [False, True])
+def test_group_backends_follows_present_rows(grouped: bool) -> None:
+    first = snapshot([row("app", "BACKEND"), row("app", "s1"), row("app", "s2")])
+    first.group_backends(None)
+    second = snapshot([row("app", "BACKEND"), row("app", "s2")], first, 10.0)
+    second.group_backends(first if grouped else None)
+    assert second.groups == {0: (2,)}
+
+
+def test_release_rows_reuses_indices() -> None:
+    first = snapshot([row("app", "BACKEND"), row("app", "s1", scur=4)])
+    second = snapshot([row("app", "BACKEND")], first, 10.0)
+    second.derive_rates(first)
+    second.release_rows({1})
+    assert second.keys == ["app:BACKEND", ""]
+    assert "app:s1" not in second.index
+
+    third = snapshot([row("app", "BACKEND"), row("app", "s2", scur=7)], second, 20.0)
+    assert len(third.keys) == 2
+    assert third.index["app:s2"] == 1
+    assert third.value(1, "scur") == 7
+    assert (1, "scur") in third.changes(second)
+
+
+def test_release_rows_keeps_present_rows() -> None:
+    current = snapshot([row("app", "BACKEND")])
+    current.release_rows({0})
+    assert current.index == {"app:BACKEND": 0}
+
+
+def test_storage_round_trip() -> None:
+    first = snapshot([row("app", "BACKEND", scur=3), row("app", "s1")])
+    second = snapshot([row("app", "BACKEND", scur=4)], first, 10.0)
+    second.derive_rates(first)
+    second.release_rows({1})
+    restored = HAProxyStatsSnapshot.from_storage(second.as_storage())
+    assert restored.keys == second.keys
+    assert restored.index == second.index
+    assert restored.free == [1]
+    assert restored.value(0, "scur") == 4
+    assert restored.present == second.present
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.haproxy_stats.const import SYSLOG_MAX_MESSAGE_SIZE
+from custom_components.haproxy_stats.syslog_listener import (
+    _async_read_frame,
+    log_hostname,
+    parse_log_event,
+)
+
+
+@pytest.mark.parametrize(
+    ("message", "event"),
+    [
+        (
+            "<145>Oct 18 12:00:00 lb1 haproxy[12]: Server app/s1 is DOWN, reason: Layer4 "
+            "connection problem, info: \"Connection refused\", check duration: 0ms.",
+            ("app", "s1", "DOWN"),
+        ),
+        ("Server app/s1 is going DOWN for maintenance.", ("app", "s1", "MAINT")),
+        ("Server app/s1 was DOWN and now enters maintenance.", ("app", "s1", "MAINT")),
+        (
+            "Server app/s1 is UP/READY (leaving forced maintenance).",
+            ("app", "s1", "UP"),
+        ),
+        ("Server app/s1 enters drain state.", ("app", "s1", "DRAIN")),
+        (
+            "Server app/s1 is UP, reason: Layer7 check passed, code: 200, check duration: 2ms.",
+            ("app", "s1", "UP"),
+        ),
+        (
+            "Server app/s1 is DOWN, reason: Layer7 wrong status, info: \"maintenance page\".",
+            ("app", "s1", "DOWN"),
+        ),
+        ("backend app has no server available!", ("app", "BACKEND", "DOWN")),
+        ("Proxy web started.", None),
+        ("Server app/s1 changed its IP from 10.0.0.1 to 10.0.0.2.", None),
+    ],
+)
+def test_parse_log_event(message: str, event: tuple[str, str, str] | None) -> None:
+    assert parse_log_event(message) == event
+
+
+@pytest.mark.parametrize(
+    ("message", "hostname"),
+    [
+        ("<145>Oct 18 12:00:00 lb1 haproxy[12]: Proxy web started.", "lb1"),
+        ("<145>Oct  8 12:00:00 lb2 haproxy[12]: Proxy web started.", "lb2"),
+        ("<145>1 2026-10-18T12:00:00Z lb3 haproxy 12 - - Proxy web started.", "lb3"),
+        ("Proxy web started.", None),
+    ],
+)
+def test_log_hostname(message: str, hostname: str | None) -> None:
+    assert log_hostname(message) == hostname
+
+
+def read_frames(data: bytes) -> list[bytes]:
+    async def read() -> list[bytes]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        frames = []
+        while (frame := await _async_read_frame(reader)) is not None:
+            frames.append(frame)
+        return frames
+
+    return asyncio.run(read())
+
+
+def test_read_octet_counted_frames() -> None:
+    assert read_frames(b"5 hello11 hello\nworld") == [b"hello", b"hello\nworld"]
+
+
+def test_read_newline_delimited_frames() -> None:
+    assert read_frames(b"<145>first\n<145>second\n") == [b"<145>first\n", b"<145>second\n"]
+
+
+def test_read_mixed_frames() -> None:
+    assert read_frames(b"<1>a\n3 <2>b\n") == [b"<1>a\n", b"<2>", b"b\n"]
+
+
+def test_read_frame_at_eof() -> None:
+    assert read_frames(b"") == []
+
+
+def test_read_truncated_frame() -> None:
+    with pytest.raises(asyncio.IncompleteReadError):
+        read_frames(b"10 short")
+
+
+def test_read_oversized_frame() -> None:
+    with pytest.raises(ValueError):
+        read_frames(f"{SYSLOG_MAX_MESSAGE_SIZE + 1} x".encode())
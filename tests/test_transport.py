@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generate import StatsGenerator, StatsShape
+from custom_components.haproxy_stats.const import RUNTIME_BATCH_MAX_LENGTH, STAT_COLUMNS
+from custom_components.haproxy_stats.parser import HAProxyCsvParser
+from custom_components.haproxy_stats.transport import (
+    SOCKET_PROMPT,
+    HAProxySocketTransport,
+    HAProxyTransportError,
+    _command_batches,
+)
+
+
+def test_command_batches_joins_commands() -> None:
+    assert list(_command_batches(["a", "b", "c"])) == ["a; b; c"]
+
+
+def test_command_batches_without_commands() -> None:
+    assert list(_command_batches([])) == []
+
+
+def test_command_batches_split_at_limit() -> None:
+    command = "x" * (RUNTIME_BATCH_MAX_LENGTH // 2 - 1)
+    batches = list(_command_batches([command] * 5))
+    assert batches == [f"{command}; {command}"] * 2 + [command]
+    assert all(len(batch) <= RUNTIME_BATCH_MAX_LENGTH for batch in batches)
+
+
+def test_command_batches_keep_oversized_command() -> None:
+    command = "x" * (RUNTIME_BATCH_MAX_LENGTH + 1)
+    assert list(_command_batches(["a", command, "b"])) == ["a", command, "b"]
+
+
+class FakeHAProxy:
+    def __init__(self, generator: StatsGenerator) -> None:
+        self.generator = generator
+        self.commands: list[str] = []
+        self.connections = 0
+        self.close_after_prompt = False
+        self._writers: list[asyncio.StreamWriter] = []
+
+    def drop_connections(self) -> None:
+        for writer in self._writers:
+            writer.close()
+
+    def show_stat(self, proxy: str) -> bytes:
+        typed = self.generator.typed()
+        if proxy in ("typed", "-1"):
+            return typed + b"\n"
+        marker = f".pxname.1:MGP:str:{proxy}\n".encode()
+        return b"".join(
+            block + b"\n\n" for block in typed.split(b"\n\n") if marker in block + b"\n"
+        )
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.append(writer)
+        while line := await reader.readline():
+            command = line.decode().strip()
+            self.commands.append(command)
+            if command == "prompt":
+                writer.write(SOCKET_PROMPT)
+                await writer.drain()
+                continue
+            output = b""
+            for part in command.split("; "):
+                if part.startswith("show stat"):
+                    output += self.show_stat(part.split()[2])
+                elif part == "show info":
+                    output += b"Name: HAProxy\nVersion: 2.8.5\n"
+                elif "missing" in part:
+                    output += b"No such server.\n\n"
+            writer.write(output + SOCKET_PROMPT)
+            await writer.drain()
+        writer.close()
+
+
+def run_with_server(generator: StatsGenerator, path: Path, test) -> FakeHAProxy:
+    haproxy = FakeHAProxy(generator)
+
+    async def main() -> None:
+        server = await asyncio.start_unix_server(haproxy.handle, str(path))
+        transport = HAProxySocketTransport(str(path), STAT_COLUMNS)
+        try:
+            await test(transport, haproxy)
+        finally:
+            await transport.async_close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+    return haproxy
+
+
+@pytest.fixture
+def generator() -> StatsGenerator:
+    return StatsGenerator(StatsShape(frontends=2, backends=5, servers=40, seed=3))
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    return tmp_path / "haproxy.sock"
+
+
+def expected_rows(generator: StatsGenerator) -> list[tuple[str, ...]]:
+    return HAProxyCsvParser(STAT_COLUMNS).parse(generator.csv().decode())
+
+
+def test_socket_fetch_stats(generator: StatsGenerator, socket_path: Path) -> None:
+    async def test(transport: HAProxySocketTransport, haproxy: FakeHAProxy) -> None:
+        assert await transport.async_fetch_stats() == expected_rows(generator)
+        generator.advance(churn=1.0)
+        assert await transport.async_fetch_stats() == expected_rows(generator)
+        assert transport.timings["bytes"] == len(generator.typed()) + 1
+        assert transport.connection_stats == {
+            "requests": 2,
+            "connections_created": 1,
+            "connections_reused": 1,
+        }
+
+    haproxy = run_with_server(generator, socket_path, test)
+    assert haproxy.commands == ["prompt", "show stat typed", "show stat typed"]
+
+
+def test_socket_fetch_info(generator: StatsGenerator, socket_path: Path) -> None:
+    async def test(transport: HAProxySocketTransport, haproxy: FakeHAProxy) -> None:
+        info = await transport.async_fetch_info()
+        assert info["Version"] == "2.8.5"
+
+    run_with_server(generator, socket_path, test)
+
+
+def test_socket_reconnects_after_close(generator: StatsGenerator, socket_path: Path) -> None:
+    async def test(transport: HAProxySocketTransport, haproxy: FakeHAProxy) -> None:
+        await transport.async_fetch_stats()
+        haproxy.drop_connections()
+        await asyncio.sleep(0)
+        assert await transport.async_fetch_stats() == expected_rows(generator)
+        assert haproxy.connections == 2
+
+    run_with_server(generator, socket_path, test)
+
+
+def test_socket_execute_batches_commands(generator: StatsGenerator, socket_path: Path) -> None:
+    async def test(transport: HAProxySocketTransport, haproxy: FakeHAProxy) -> None:
+        await transport.async_execute(["set server app/s1 state drain", "clear counters"])
+        with pytest.raises(HAProxyTransportError, match="No such server"):
+            await transport.async_execute(["set server app/missing state maint"])
+
+    haproxy = run_with_server(generator, socket_path, test)
+    assert haproxy.commands[1:] == [
+        "set server app/s1 state drain; clear counters",
+        "set server app/missing state maint",
+    ]
+
+
+def test_socket_fetch_servers(generator: StatsGenerator, socket_path: Path) -> None:
+    async def test(transport: HAProxySocketTransport, haproxy: FakeHAProxy) -> None:
+        rows = await transport.async_fetch_servers([("be_1", "srv_1_0"), ("be_3", "srv_3_2")])
+        assert [(row[0], row[1]) for row in rows] == [
+            ("be_1", "BACKEND"),
+            ("be_1", "srv_1_0"),
+            ("be_3", "BACKEND"),
+            ("be_3", "srv_3_2"),
+        ]
+
+    haproxy = run_with_server(generator, socket_path, test)
+    assert haproxy.commands[1] == "show stat be_1 6 -1 typed; show stat be_3 6 -1 typed"
+
+
+def test_socket_connection_refused(tmp_path: Path) -> None:
+    async def test() -> None:
+        transport = HAProxySocketTransport(str(tmp_path / "missing.sock"), STAT_COLUMNS)
+        with pytest.raises(OSError):
+            await transport.async_fetch_stats()
+
+    asyncio.run(test())